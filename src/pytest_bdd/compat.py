@@ -1,15 +1,76 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import functools
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from importlib.metadata import version
+from typing import Any
 
+from _pytest.config import PytestPluginManager
 from _pytest.fixtures import FixtureDef, FixtureManager, FixtureRequest
-from _pytest.nodes import Node
+from _pytest.nodes import Item, Node
 from packaging.version import parse as parse_version
 
 pytest_version = parse_version(version("pytest"))
+pluggy_version = parse_version(version("pluggy"))
+
+# The pytest and pluggy internals pytest-bdd relies on are all accessed here:
+# * `inject_fixture` registers a fixture definition with `FixtureManager._register_fixture` and sets its
+#   `cached_result` since pytest 8.1; before, it edits `FixtureManager._arg2fixturedefs` and the
+#   `_fixture_defs` and `names_closure` of the request.
+# * `observe_fixture_registrations` patches the method of the fixture manager registering the fixture definitions:
+#   `_register_fixture` since pytest 8.1, `parsefactories` before. The returned function restores the method,
+#   and is called at `pytest_unconfigure`.
+# * `detach_item` and `attach_item` move the entries of `SetupState.stack`, and the `cached_result` and
+#   `_finalizers` of the fixture definitions, for pytest 8.1 to 9.x only (`supports_detached_items`).
+# * `is_hookexec_traced` and `get_hookexec` compare the `_inner_hookexec` of the plugin manager with
+#   pluggy's `_multicall`, for pluggy 1.0 and later (the hook calls are considered traced before).
+
+__all__ = [
+    "DetachedItem",
+    "attach_item",
+    "detach_item",
+    "get_hookexec",
+    "getfixturedefs",
+    "inject_fixture",
+    "is_hookexec_traced",
+    "observe_fixture_registrations",
+    "supports_detached_items",
+]
+
+# The concurrent scenarios (see `concurrency`) take their item out of the pytest setup state while they await,
+# along with the values of its function scoped fixtures. This relies on pytest internals, which are the same
+# from pytest 8.1 to 9.x (see tox.ini); the scenarios are run one at a time with the other versions (before 8.1,
+# the injected target fixtures would also be visible to the other tests):
+# * `SetupState.stack`, the finalizers (and setup exception) of the nodes set up, by node;
+# * the finalizer of each fixture executed for an item, `functools.partial(fixturedef.finish, request=...)`,
+#   registered on the item by `FixtureRequest._schedule_finalizers` before pytest 8.3, by `FixtureDef.execute` since;
+# * the `cached_result` and `_finalizers` of the fixture definitions.
+supports_detached_items = (8, 1) <= pytest_version.release < (10,)
+
+# Since pluggy 1.0, a plugin manager executes the hook calls with `_multicall`, unless they are traced or monitored
+# (e.g. `--debug` or `pytester.inline_run`), which replaces its `_inner_hookexec`.
+if pluggy_version.release >= (1, 0):
+    from pluggy._callers import _multicall
+
+    def is_hookexec_traced(hookexec: object) -> bool:
+        """Tell whether the hook calls of a plugin manager are traced or monitored, from its hook executor.
+
+        :param hookexec: The hook executor of the plugin manager, see `get_hookexec`.
+        """
+        return hookexec is not _multicall
+
+else:
+
+    def is_hookexec_traced(hookexec: object) -> bool:
+        """Tell whether the hook calls of a plugin manager may be traced or monitored: always with older pluggy."""
+        return True
+
+
+def get_hookexec(pluginmanager: PytestPluginManager) -> object:
+    """Get the hook executor of a plugin manager, which changes when its hook calls start or stop being traced."""
+    return pluginmanager._inner_hookexec
 
-__all__ = ["getfixturedefs", "inject_fixture"]
 
 if pytest_version.release >= (8, 1):
 
@@ -37,6 +98,25 @@ if pytest_version.release >= (8, 1):
         fixture_def = request._get_active_fixturedef(arg)
         fixture_def.cached_result = (value, None, None)  # type: ignore
 
+    def observe_fixture_registrations(
+        fixturemanager: FixtureManager, callback: Callable[[str | None], None]
+    ) -> Callable[[], None]:
+        """Call the callback every time a fixture definition is registered.
+
+        :param fixturemanager: pytest fixture manager
+        :param callback: function called with the name of the registered fixture
+
+        :return: Function stopping the observation.
+        """
+        register_fixture = fixturemanager._register_fixture
+
+        def _register_fixture(*, name: str, **kwargs: Any) -> None:
+            register_fixture(name=name, **kwargs)
+            callback(name)
+
+        fixturemanager._register_fixture = _register_fixture  # type: ignore[method-assign]
+        return functools.partial(_restore_method, fixturemanager, "_register_fixture", _register_fixture)
+
 else:
 
     def getfixturedefs(
@@ -82,3 +162,81 @@ else:
         request._fixture_defs[arg] = fd
         if add_fixturename:
             request._pyfuncitem._fixtureinfo.names_closure.append(arg)
+
+    def observe_fixture_registrations(
+        fixturemanager: FixtureManager, callback: Callable[[str | None], None]
+    ) -> Callable[[], None]:
+        """Call the callback every time fixture definitions are registered.
+
+        :param fixturemanager: pytest fixture manager
+        :param callback: function called with the name of the registered fixture,
+                         or None when the names are not known (all the names must be checked)
+
+        :return: Function stopping the observation.
+        """
+        parsefactories = fixturemanager.parsefactories
+
+        def _parsefactories(*args: Any, **kwargs: Any) -> None:
+            parsefactories(*args, **kwargs)
+            callback(None)
+
+        fixturemanager.parsefactories = _parsefactories  # type: ignore[method-assign]
+        return functools.partial(_restore_method, fixturemanager, "parsefactories", _parsefactories)
+
+
+def _restore_method(obj: object, name: str, wrapper: Callable[..., object]) -> None:
+    """Remove the wrapper set on an object for one of its methods, unless it was wrapped again since."""
+    if vars(obj).get(name) is wrapper:
+        delattr(obj, name)
+
+
+@dataclass
+class DetachedItem:
+    """The state of an item taken out of the pytest setup state: its setup state entry,
+    and the cached values and finalizers of its function scoped fixtures.
+    """
+
+    setup_state_entry: Any
+    fixture_states: list[tuple[FixtureDef[object], Any, list[Callable[[], object]]]]
+
+
+def detach_item(item: Item) -> DetachedItem | None:
+    """Take an item out of the pytest setup state, with the values of its function scoped fixtures.
+
+    The function scoped fixtures are cached by their fixture definition, so the other items get their own values.
+
+    :param item: The item, set up.
+
+    :return: The state of the item, to be given to `attach_item`, or None if the item is not set up.
+    """
+    setup_state = item.session._setupstate
+    if item not in setup_state.stack:
+        return None
+    setup_state_entry = setup_state.stack.pop(item)
+    finalizers, _ = setup_state_entry
+    # Each fixture executed for the item (even if it failed) is finished by a finalizer of the item
+    fixturedefs = {
+        id(fixturedef): fixturedef
+        for finalizer in finalizers
+        if isinstance(finalizer, functools.partial)
+        and isinstance(fixturedef := getattr(finalizer.func, "__self__", None), FixtureDef)
+        and fixturedef.scope == "function"
+    }
+    fixture_states = []
+    for fixturedef in fixturedefs.values():
+        fixture_states.append((fixturedef, fixturedef.cached_result, list(fixturedef._finalizers)))
+        fixturedef.cached_result = None
+        fixturedef._finalizers.clear()
+    return DetachedItem(setup_state_entry, fixture_states)
+
+
+def attach_item(item: Item, detached_item: DetachedItem) -> None:
+    """Put an item back in the pytest setup state, with its function scoped fixtures.
+
+    :param item: The item.
+    :param detached_item: The state of the item, returned by `detach_item`.
+    """
+    item.session._setupstate.stack[item] = detached_item.setup_state_entry
+    for fixturedef, cached_result, finalizers in detached_item.fixture_states:
+        fixturedef.cached_result = cached_result
+        fixturedef._finalizers[:] = finalizers
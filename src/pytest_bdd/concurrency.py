@@ -0,0 +1,304 @@
+"""Concurrent execution of the scenarios tagged ``@concurrent``.
+
+When the ``bdd_concurrent_scenarios`` ini option is more than 1, the consecutive scenarios of a module
+(or class) tagged ``@concurrent`` are run in waves of at most that many scenarios, on one event loop:
+
+* the scenarios of the wave are set up one after the other, as pytest does;
+* their steps are run concurrently: while a scenario awaits an async step, the other scenarios run;
+* they are reported and torn down one after the other, as pytest does.
+
+pytest only lets one test be set up at a time, so the item of a scenario (with the values of its function
+scoped fixtures) is taken out of the pytest setup state while it awaits its async steps, and put back while
+it runs its synchronous parts (fixtures, hooks, sync steps). Each scenario has its own request and fixture
+values, so the ``target_fixture`` values are not shared. This relies on pytest internals (see
+`compat.detach_item`), so the scenarios are run one at a time with the pytest versions not known to support it.
+
+The waves are run without calling the ``pytest_runtest_protocol`` hook: each of their phases (the setup of a
+scenario, the concurrent steps, the report and teardown of a scenario) runs inside the wrappers of this hook that
+pytest itself implements (assertion explanations, ``faulthandler_timeout``). The scenarios are run one at a time
+when other plugins implement it (e.g. pytest-rerunfailures or pytest-timeout).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Generator, Iterator, Sequence
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, TypeVar, cast
+
+import pytest
+from _pytest._code import ExceptionInfo
+from _pytest.outcomes import Exit
+from _pytest.runner import CallInfo, call_and_report, check_interactive_exception
+from _pytest.warnings import catch_warnings_for_item
+
+from .compat import DetachedItem, attach_item, detach_item, supports_detached_items
+from .event_loop import ScenarioEventLoop, close_event_loop, get_event_loop_factory
+from .scenario import async_scenario_wrapper_registry
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from concurrent.futures import Future
+
+    from _pytest.config import Config
+    from _pytest.main import Session
+    from _pytest.nodes import Item
+
+T = TypeVar("T")
+
+CONCURRENT_TAG = "concurrent"
+
+# The wrappers of `pytest_runtest_protocol` implemented by pytest, run around each phase of the waves
+RUNTEST_PROTOCOL_WRAPPERS = frozenset({"assertion", "faulthandler"})
+# The implementations of `pytest_runtest_protocol` handled by the waves: pytest's protocol itself (`run_wave`),
+# its warnings capture (`catch_warnings`), the wrappers above, and the twisted support of unittest (not scenarios)
+HANDLED_RUNTEST_PROTOCOLS = frozenset({"runner", "warnings", "unittest", *RUNTEST_PROTOCOL_WRAPPERS})
+
+
+def configure(config: Config) -> None:
+    config.addinivalue_line(
+        "markers", f"{CONCURRENT_TAG}: run the scenario concurrently with other scenarios (bdd_concurrent_scenarios)."
+    )
+
+
+def get_max_concurrent_scenarios(config: Config) -> int:
+    """Get the maximum number of scenarios run concurrently, or 1 if the scenarios are run one at a time."""
+    value = config.getini("bdd_concurrent_scenarios")
+    try:
+        max_concurrent_scenarios = int(value)
+    except ValueError:
+        raise pytest.UsageError(f"bdd_concurrent_scenarios must be an integer, got {value!r}") from None
+    if max_concurrent_scenarios < 1:
+        raise pytest.UsageError(f"bdd_concurrent_scenarios must be at least 1, got {max_concurrent_scenarios}")
+
+    if (
+        not supports_detached_items
+        or has_other_runtest_protocols(config)
+        or config.getoption("usepdb", False)
+        or config.getoption("setupshow", False)
+        or config.getoption("setuponly", False)
+        or config.getoption("setupplan", False)
+    ):
+        return 1
+    return max_concurrent_scenarios
+
+
+def has_other_runtest_protocols(config: Config) -> bool:
+    """Tell whether the ``pytest_runtest_protocol`` hook has implementations not handled by the waves."""
+    return any(
+        hookimpl.plugin_name not in HANDLED_RUNTEST_PROTOCOLS
+        or not hookimpl.function.__module__.startswith("_pytest.")
+        or (hookimpl.plugin_name in RUNTEST_PROTOCOL_WRAPPERS and not getattr(hookimpl, "wrapper", False))
+        for hookimpl in config.hook.pytest_runtest_protocol.get_hookimpls()
+    )
+
+
+def is_concurrent(item: Item) -> bool:
+    """Tell whether an item is a scenario that can run concurrently with other scenarios."""
+    return (
+        isinstance(item, pytest.Function)
+        and item.obj in async_scenario_wrapper_registry
+        and item.get_closest_marker(CONCURRENT_TAG) is not None
+    )
+
+
+def runtestloop(session: Session) -> bool | None:
+    """Run the tests like pytest does, except for the concurrent scenarios run in waves.
+
+    :return: True, or None if the scenarios are run one at a time (the default pytest loop runs the tests).
+    """
+    max_concurrent_scenarios = get_max_concurrent_scenarios(session.config)
+    if max_concurrent_scenarios == 1 or session.config.option.collectonly:
+        return None
+
+    if session.testsfailed and not session.config.option.continue_on_collection_errors:
+        raise session.Interrupted(
+            f"{session.testsfailed} error{'s' if session.testsfailed != 1 else ''} during collection"
+        )
+
+    items = session.items
+    i = 0
+    while i < len(items):
+        item = items[i]
+        wave = [item]
+        if is_concurrent(item):
+            while (
+                len(wave) < max_concurrent_scenarios
+                and i + len(wave) < len(items)
+                and items[i + len(wave)].parent is item.parent
+                and is_concurrent(items[i + len(wave)])
+            ):
+                wave.append(items[i + len(wave)])
+        i += len(wave)
+        nextitem = items[i] if i < len(items) else None
+
+        if len(wave) == 1:
+            item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+        else:
+            run_wave(wave, nextitem)
+
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+    return True
+
+
+class ConcurrentScenario(ScenarioEventLoop):
+    """A scenario run concurrently with the other scenarios of its wave, on the event loop of the wave."""
+
+    def __init__(self, item: pytest.Function, loop: AbstractEventLoop) -> None:
+        super().__init__(item._request, loop)
+        self.item = item
+        # The state of the item taken out of pytest while it is detached
+        self.detached_item: DetachedItem | None = None
+        self.start = self.stop = self.duration = 0.0
+
+    def attach(self) -> None:
+        """Put the item back in the pytest setup state, with its function scoped fixtures."""
+        if self.detached_item is not None:
+            attach_item(self.item, self.detached_item)
+            self.detached_item = None
+
+    def detach(self) -> None:
+        """Take the item out of the pytest setup state, so that the other scenarios can use it."""
+        if self.detached_item is None:
+            self.detached_item = detach_item(self.item)
+
+    async def wait(self, awaitable: Awaitable[T]) -> T:
+        """Await an async step, letting the other scenarios of the wave run meanwhile."""
+        __tracebackhide__ = True
+        self.detach()
+        try:
+            return await awaitable
+        finally:
+            self.attach()
+
+    async def wait_futures(self, futures: Sequence[Future[object]]) -> None:
+        """Wait for the step functions run on a thread pool, letting the other scenarios of the wave run meanwhile."""
+        if futures:
+            await self.wait(asyncio.wait([asyncio.wrap_future(future) for future in futures]))
+
+    async def run_scenario(self) -> object:
+        """Run the scenario (the test function)."""
+        __tracebackhide__ = True
+        self.start = time.time()
+        precise_start = time.perf_counter()
+        self.attach()
+        try:
+            funcargs = self.item.funcargs
+            async_scenario_wrapper = async_scenario_wrapper_registry[self.item.obj]
+            return await async_scenario_wrapper(funcargs["request"], funcargs["_pytest_bdd_example"], self)
+        finally:
+            self.detach()
+            self.duration = time.perf_counter() - precise_start
+            self.stop = time.time()
+
+    def get_call_info(self, outcome: object) -> CallInfo[None]:
+        """Get the information of the call of the test function, given its result or exception."""
+        if not isinstance(outcome, BaseException):
+            excinfo = None
+        elif isinstance(outcome, (Exit, KeyboardInterrupt)):
+            raise outcome
+        else:
+            assert outcome.__traceback__ is not None
+            excinfo = ExceptionInfo.from_exc_info((type(outcome), outcome, outcome.__traceback__))
+        return CallInfo(
+            None, excinfo, start=self.start, stop=self.stop, duration=self.duration, when="call", _ispytest=True
+        )
+
+
+def catch_warnings(config: Config, item: Item | None) -> AbstractContextManager[None]:
+    """Capture the warnings like pytest does around each test (unless the warnings plugin is disabled).
+
+    :param item: The item the warnings are attributed to, or None for the concurrent scenarios.
+    """
+    if not config.pluginmanager.has_plugin("warnings"):
+        return contextlib.nullcontext()
+    ihook = config.hook if item is None else item.ihook
+    return catch_warnings_for_item(config=config, ihook=ihook, when="runtest", item=item)
+
+
+@contextlib.contextmanager
+def runtest_protocol_wrappers(item: Item) -> Iterator[None]:
+    """Run the wrappers of ``pytest_runtest_protocol`` implemented by pytest (see `RUNTEST_PROTOCOL_WRAPPERS`).
+
+    :param item: The item given to the wrappers.
+    """
+    with contextlib.ExitStack() as stack:
+        # The last implementations are called first
+        for hookimpl in reversed(item.config.hook.pytest_runtest_protocol.get_hookimpls()):
+            if hookimpl.plugin_name not in RUNTEST_PROTOCOL_WRAPPERS:
+                continue
+            kwargs = {"item": item, "nextitem": None}
+            wrapper = cast(
+                "Generator[None, object, object]",
+                hookimpl.function(*[kwargs[argname] for argname in hookimpl.argnames]),
+            )
+            next(wrapper)
+            # The wrappers restore their state in a `finally` block
+            stack.callback(wrapper.close)
+        yield
+
+
+async def run_scenarios(scenarios: list[ConcurrentScenario]) -> list[object]:
+    """Run scenarios concurrently.
+
+    :return: The result or exception of each scenario.
+    """
+    return await asyncio.gather(*(scenario.run_scenario() for scenario in scenarios), return_exceptions=True)
+
+
+def run_wave(items: list[Item], nextitem: Item | None) -> None:
+    """Run the given scenarios concurrently.
+
+    :param items: Concurrent scenarios, with the same parent.
+    :param nextitem: Item run after them.
+    """
+    loop = get_event_loop_factory(items[0].config)()
+    scenarios = []
+    try:
+        for item in items:
+            assert isinstance(item, pytest.Function)
+            item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+            if not item._request:
+                item._initrequest()
+            scenario = ConcurrentScenario(item, loop)
+            with catch_warnings(item.config, item), runtest_protocol_wrappers(item):
+                setup_report = call_and_report(item, "setup")
+            scenario.detach()
+            scenarios.append((scenario, setup_report.passed))
+
+        running = [scenario for scenario, setup_passed in scenarios if setup_passed]
+        with catch_warnings(items[0].config, None), runtest_protocol_wrappers(items[0]):
+            outcomes = loop.run_until_complete(run_scenarios(running))
+        call_infos = {
+            scenario: scenario.get_call_info(outcome) for scenario, outcome in zip(running, outcomes, strict=True)
+        }
+
+        for i, (scenario, _) in enumerate(scenarios):
+            item = scenario.item
+            scenario.attach()
+            # Keep the parents of the items set up until the last item of the wave is torn down
+            teardown_nextitem = scenarios[i + 1][0].item if i + 1 < len(scenarios) else nextitem
+            if item.session.shouldfail or item.session.shouldstop:
+                teardown_nextitem = None
+
+            with catch_warnings(item.config, item), runtest_protocol_wrappers(item):
+                call_info = call_infos.get(scenario)
+                if call_info is not None:
+                    report = item.ihook.pytest_runtest_makereport(item=item, call=call_info)
+                    item.ihook.pytest_runtest_logreport(report=report)
+                    if check_interactive_exception(call_info, report):
+                        item.ihook.pytest_exception_interact(node=item, call=call_info, report=report)
+                call_and_report(item, "teardown", nextitem=teardown_nextitem)
+            item._request = False  # type: ignore[assignment]
+            item.funcargs = None  # type: ignore[assignment]
+            item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    finally:
+        # Leave the items interrupted by an error to the teardown of the session
+        for scenario, _ in scenarios:
+            scenario.attach()
+        close_event_loop(loop)
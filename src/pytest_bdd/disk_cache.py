@@ -0,0 +1,224 @@
+"""Persistent cache of the parsed feature files.
+
+The parsed features are stored under the pytest cache directory, so the feature files are not parsed
+again in the next runs (nor by every xdist worker) as long as they don't change.
+
+The cache is opt-in (``bdd_feature_cache`` ini option): its entries are pickles, so the cache directory must be
+as trusted as the test code. They are loaded by an unpickler restricted to the classes of the features model.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass
+from functools import cache
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from . import gherkin_parser
+from . import parser as feature_parser
+from .utils import CONFIG_STACK
+
+if TYPE_CHECKING:
+    from _pytest.config import Config
+    from _pytest.config.argparsing import Parser
+
+    from .parser import Feature
+
+CACHE_DIR_NAME = "pytest-bdd-features"
+
+feature_disk_cache_key = pytest.StashKey["FeatureDiskCache"]()
+
+
+def add_options(parser: Parser) -> None:
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Feature cache")
+    group.addoption(
+        "--bdd-cache-clear",
+        action="store_true",
+        dest="bdd_cache_clear",
+        default=False,
+        help="remove the parsed features from the cache at the start of the test run.",
+    )
+
+
+def configure(config: Config) -> None:
+    if not config.getini("bdd_feature_cache"):
+        return
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        # The cacheprovider plugin is disabled
+        return
+    feature_disk_cache = FeatureDiskCache(cache.mkdir(CACHE_DIR_NAME))
+    # Only the controller clears the cache (xdist), the workers could already be using it
+    if config.option.bdd_cache_clear and not hasattr(config, "workerinput"):
+        feature_disk_cache.clear()
+    config.stash[feature_disk_cache_key] = feature_disk_cache
+
+
+def get_feature_disk_cache() -> FeatureDiskCache | None:
+    """Get the feature cache of the current pytest run, if any."""
+    if not CONFIG_STACK:
+        return None
+    return CONFIG_STACK[-1].stash.get(feature_disk_cache_key, None)
+
+
+@cache
+def get_cache_version() -> tuple[object, ...]:
+    """Get the version of the cached data.
+
+    It changes with the pytest-bdd and gherkin versions, and with the layout of the model classes,
+    so the features cached by another version are never loaded.
+    """
+    model_classes = [
+        obj
+        for module in (feature_parser, gherkin_parser)
+        for obj in vars(module).values()
+        if dataclasses.is_dataclass(obj) and isinstance(obj, type) and obj.__module__ == module.__name__
+    ]
+    fields = sorted(
+        (
+            cls.__module__,
+            cls.__qualname__,
+            tuple(field.name for field in dataclasses.fields(cls)),
+            hasattr(cls, "__slots__"),
+        )
+        for cls in model_classes
+    )
+    return version("pytest-bdd"), version("gherkin-official"), pickle.HIGHEST_PROTOCOL, tuple(fields)
+
+
+@dataclass
+class FeatureFileState:
+    """The state of a feature file, used to tell whether it changed since it was parsed."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+class FeatureCacheUnpickler(feature_parser.ModelUnpickler):
+    """Unpickler of the cache entries, which only loads the entries and the classes of the features model."""
+
+    def find_class(self, module_name: str, global_name: str, /) -> Any:
+        if (module_name, global_name) == (__name__, FeatureCacheEntry.__qualname__):
+            return FeatureCacheEntry
+        return super().find_class(module_name, global_name)
+
+
+@dataclass
+class FeatureCacheEntry:
+    """A parsed feature, with the state of the feature file it was parsed from."""
+
+    cache_version: tuple[object, ...]
+    size: int
+    mtime_ns: int
+    digest: str
+    feature: Feature
+
+
+class FeatureDiskCache:
+    """Parsed features stored on disk, one file per feature file and encoding.
+
+    An entry is used if the feature file has the same size and modification time as when it was parsed,
+    or else if its content has the same hash.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _get_entry_path(self, abs_filename: str, encoding: str) -> Path:
+        key = hashlib.sha256(f"{abs_filename}\0{encoding}".encode()).hexdigest()
+        return self.directory / f"{key}.pickle"
+
+    def _load_entry(self, path: Path) -> FeatureCacheEntry | None:
+        try:
+            with open(path, "rb") as f:
+                entry = FeatureCacheUnpickler(f).load()
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+            IndexError,
+            TypeError,
+            ValueError,
+        ):
+            # Missing, corrupted or incompatible entry
+            return None
+        if not isinstance(entry, FeatureCacheEntry) or entry.cache_version != get_cache_version():
+            return None
+        return entry
+
+    def _store_entry(self, path: Path, entry: FeatureCacheEntry) -> None:
+        # Write to a temporary file first, so that the other processes never read a partial entry.
+        # Failing to write the cache is not an error, the feature will be parsed again next time.
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, RecursionError):
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+    def lookup(self, abs_filename: str, encoding: str) -> tuple[Feature | None, FeatureFileState]:
+        """Get the cached feature of a feature file.
+
+        :param abs_filename: Absolute path of the feature file.
+        :param encoding: Feature file encoding.
+
+        :return: The cached feature (or None if it must be parsed), and the state of the feature file,
+                 to be given to `store` along with the parsed feature.
+        """
+        path = self._get_entry_path(abs_filename, encoding)
+        entry = self._load_entry(path)
+
+        stat = os.stat(abs_filename)
+        if entry is not None and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            return entry.feature, FeatureFileState(entry.size, entry.mtime_ns, entry.digest)
+
+        with open(abs_filename, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        state = FeatureFileState(size=stat.st_size, mtime_ns=stat.st_mtime_ns, digest=digest)
+        if entry is None or entry.digest != digest:
+            return None, state
+
+        # Same content, only the modification time changed
+        self.store(abs_filename, encoding, state, entry.feature)
+        return entry.feature, state
+
+    def store(self, abs_filename: str, encoding: str, state: FeatureFileState, feature: Feature) -> None:
+        """Store a parsed feature.
+
+        :param abs_filename: Absolute path of the feature file.
+        :param encoding: Feature file encoding.
+        :param state: State of the feature file before it was parsed, as returned by `lookup`.
+        :param feature: The parsed feature.
+        """
+        entry = FeatureCacheEntry(
+            cache_version=get_cache_version(),
+            size=state.size,
+            mtime_ns=state.mtime_ns,
+            digest=state.digest,
+            feature=feature,
+        )
+        self._store_entry(self._get_entry_path(abs_filename, encoding), entry)
+
+    def clear(self) -> None:
+        """Remove all the cached features."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,188 @@
+"""Event loop running the async step functions of a scenario.
+
+The async steps (``async def`` step functions) of a scenario all run on the same event loop, created by the
+``bdd_event_loop_factory`` function when the first async step of the scenario is executed, and closed when
+the scenario is torn down.
+
+The scenarios are executed by coroutines, which await their async steps with `ScenarioEventLoop.wait`.
+A scenario run by pytest is not on an event loop: its coroutine is driven by `run_sync`, and each awaited step
+is run on the event loop of the scenario until it completes, so the coroutine never suspends. The concurrent
+scenarios (see `concurrency`) run on an event loop, and really await their steps.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import importlib
+import inspect
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import pytest
+from _pytest._code import getfslineno
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from concurrent.futures import Future
+
+    from _pytest.config import Config
+    from _pytest.fixtures import FixtureRequest
+
+T = TypeVar("T")
+
+event_loop_factory_key = pytest.StashKey["Callable[[], AbstractEventLoop]"]()
+
+
+def load_event_loop_factory(path: str) -> Callable[[], AbstractEventLoop]:
+    """Import an event loop factory.
+
+    :param path: Path of the factory, in the form ``module:function`` (e.g. ``uvloop:new_event_loop``).
+
+    :return: The factory.
+    """
+    module_name, _, qualname = path.partition(":")
+    if not module_name or not qualname:
+        raise pytest.UsageError(f"bdd_event_loop_factory must be in the form 'module:function', got {path!r}")
+    try:
+        factory: Any = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            factory = getattr(factory, name)
+    except (ImportError, AttributeError) as e:
+        raise pytest.UsageError(f"bdd_event_loop_factory: cannot import {path!r}: {e}") from e
+    if not callable(factory):
+        raise pytest.UsageError(f"bdd_event_loop_factory: {path!r} is not callable")
+    return cast(Callable[[], "AbstractEventLoop"], factory)
+
+
+def get_event_loop_factory(config: Config) -> Callable[[], AbstractEventLoop]:
+    """Get the event loop factory of the pytest run.
+
+    The factory is imported when the first scenario with async steps is run, so it can be defined
+    in the modules of the test suite.
+    """
+    factory = config.stash.get(event_loop_factory_key, None)
+    if factory is None:
+        factory_path = config.getini("bdd_event_loop_factory")
+        if factory_path:
+            factory = load_event_loop_factory(factory_path)
+        else:
+            factory = asyncio.new_event_loop
+        config.stash[event_loop_factory_key] = factory
+    return factory
+
+
+def is_async_function(func: Callable[..., object]) -> bool:
+    """Tell whether a step function must be run on the event loop (coroutine or async generator function)."""
+    return inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)
+
+
+def close_event_loop(loop: AbstractEventLoop) -> None:
+    """Cancel the tasks left behind by the steps, and close the event loop."""
+    try:
+        tasks = asyncio.all_tasks(loop)
+        if tasks:
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run the coroutine of a scenario outside of any event loop.
+
+    The coroutine must never suspend: its awaited steps are run to completion by `ScenarioEventLoop.wait`.
+    """
+    __tracebackhide__ = True
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return cast(T, stop.value)
+    coroutine.close()
+    raise RuntimeError("The coroutine of a scenario was suspended outside of an event loop")
+
+
+class ScenarioEventLoop:
+    """The event loop running the async steps of a scenario.
+
+    The loop is created when the first async step is run, so the scenarios without async steps don't pay for it.
+    It is closed at the teardown of the scenario, after the teardown of the async generator steps.
+
+    :param request: Request of the scenario.
+    :param loop: Event loop shared with other scenarios, if any. It is not closed by the scenario.
+    """
+
+    def __init__(self, request: FixtureRequest, loop: AbstractEventLoop | None = None) -> None:
+        self.request = request
+        self.loop = loop
+
+    def get_loop(self) -> AbstractEventLoop:
+        """Get the event loop, creating it if needed."""
+        if self.loop is None:
+            self.loop = get_event_loop_factory(self.request.config)()
+            self.request.addfinalizer(self.close)
+        return self.loop
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        """Run an awaitable on the event loop of the scenario until it completes."""
+        return self.get_loop().run_until_complete(awaitable)
+
+    async def wait(self, awaitable: Awaitable[T]) -> T:
+        """Await an async step, running it on the event loop of the scenario until it completes."""
+        __tracebackhide__ = True
+        return self.run(awaitable)
+
+    async def wait_futures(self, futures: Sequence[Future[object]]) -> None:
+        """Wait for the step functions run on a thread pool (see `independent_steps`)."""
+        concurrent.futures.wait(futures)
+
+    def close(self) -> None:
+        loop, self.loop = self.loop, None
+        if loop is not None:
+            close_event_loop(loop)
+
+    def call_step_func(self, step_func: Callable[..., object], kwargs: dict[str, object]) -> Awaitable[object]:
+        """Call an async step function, the way `call_fixture_func` calls the other step functions.
+
+        The async generator step functions are run until their first ``yield``, and the rest of
+        the generator is run at the teardown of the scenario.
+
+        :param step_func: Coroutine or async generator function.
+        :param kwargs: Arguments of the step function.
+
+        :return: The awaitable of the step result: the result of the coroutine, or the value yielded
+                 by the async generator.
+        """
+        if not inspect.isasyncgenfunction(step_func):
+            return cast(Callable[..., Awaitable[object]], step_func)(**kwargs)
+
+        # The loop must be closed after the teardown of the generator
+        self.get_loop()
+        generator = cast(Callable[..., AsyncGenerator[object, None]], step_func)(**kwargs)
+        self.request.addfinalizer(functools.partial(self._teardown_async_generator, step_func, generator))
+        return self._get_first_value(step_func, generator)
+
+    async def _get_first_value(
+        self, step_func: Callable[..., object], generator: AsyncGenerator[object, None]
+    ) -> object:
+        __tracebackhide__ = True
+        try:
+            return await generator.__anext__()
+        except StopAsyncIteration:
+            raise ValueError(f"{step_func.__name__} did not yield a value") from None
+
+    def _teardown_async_generator(
+        self, step_func: Callable[..., object], generator: AsyncGenerator[object, None]
+    ) -> None:
+        # The generator is already finished if it failed (or did not yield) before its first value
+        try:
+            self.run(generator.__anext__())
+        except StopAsyncIteration:
+            pass
+        else:
+            fs, lineno = getfslineno(step_func)
+            pytest.fail(f"step function has more than one 'yield':\n\n{fs}:{lineno + 1}", pytrace=False)
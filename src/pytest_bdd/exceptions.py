@@ -23,6 +23,10 @@ class StepDefinitionNotFoundError(Exception):
     """Step definition not found."""
 
 
+class StepDefinitionNotFoundWarning(UserWarning):
+    """Step definition not found when binding the steps at collection time."""
+
+
 class NoScenariosFound(Exception):
     """No scenarios found."""
 
@@ -40,6 +44,10 @@ class GherkinParseError(Exception):
     def __str__(self) -> str:
         return f"{self.message}\nLine number: {self.line}\nLine: {self.line_content}\nFile: {self.filename}"
 
+    def __reduce__(self) -> tuple[type[GherkinParseError], tuple[str, int, str, str]]:
+        # Keep all the arguments when the error is pickled (e.g. raised in a feature parsing process)
+        return type(self), (self.message, self.line, self.line_content, self.filename)
+
 
 class FeatureError(GherkinParseError):
     pass
@@ -26,14 +26,118 @@ one line.
 
 from __future__ import annotations
 
-import glob
 import os.path
-from collections.abc import Iterable
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 
+import pytest
+from _pytest.pathlib import fnmatch_ex
+
+from .disk_cache import FeatureFileState, get_feature_disk_cache
 from .parser import Feature, FeatureParser
+from .utils import CONFIG_STACK
+
+# Maximum number of parsed features kept in memory by the global features cache.
+FEATURE_CACHE_SIZE = 1024
+
+# Minimum number of feature files to parse for the parsing to be sent to the pool of processes:
+# parsing fewer files in the pytest process is faster than sending them to the pool.
+PARSE_POOL_MIN_FILES = 16
+
+
+@dataclass
+class FeatureCacheEntry:
+    """A parsed feature, with the size and modification time of the feature file it was parsed from."""
+
+    feature: Feature
+    size: int
+    mtime_ns: int
+
+
+class FeatureCache:
+    """Parsed features by absolute path of the feature file.
+
+    A feature is dropped when its file changes (size or modification time), when it is invalidated,
+    or when the cache is full and it is the least recently used one. The cache can be shared by threads.
+
+    Attributes:
+        maxsize (int | None): Maximum number of features, or None for an unbounded cache.
+        hits (int): Number of lookups that found a feature.
+        misses (int): Number of lookups that didn't find a feature, or found a stale one.
+    """
+
+    def __init__(self, maxsize: int | None = FEATURE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, FeatureCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, abs_filename: object) -> bool:
+        return abs_filename in self._entries
+
+    def get(self, abs_filename: str) -> Feature | None:
+        """Get the feature of a feature file, unless the file changed since it was parsed.
+
+        :param abs_filename: Absolute path of the feature file.
+
+        :return: The feature, or None if it must be parsed.
+        """
+        try:
+            stat = os.stat(abs_filename)
+        except OSError:
+            stat = None
+        with self._lock:
+            entry = self._entries.get(abs_filename)
+            if entry is not None and (stat is None or entry.size != stat.st_size or entry.mtime_ns != stat.st_mtime_ns):
+                del self._entries[abs_filename]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(abs_filename)
+            self.hits += 1
+            return entry.feature
 
-# Global features dictionary
-features: dict[str, Feature] = {}
+    def add(self, abs_filename: str, feature: Feature, size: int, mtime_ns: int) -> None:
+        """Add the feature of a feature file.
+
+        :param abs_filename: Absolute path of the feature file.
+        :param feature: The parsed feature.
+        :param size: Size of the feature file before it was parsed.
+        :param mtime_ns: Modification time of the feature file before it was parsed.
+        """
+        with self._lock:
+            self._entries[abs_filename] = FeatureCacheEntry(feature=feature, size=size, mtime_ns=mtime_ns)
+            self._entries.move_to_end(abs_filename)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, abs_filename: str) -> None:
+        """Drop the feature of a feature file, so that it is parsed again.
+
+        :param abs_filename: Absolute path of the feature file.
+        """
+        with self._lock:
+            self._entries.pop(abs_filename, None)
+
+    def clear(self) -> None:
+        """Drop all the features, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Global features cache
+features = FeatureCache()
 
 
 def get_feature(base_path: str, filename: str, encoding: str = "utf-8") -> Feature:
@@ -46,36 +150,202 @@ def get_feature(base_path: str, filename: str, encoding: str = "utf-8") -> Featu
     :return: `Feature` instance from the parsed feature cache.
 
     :note: The features are parsed on the execution of the test and
-           stored in the global variable cache to improve the performance
+           stored in the global features cache to improve the performance
            when multiple scenarios are referencing the same file.
+           They are also stored in the pytest cache directory, so they are parsed
+           again only when the feature file changes.
     """
     __tracebackhide__ = True
     full_name = os.path.abspath(os.path.join(base_path, filename))
-    feature = features.get(full_name)
-    if not feature:
-        feature = FeatureParser(base_path, filename, encoding).parse()
-        features[full_name] = feature
-    return feature
+    return load_features([(base_path, filename)], encoding=encoding)[full_name]
 
 
-def get_features(paths: Iterable[str], encoding: str = "utf-8") -> list[Feature]:
-    """Get features for given paths.
+def load_features(
+    file_paths: Iterable[tuple[str, str]], encoding: str = "utf-8", workers: int = 1
+) -> dict[str, Feature]:
+    """Get the features of the feature files, parsing the ones that are not in the global features cache.
+
+    :param file_paths: (base path, filename) of the feature files.
+    :param str encoding: Feature file encoding.
+    :param int workers: Number of processes parsing the feature files, when there are at least
+                        `PARSE_POOL_MIN_FILES` feature files to parse.
+
+    :return: `dict` of the features by absolute path of the feature file.
+    """
+    __tracebackhide__ = True
+    disk_cache = get_feature_disk_cache()
+    loaded: dict[str, Feature] = {}
+    pending: dict[str, tuple[FeatureParser, FeatureFileState]] = {}
+    for base_path, filename in file_paths:
+        full_name = os.path.abspath(os.path.join(base_path, filename))
+        if full_name in loaded or full_name in pending:
+            continue
+        feature = features.get(full_name)
+        if feature is not None:
+            loaded[full_name] = feature
+            continue
+        feature_parser = FeatureParser(base_path, filename, encoding)
+        if disk_cache is not None:
+            cached_feature, state = disk_cache.lookup(full_name, encoding)
+            if cached_feature is not None:
+                cached_feature.rel_filename = feature_parser.rel_filename
+                features.add(full_name, cached_feature, state.size, state.mtime_ns)
+                loaded[full_name] = cached_feature
+                continue
+        else:
+            # The content is not hashed, only the disk cache uses the digest
+            stat = os.stat(full_name)
+            state = FeatureFileState(size=stat.st_size, mtime_ns=stat.st_mtime_ns, digest="")
+        pending[full_name] = (feature_parser, state)
+
+    feature_parsers = [feature_parser for feature_parser, _ in pending.values()]
+    parsed_features: Iterable[Feature]
+    if workers > 1 and len(feature_parsers) >= PARSE_POOL_MIN_FILES:
+        chunksize = max(1, len(feature_parsers) // (workers * 4))
+        parse_pool = get_parse_pool(workers)
+        if parse_pool is None:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed_features = list(executor.map(FeatureParser.parse, feature_parsers, chunksize=chunksize))
+        else:
+            parsed_features = list(parse_pool.map(FeatureParser.parse, feature_parsers, chunksize=chunksize))
+    else:
+        parsed_features = (feature_parser.parse() for feature_parser in feature_parsers)
+
+    for (full_name, (_, state)), feature in zip(pending.items(), parsed_features, strict=True):
+        features.add(full_name, feature, state.size, state.mtime_ns)
+        loaded[full_name] = feature
+        if disk_cache is not None:
+            disk_cache.store(full_name, encoding, state, feature)
+    return loaded
+
+
+parse_pool_key = pytest.StashKey[ProcessPoolExecutor]()
+
+
+def get_parse_pool(workers: int) -> ProcessPoolExecutor | None:
+    """Get the pool of processes parsing the feature files of the current pytest run.
+
+    The pool is created at its first use, and shut down with the pytest run.
+
+    :param int workers: Number of processes of the pool.
+
+    :return: The pool, or None outside of a pytest run.
+    """
+    if not CONFIG_STACK:
+        return None
+    config = CONFIG_STACK[-1]
+    parse_pool = config.stash.get(parse_pool_key, None)
+    if parse_pool is None:
+        parse_pool = ProcessPoolExecutor(max_workers=workers)
+        config.stash[parse_pool_key] = parse_pool
+        config.add_cleanup(parse_pool.shutdown)
+    return parse_pool
+
+
+@dataclass
+class FeatureFileFinder:
+    """Find the feature files in directories.
+
+    The subdirectories matching `norecursedirs` or `ignore`, and the feature files matching `ignore`, are
+    skipped (the patterns are matched like pytest's ``norecursedirs``). The directory listings are kept,
+    so a directory is listed once no matter how many `scenarios` calls look into it.
+    """
+
+    norecursedirs: Sequence[str] = ()
+    ignore: Sequence[str] = ()
+    _listings: dict[str, list[tuple[str, bool]]] = field(default_factory=dict)
+
+    def _is_ignored(self, path: str, is_dir: bool) -> bool:
+        patterns = [*self.ignore, *self.norecursedirs] if is_dir else self.ignore
+        return any(fnmatch_ex(pattern, path) for pattern in patterns)
+
+    def _list_directory(self, directory: str) -> list[tuple[str, bool]]:
+        """Get the (path, is directory) of the subdirectories and feature files of a directory, sorted by name."""
+        listing = self._listings.get(directory)
+        if listing is not None:
+            return listing
+        listing = []
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                # Hidden files are skipped, like the "*.feature" glob does
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if not is_dir and not entry.name.endswith(".feature"):
+                    continue
+                if not self._is_ignored(entry.path, is_dir):
+                    listing.append((entry.path, is_dir))
+        self._listings[directory] = listing
+        return listing
+
+    def iter_feature_files(self, directory: str) -> Iterator[str]:
+        """Find the feature files in a directory and its subdirectories.
+
+        :param directory: Path of the directory.
+
+        :return: Paths of the feature files, sorted.
+        """
+        for path, is_dir in self._list_directory(directory):
+            if is_dir:
+                yield from self.iter_feature_files(path)
+            else:
+                yield path
+
+
+feature_file_finder_key = pytest.StashKey[FeatureFileFinder]()
+
+
+def get_feature_file_finder() -> FeatureFileFinder:
+    """Get the feature file finder of the current pytest run."""
+    if not CONFIG_STACK:
+        return FeatureFileFinder()
+    config = CONFIG_STACK[-1]
+    finder = config.stash.get(feature_file_finder_key, None)
+    if finder is None:
+        finder = FeatureFileFinder(
+            norecursedirs=config.getini("norecursedirs"),
+            ignore=config.getini("bdd_features_ignore"),
+        )
+        config.stash[feature_file_finder_key] = finder
+    return finder
+
+
+def iter_feature_file_paths(paths: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Find the feature files in the given paths.
 
     :param list paths: `list` of paths (file or dirs)
 
-    :return: `list` of `Feature` objects.
+    :return: (base path, filename) of the feature files.
     """
+    finder = get_feature_file_finder()
     seen_names = set()
-    _features = []
     for path in paths:
-        if path not in seen_names:
-            seen_names.add(path)
-            if os.path.isdir(path):
-                file_paths = list(glob.iglob(os.path.join(path, "**", "*.feature"), recursive=True))
-                _features.extend(get_features(file_paths, encoding=encoding))
-            else:
-                base, name = os.path.split(path)
-                feature = get_feature(base, name, encoding=encoding)
-                _features.append(feature)
+        if path in seen_names:
+            continue
+        seen_names.add(path)
+        if os.path.isdir(path):
+            for file_path in finder.iter_feature_files(path):
+                if file_path not in seen_names:
+                    seen_names.add(file_path)
+                    yield os.path.split(file_path)
+        else:
+            yield os.path.split(path)
+
+
+def get_features(paths: Iterable[str], encoding: str = "utf-8", workers: int = 1) -> list[Feature]:
+    """Get features for given paths.
+
+    :param list paths: `list` of paths (file or dirs)
+    :param str encoding: Feature file encoding.
+    :param int workers: Number of processes parsing the feature files.
+
+    :return: `list` of `Feature` objects.
+    """
+    file_paths = list(iter_feature_file_paths(paths))
+    loaded = load_features(file_paths, encoding=encoding, workers=workers)
+    _features = [loaded[os.path.abspath(os.path.join(base, name))] for base, name in file_paths]
     _features.sort(key=lambda _feature: _feature.name or _feature.filename)
     return _features
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import linecache
 import re
+import sys
 import textwrap
 import typing
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, cast
 
-from gherkin.errors import CompositeParserException  # type: ignore
+from gherkin.ast_node import AstNode  # type: ignore
+from gherkin.errors import AstBuilderException, CompositeParserException  # type: ignore
 from gherkin.parser import Parser  # type: ignore
+from gherkin.stream.id_generator import IdGenerator  # type: ignore
 
 from . import exceptions
 
@@ -56,7 +59,7 @@ ERROR_PATTERNS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     column: int
     line: int
@@ -66,7 +69,7 @@ class Location:
         return cls(column=data["column"], line=data["line"])
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     location: Location
     text: str
@@ -76,7 +79,7 @@ class Comment:
         return cls(location=Location.from_dict(data["location"]), text=data["text"])
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     location: Location
     value: str
@@ -86,7 +89,7 @@ class Cell:
         return cls(location=Location.from_dict(data["location"]), value=data["value"])
 
 
-@dataclass
+@dataclass(slots=True)
 class Row:
     id: str
     location: Location
@@ -101,7 +104,7 @@ class Row:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExamplesTable:
     location: Location
     tags: list[Tag]
@@ -120,10 +123,12 @@ class ExamplesTable:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DataTable:
     location: Location
     rows: list[Row]
+    # Cell values collected by the first `raw` call
+    _raw_rows: tuple[tuple[str, ...], ...] | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
@@ -132,10 +137,13 @@ class DataTable:
         )
 
     def raw(self) -> Sequence[Sequence[object]]:
-        return [[cell.value for cell in row.cells] for row in self.rows]
+        # The tables are not modified once parsed or rendered, but the returned lists can be
+        if self._raw_rows is None:
+            self._raw_rows = tuple(tuple(cell.value for cell in row.cells) for row in self.rows)
+        return [list(row) for row in self._raw_rows]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocString:
     content: str
     delimiter: str
@@ -150,7 +158,7 @@ class DocString:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     id: str
     location: Location
@@ -173,7 +181,7 @@ class Step:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     id: str
     location: Location
@@ -184,7 +192,7 @@ class Tag:
         return cls(id=data["id"], location=Location.from_dict(data["location"]), name=data["name"])
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     id: str
     location: Location
@@ -209,7 +217,7 @@ class Scenario:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     id: str
     location: Location
@@ -232,7 +240,7 @@ class Rule:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Background:
     id: str
     location: Location
@@ -253,7 +261,7 @@ class Background:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Child:
     background: Background | None = None
     rule: Rule | None = None
@@ -268,7 +276,7 @@ class Child:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Feature:
     location: Location
     language: str
@@ -291,7 +299,7 @@ class Feature:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GherkinDocument:
     feature: Feature
     comments: list[Comment]
@@ -304,12 +312,210 @@ class GherkinDocument:
         )
 
 
+class GherkinDocumentBuilder:
+    """AST builder for the gherkin parser, creating the document dataclasses directly.
+
+    The default builder of the gherkin parser creates a tree of dicts, which would then have to be converted
+    with `GherkinDocument.from_dict`. The ids are generated in the same order as the default builder.
+    """
+
+    def __init__(self) -> None:
+        self.id_generator = IdGenerator()
+        self.reset()
+
+    def reset(self) -> None:
+        self.stack = [AstNode("None")]
+        self.comments: list[Comment] = []
+
+    @property
+    def current_node(self) -> Any:
+        return self.stack[-1]
+
+    def start_rule(self, rule_type: str) -> None:
+        self.stack.append(AstNode(rule_type))
+
+    def end_rule(self, rule_type: str) -> None:
+        node = self.stack.pop()
+        self.current_node.add(node.rule_type, self.transform_node(node))
+
+    def get_result(self) -> GherkinDocument | None:
+        return cast(GherkinDocument | None, self.current_node.get_single("GherkinDocument"))
+
+    def build(self, token: Any) -> None:
+        if token.matched_type == "Comment":
+            self.comments.append(Comment(location=self.get_location(token), text=token.matched_text))
+        else:
+            self.current_node.add(token.matched_type, token)
+
+    @staticmethod
+    def get_location(token: Any, column: int | None = None) -> Location:
+        return Location(column=column or token.location["column"], line=token.location["line"])
+
+    def get_tags(self, node: Any) -> list[Tag]:
+        tags_node = node.get_single("Tags")
+        if not tags_node:
+            return []
+        return [
+            Tag(
+                id=self.id_generator.get_next_id(),
+                location=self.get_location(token, tag_item["column"]),
+                name=sys.intern(tag_item["text"]),
+            )
+            for token in tags_node.get_tokens("TagLine")
+            for tag_item in token.matched_items
+        ]
+
+    def get_table_rows(self, node: Any) -> list[Row]:
+        rows: list[Row] = []
+        for token in node.get_tokens("TableRow"):
+            row = Row(
+                id=self.id_generator.get_next_id(), location=self.get_location(token), cells=self.get_cells(token)
+            )
+            if rows and len(row.cells) != len(rows[0].cells):
+                raise AstBuilderException("inconsistent cell count within the table", token.location)
+            rows.append(row)
+        return rows
+
+    def get_cells(self, table_row_token: Any) -> list[Cell]:
+        return [
+            Cell(location=self.get_location(table_row_token, cell_item["column"]), value=sys.intern(cell_item["text"]))
+            for cell_item in table_row_token.matched_items
+        ]
+
+    @staticmethod
+    def get_description(node: Any) -> str:
+        return cast(str, node.get_single("Description", ""))
+
+    @staticmethod
+    def get_steps(node: Any) -> list[Step]:
+        return cast(list[Step], node.get_items("Step"))
+
+    def get_children(self, node: Any) -> list[Child]:
+        children = []
+        background = node.get_single("Background")
+        if background:
+            children.append(Child(background=background))
+        children += [Child(scenario=scenario) for scenario in node.get_items("ScenarioDefinition")]
+        children += [Child(rule=rule) for rule in node.get_items("Rule")]
+        return children
+
+    def transform_node(self, node: Any) -> object:
+        if node.rule_type == "Step":
+            step_line = node.get_token("StepLine")
+            return Step(
+                id=self.id_generator.get_next_id(),
+                location=self.get_location(step_line),
+                keyword=sys.intern(step_line.matched_keyword.strip()),
+                keyword_type=step_line.matched_keyword_type,
+                text=sys.intern(step_line.matched_text),
+                datatable=node.get_single("DataTable"),
+                docstring=node.get_single("DocString"),
+            )
+        if node.rule_type == "DocString":
+            separator_token = node.get_tokens("DocStringSeparator")[0]
+            return DocString(
+                content=textwrap.dedent("\n".join(token.matched_text for token in node.get_tokens("Other"))),
+                delimiter=separator_token.matched_keyword,
+                location=self.get_location(separator_token),
+            )
+        if node.rule_type == "DataTable":
+            rows = self.get_table_rows(node)
+            return DataTable(location=rows[0].location, rows=rows)
+        if node.rule_type == "Background":
+            background_line = node.get_token("BackgroundLine")
+            return Background(
+                id=self.id_generator.get_next_id(),
+                location=self.get_location(background_line),
+                keyword=background_line.matched_keyword,
+                name=background_line.matched_text,
+                description=self.get_description(node),
+                steps=self.get_steps(node),
+            )
+        if node.rule_type == "ScenarioDefinition":
+            tags = self.get_tags(node)
+            scenario_node = node.get_single("Scenario")
+            scenario_line = scenario_node.get_token("ScenarioLine")
+            return Scenario(
+                id=self.id_generator.get_next_id(),
+                location=self.get_location(scenario_line),
+                keyword=scenario_line.matched_keyword,
+                name=scenario_line.matched_text,
+                description=self.get_description(scenario_node),
+                steps=self.get_steps(scenario_node),
+                tags=tags,
+                examples=cast(list[ExamplesTable], scenario_node.get_items("ExamplesDefinition")),
+            )
+        if node.rule_type == "ExamplesDefinition":
+            tags = self.get_tags(node)
+            examples_node = node.get_single("Examples")
+            examples_line = examples_node.get_token("ExamplesLine")
+            examples_table_rows = examples_node.get_single("ExamplesTable")
+            # The examples have an id in the gherkin messages, but not in our model
+            self.id_generator.get_next_id()
+            return ExamplesTable(
+                location=self.get_location(examples_line),
+                tags=tags,
+                name=examples_line.matched_text,
+                table_header=examples_table_rows[0] if examples_table_rows else None,
+                table_body=examples_table_rows[1:] if examples_table_rows else [],
+            )
+        if node.rule_type == "Rule":
+            header = node.get_single("RuleHeader")
+            if not header:
+                return None
+            tags = self.get_tags(header)
+            rule_line = header.get_token("RuleLine")
+            if not rule_line:
+                return None
+            children = self.get_children(node)
+            return Rule(
+                id=self.id_generator.get_next_id(),
+                location=self.get_location(rule_line),
+                keyword=rule_line.matched_keyword,
+                name=rule_line.matched_text,
+                description=self.get_description(header),
+                tags=tags,
+                children=children,
+            )
+        if node.rule_type == "Feature":
+            header = node.get_single("FeatureHeader")
+            if not header:
+                return None
+            tags = self.get_tags(header)
+            feature_line = header.get_token("FeatureLine")
+            if not feature_line:
+                return None
+            return Feature(
+                location=self.get_location(feature_line),
+                language=feature_line.matched_gherkin_dialect,
+                keyword=feature_line.matched_keyword,
+                tags=tags,
+                name=feature_line.matched_text,
+                description=self.get_description(header),
+                children=self.get_children(node),
+            )
+        if node.rule_type == "GherkinDocument":
+            feature = node.get_single("Feature")
+            if feature is None:
+                return None
+            return GherkinDocument(feature=feature, comments=self.comments)
+        if node.rule_type == "ExamplesTable":
+            return self.get_table_rows(node)
+        if node.rule_type == "Description":
+            tokens = list(node.get_tokens("Other"))
+            # Trim trailing empty lines
+            while tokens and not tokens[-1].matched_text:
+                tokens.pop()
+            return "\n".join(token.matched_text for token in tokens)
+        return node
+
+
 def get_gherkin_document(abs_filename: str, encoding: str = "utf-8") -> GherkinDocument:
     with open(abs_filename, encoding=encoding) as f:
         feature_file_text = f.read()
 
     try:
-        gherkin_data = Parser().parse(feature_file_text)
+        gherkin_document = Parser(GherkinDocumentBuilder()).parse(feature_file_text)  # type: ignore[arg-type]
     except CompositeParserException as e:
         message = e.args[0]
         line = e.errors[0].location["line"]
@@ -319,8 +525,9 @@ def get_gherkin_document(abs_filename: str, encoding: str = "utf-8") -> GherkinD
         # If no patterns matched, raise a generic GherkinParserError
         raise exceptions.GherkinParseError(f"Unknown parsing error: {message}", line, line_content, filename) from e
 
-    # At this point, the `gherkin_data` should be valid if no exception was raised
-    return GherkinDocument.from_dict(gherkin_data)
+    if gherkin_document is None:
+        raise exceptions.FeatureError("No feature found in the feature file.", 1, "", abs_filename)
+    return cast(GherkinDocument, gherkin_document)
 
 
 def handle_gherkin_parser_error(
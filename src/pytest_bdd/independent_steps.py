@@ -0,0 +1,77 @@
+"""Concurrent execution of the consecutive steps declared independent.
+
+The step functions of the step definitions declared with ``independent=True`` (e.g. ``@given("a user", independent=True)``)
+don't depend on each other, so the consecutive independent steps of a scenario are run together on a thread pool:
+
+* their hooks are called and their arguments (step arguments and fixtures) are resolved one after the other,
+  in the thread running the test;
+* their step functions run concurrently, each one in its own worker thread;
+* their outcomes are then handled one after the other, in the order of the steps: the ``target_fixture`` values are
+  injected, and each step is reported as passed or failed, with the time taken by its own step function.
+
+The async step functions are not run on the thread pool, they run on the event loop of the scenario.
+"""
+
+from __future__ import annotations
+
+import inspect
+import time
+from collections.abc import Callable, Generator
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from _pytest._code import getfslineno
+
+if TYPE_CHECKING:
+    from .steps import StepFunctionContext
+
+
+def is_independent(context: StepFunctionContext) -> bool:
+    """Tell whether a step function can run on the thread pool, concurrently with its neighbour independent steps."""
+    return context.independent and not context.call_plan.is_async
+
+
+class IndependentStepCall:
+    """The call of an independent step function, in a worker thread.
+
+    The step function is called with plain keyword arguments, resolved by the thread running the test.
+    The generator step functions are run until their first ``yield``, and the rest of the generator is
+    run by `teardown`, which the thread running the test registers on the request afterwards, in the order
+    of the steps.
+
+    :param step_func: Step function.
+    :param kwargs: Arguments of the step function, resolved by the thread running the test.
+    """
+
+    def __init__(self, step_func: Callable[..., object], kwargs: dict[str, object]) -> None:
+        self.step_func = step_func
+        self.kwargs = kwargs
+        self.generator: Generator[object, None, None] | None = None
+        self.started: float | None = None
+        self.stopped: float | None = None
+
+    def __call__(self) -> object:
+        __tracebackhide__ = True
+        self.started = time.perf_counter()
+        try:
+            if not inspect.isgeneratorfunction(self.step_func):
+                return self.step_func(**self.kwargs)
+            self.generator = cast(Callable[..., Generator[object, None, None]], self.step_func)(**self.kwargs)
+            try:
+                return next(self.generator)
+            except StopIteration:
+                raise ValueError(f"{self.step_func.__name__} did not yield a value") from None
+        finally:
+            self.stopped = time.perf_counter()
+
+    def teardown(self) -> None:
+        """Run the rest of the generator of a generator step function, at the teardown of the scenario."""
+        assert self.generator is not None
+        # The generator is already finished if it failed (or did not yield) before its first value
+        try:
+            next(self.generator)
+        except StopIteration:
+            pass
+        else:
+            fs, lineno = getfslineno(self.step_func)
+            pytest.fail(f"step function has more than one 'yield':\n\n{fs}:{lineno + 1}", pytrace=False)
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import copy
+import dataclasses
+import functools
+import io
 import os.path
+import pickle
 import re
+import sys
 import textwrap
 from collections import OrderedDict
-from collections.abc import Generator, Iterable, Mapping, Sequence
+from collections.abc import Generator, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
+from typing import Any
 
+from . import gherkin_parser
 from .exceptions import StepError
 from .gherkin_parser import Background as GherkinBackground
-from .gherkin_parser import DataTable, GherkinDocument, get_gherkin_document
+from .gherkin_parser import Cell, DataTable, GherkinDocument, Row, get_gherkin_document
 from .gherkin_parser import Feature as GherkinFeature
 from .gherkin_parser import Rule as GherkinRule
 from .gherkin_parser import Scenario as GherkinScenario
@@ -20,6 +26,9 @@ from .types import STEP_TYPE_BY_PARSER_KEYWORD
 
 PARAM_RE = re.compile(r"<(.+?)>")
 
+# Maximum number of scenarios rendered from the example rows of a scenario template kept by `ScenarioTemplate.render`
+RENDERED_SCENARIOS_PER_TEMPLATE = 8
+
 
 def render_string(input_string: str, render_context: Mapping[str, object]) -> str:
     """
@@ -42,6 +51,45 @@ def render_string(input_string: str, render_context: Mapping[str, object]) -> st
     return PARAM_RE.sub(replacer, input_string)
 
 
+class StringTemplate:
+    """A string with <param> placeholders, split once into its literal parts and parameter names.
+
+    Rendering it joins the parts instead of running a regex substitution. Like `render_string`,
+    the placeholders missing from the context are left unchanged.
+    """
+
+    __slots__ = ("source", "_parts", "_placeholders")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        # Literal parts at the even indexes, parameter names at the odd ones
+        self._parts = PARAM_RE.split(source)
+        self._placeholders = [
+            (index, self._parts[index], f"<{self._parts[index]}>") for index in range(1, len(self._parts), 2)
+        ]
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the string has no placeholders."""
+        return not self._placeholders
+
+    def render(self, context: Mapping[str, object]) -> str:
+        """Render the string with the given context.
+
+        Args:
+            context (Mapping[str, object]): The context for rendering the string.
+
+        Returns:
+            str: The rendered string.
+        """
+        if not self._placeholders:
+            return self.source
+        parts = self._parts.copy()
+        for index, name, missing in self._placeholders:
+            parts[index] = str(context.get(name, missing))
+        return "".join(parts)
+
+
 def get_tag_names(tag_data: list[GherkinTag]) -> set[str]:
     """Extract tag names from tag data.
 
@@ -51,10 +99,103 @@ def get_tag_names(tag_data: list[GherkinTag]) -> set[str]:
     Returns:
         set[str]: A set of tag names.
     """
-    return {tag.name.lstrip("@") for tag in tag_data}
+    return {sys.intern(tag.name.lstrip("@")) for tag in tag_data}
+
+
+def convert_steps(steps_data: Sequence[GherkinStep]) -> list[Step]:
+    """Convert the gherkin steps of a scenario or background into Step objects.
+
+    The "And" and "But" steps get the type of the previous step. The first step must be validated
+    beforehand (see `FeatureParser.parse_steps`).
+
+    Args:
+        steps_data (Sequence[GherkinStep]): The gherkin steps.
+
+    Returns:
+        list[Step]: A list of Step objects.
+    """
+    steps = []
+    current_type = STEP_TYPE_BY_PARSER_KEYWORD.get(steps_data[0].keyword_type, "") if steps_data else ""
+    for step in steps_data:
+        current_type = STEP_TYPE_BY_PARSER_KEYWORD.get(step.keyword_type, current_type)
+        steps.append(
+            Step(
+                name=sys.intern(step.text),
+                type=current_type,
+                indent=step.location.column - 1,
+                line_number=step.location.line,
+                keyword=sys.intern(step.keyword.title()),
+                datatable=step.datatable,
+                docstring=step.docstring.content if step.docstring else None,
+            )
+        )
+    return steps
+
+
+@functools.cache
+def get_model_classes() -> dict[tuple[str, str], type]:
+    """Get the classes of the parsed features, by module and name."""
+    classes: list[type] = [OrderedDict, DeferredSteps]
+    for module in (gherkin_parser, sys.modules[__name__]):
+        classes.extend(
+            obj
+            for obj in vars(module).values()
+            if dataclasses.is_dataclass(obj) and isinstance(obj, type) and obj.__module__ == module.__name__
+        )
+    return {(cls.__module__, cls.__qualname__): cls for cls in classes}
+
+
+class ModelUnpickler(pickle.Unpickler):
+    """Unpickler of the parsed features, which only loads the classes of the features model.
+
+    Any other global (e.g. ``os.system``) is refused, so that unpickling crafted data can't run code.
+    """
 
+    def find_class(self, module_name: str, global_name: str, /) -> Any:
+        try:
+            return get_model_classes()[module_name, global_name]
+        except KeyError:
+            raise pickle.UnpicklingError(f"Global '{module_name}.{global_name}' is forbidden") from None
 
-@dataclass(eq=False)
+
+def unpickle_model(data: bytes) -> Any:
+    """Unpickle parsed features (or parts of them) with the `ModelUnpickler`."""
+    return ModelUnpickler(io.BytesIO(data)).load()
+
+
+class DeferredSteps:
+    """The gherkin steps of a scenario, kept until the scenario steps are needed.
+
+    They are pickled separately (e.g. in the feature cache), so loading a feature doesn't load the steps,
+    data tables and docstrings of the scenarios that are deselected or not run.
+    """
+
+    __slots__ = ("_steps_data", "_pickled")
+
+    def __init__(self, steps_data: Sequence[GherkinStep] | None = None, pickled: bytes | None = None) -> None:
+        self._steps_data = steps_data
+        self._pickled = pickled
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the gherkin steps are loaded."""
+        return self._pickled is None
+
+    def load(self) -> Sequence[GherkinStep]:
+        """Get the gherkin steps, unpickling them if needed."""
+        if self._pickled is not None:
+            self._steps_data = unpickle_model(self._pickled)
+            self._pickled = None
+        return self._steps_data or ()
+
+    def __reduce__(self) -> tuple[type[DeferredSteps], tuple[None, bytes]]:
+        pickled = self._pickled
+        if pickled is None:
+            pickled = pickle.dumps(self._steps_data, protocol=pickle.HIGHEST_PROTOCOL)
+        return type(self), (None, pickled)
+
+
+@dataclass(eq=False, slots=True)
 class Feature:
     """Represents a feature parsed from a feature file.
 
@@ -81,22 +222,51 @@ class Feature:
     description: str
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Examples:
     """Represents examples used in scenarios for parameterization.
 
+    The values are stored by column, one list per parameter, so a row costs one reference per value.
+
     Attributes:
         line_number (int | None): The line number where the examples start.
         name (str | None): The name of the examples.
         example_params (list[str]): The names of the parameters for the examples.
-        examples (list[Sequence[str]]): The list of example rows.
+        columns (list[list[str]]): The values of the example rows, by parameter.
+        row_count (int): The number of example rows.
     """
 
     line_number: int | None = None
     name: str | None = None
     example_params: list[str] = field(default_factory=list)
-    examples: list[Sequence[str]] = field(default_factory=list)
+    columns: list[list[str]] = field(default_factory=list)
+    row_count: int = 0
     tags: set[str] = field(default_factory=set)
+    # Column of each parameter name (the last one wins, like in a dict built from the rows)
+    _param_columns: dict[str, int] = field(init=False, default_factory=dict, repr=False)
+
+    def __init__(
+        self,
+        line_number: int | None = None,
+        name: str | None = None,
+        example_params: Iterable[str] = (),
+        examples: Iterable[Sequence[str]] = (),
+        tags: set[str] | None = None,
+    ) -> None:
+        """Initialize the examples.
+
+        Args:
+            line_number (int | None): The line number where the examples start.
+            name (str | None): The name of the examples.
+            example_params (Iterable[str]): The names of the parameters for the examples.
+            examples (Iterable[Sequence[str]]): The example rows, with one value per parameter.
+            tags (set[str] | None): The tags of the examples.
+        """
+        self.line_number = line_number
+        self.name = name
+        self.tags = tags if tags is not None else set()
+        self.set_param_names(example_params)
+        self.examples = examples
 
     def set_param_names(self, keys: Iterable[str]) -> None:
         """Set the parameter names for the examples.
@@ -104,15 +274,52 @@ class Examples:
         Args:
             keys (Iterable[str]): The parameter names to set.
         """
-        self.example_params = [str(key) for key in keys]
+        self.example_params = [sys.intern(str(key)) for key in keys]
+        self.columns = [[] for _ in self.example_params]
+        self.row_count = 0
+        self._param_columns = {param: column for column, param in enumerate(self.example_params)}
 
     def add_example(self, values: Sequence[str]) -> None:
         """Add a new example row.
 
         Args:
-            values (Sequence[str]): The values for the example row.
+            values (Sequence[str]): The values for the example row, one per parameter.
+        """
+        for column, value in zip(self.columns, values, strict=True):
+            column.append(sys.intern(str(value)) if value is not None else "")
+        self.row_count += 1
+
+    @property
+    def examples(self) -> list[tuple[str, ...]]:
+        """The list of example rows, built from the columns (modifying it does not change the examples)."""
+        return list(zip(*self.columns, strict=True)) if self.columns else [() for _ in range(self.row_count)]
+
+    @examples.setter
+    def examples(self, rows: Iterable[Sequence[str]]) -> None:
+        """Replace the example rows, with one value per parameter."""
+        self.columns = [[] for _ in self.example_params]
+        self.row_count = 0
+        for row in rows:
+            self.add_example(row)
+
+    def get_value(self, row: int, param: str) -> str:
+        """Get the value of a parameter in an example row.
+
+        Raises:
+            KeyError: If there is no such parameter.
         """
-        self.examples.append([str(value) if value is not None else "" for value in values])
+        return self.columns[self._param_columns[param]][row]
+
+    def rows(self) -> Iterator[ExampleRow]:
+        """Iterate over the example rows, as read-only mappings of the parameter names to their values."""
+        for row in range(self.row_count):
+            yield ExampleRow(self, row)
+
+    def iter_row_ids(self) -> Iterator[str]:
+        """Iterate over the ids of the example rows: their values (one per parameter name) joined by "-"."""
+        columns = [self.columns[column] for column in self._param_columns.values()]
+        for values in zip(*columns, strict=True):
+            yield "-".join(values)
 
     def as_contexts(self) -> Generator[dict[str, str]]:
         """Generate contexts for the examples.
@@ -120,8 +327,8 @@ class Examples:
         Yields:
             dict[str, str]: A dictionary mapping parameter names to their values for each example row.
         """
-        for row in self.examples:
-            yield dict(zip(self.example_params, row, strict=True))
+        for row in self.rows():
+            yield dict(row)
 
     def __bool__(self) -> bool:
         """Check if there are any examples.
@@ -129,10 +336,41 @@ class Examples:
         Returns:
             bool: True if there are examples, False otherwise.
         """
-        return bool(self.examples)
+        return self.row_count > 0
+
+
+class ExampleRow(Mapping[str, str]):
+    """A row of an Examples table, mapping the parameter names to the row values.
+
+    It is a view on the columns of the table: the values are only looked up when the scenario is rendered.
+    """
 
+    __slots__ = ("examples", "index")
 
-@dataclass(eq=False)
+    def __init__(self, examples: Examples, index: int) -> None:
+        self.examples = examples
+        self.index = index
+
+    def __getitem__(self, param: str) -> str:
+        examples = self.examples
+        return examples.columns[examples._param_columns[param]][self.index]
+
+    def get(self, param: str, default: Any = None) -> Any:
+        examples = self.examples
+        column = examples._param_columns.get(param)
+        return default if column is None else examples.columns[column][self.index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.examples._param_columns)
+
+    def __len__(self) -> int:
+        return len(self.examples._param_columns)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+@dataclass(eq=False, slots=True)
 class Rule:
     keyword: str
     name: str
@@ -141,7 +379,7 @@ class Rule:
     background: Background | None = None
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ScenarioTemplate:
     """Represents a scenario template within a feature.
 
@@ -153,9 +391,13 @@ class ScenarioTemplate:
         templated (bool): Whether the scenario is templated.
         description (str | None): The description of the scenario.
         tags (set[str]): A set of tags associated with the scenario.
-        _steps (list[Step]): The list of steps in the scenario (internal use only).
         examples (Examples | None): The examples used for parameterization in the scenario.
         rule (Rule | None): The rule to which the scenario may belong (None = no rule).
+        deferred_steps (DeferredSteps | None): The gherkin steps of the scenario, converted to `Step` objects
+            the first time the steps are needed (internal use only).
+        _steps (list[Step] | None): The list of steps in the scenario, once converted (internal use only).
+        _rendered (OrderedDict[tuple[Examples | None, int], Scenario]): The scenarios most recently rendered from
+            the example rows of the template (or from an empty context), by examples and row index (internal use only).
     """
 
     feature: Feature
@@ -165,9 +407,31 @@ class ScenarioTemplate:
     templated: bool
     description: str
     tags: set[str] = field(default_factory=set)
-    _steps: list[Step] = field(init=False, default_factory=list)
     examples: list[Examples] = field(default_factory=list[Examples])
     rule: Rule | None = None
+    deferred_steps: DeferredSteps | None = field(default=None, repr=False)
+    _steps: list[Step] | None = field(init=False, default=None, repr=False)
+    _all_steps: list[Step] | None = field(init=False, default=None, repr=False)
+    _name_template: StringTemplate | None = field(init=False, default=None, repr=False)
+    _step_templates: list[StepTemplate] | None = field(init=False, default=None, repr=False)
+    _rendered: OrderedDict[tuple[Examples | None, int], Scenario] = field(
+        init=False, default_factory=OrderedDict, repr=False
+    )
+
+    @property
+    def own_steps(self) -> list[Step]:
+        """Get the steps of the scenario, without the background steps.
+
+        Returns:
+            list[Step]: A list of steps, converted from the gherkin steps on the first access.
+        """
+        if self._steps is None:
+            steps_data = self.deferred_steps.load() if self.deferred_steps is not None else ()
+            self._steps = convert_steps(steps_data)
+            self.deferred_steps = None
+            for step in self._steps:
+                step.scenario = self
+        return self._steps
 
     def add_step(self, step: Step) -> None:
         """Add a step to the scenario.
@@ -176,7 +440,10 @@ class ScenarioTemplate:
             step (Step): The step to add.
         """
         step.scenario = self
-        self._steps.append(step)
+        self.own_steps.append(step)
+        self._all_steps = None
+        self._step_templates = None
+        self._rendered.clear()
 
     @property
     def all_background_steps(self) -> list[Step]:
@@ -193,37 +460,54 @@ class ScenarioTemplate:
     def steps(self) -> list[Step]:
         """Get all steps for the scenario, including background steps.
 
+        The list is computed once, and must not be modified.
+
         Returns:
             list[Step]: A list of steps, including any background steps from the feature.
         """
-        return self.all_background_steps + self._steps
+        if self._all_steps is None:
+            self._all_steps = self.all_background_steps + self.own_steps
+        return self._all_steps
 
     def render(self, context: Mapping[str, object]) -> Scenario:
         """Render the scenario with the given context.
 
+        The scenarios most recently rendered from an example row of the template (or from an empty context) are
+        cached by the template (`RENDERED_SCENARIOS_PER_TEMPLATE`), so rendering the same row again (e.g. a rerun)
+        returns the same Scenario object.
+
         Args:
             context (Mapping[str, object]): The context for rendering steps.
 
         Returns:
             Scenario: A Scenario object with steps rendered based on the context.
         """
-        base_steps = self.all_background_steps + self._steps
-        scenario_steps = [
-            Step(
-                name=render_string(step.name, context),
-                type=step.type,
-                indent=step.indent,
-                line_number=step.line_number,
-                keyword=step.keyword,
-                datatable=step.render_datatable(step.datatable, context) if step.datatable else None,
-                docstring=render_string(step.docstring, context) if step.docstring is not None else None,
-            )
-            for step in base_steps
-        ]
+        key: tuple[Examples | None, int]
+        if isinstance(context, ExampleRow) and any(examples is context.examples for examples in self.examples):
+            key = (context.examples, context.index)
+        elif not context:
+            key = (None, 0)
+        else:
+            return self._render(context)
+        scenario = self._rendered.get(key)
+        if scenario is not None:
+            self._rendered.move_to_end(key)
+            return scenario
+        scenario = self._rendered[key] = self._render(context)
+        if len(self._rendered) > RENDERED_SCENARIOS_PER_TEMPLATE:
+            self._rendered.popitem(last=False)
+        return scenario
+
+    def _render(self, context: Mapping[str, object]) -> Scenario:
+        if self._step_templates is None:
+            self._step_templates = [StepTemplate.compile(step) for step in self.steps]
+        if self._name_template is None:
+            self._name_template = StringTemplate(self.name)
+        scenario_steps = [step_template.render(context) for step_template in self._step_templates]
         return Scenario(
             feature=self.feature,
             keyword=self.keyword,
-            name=render_string(self.name, context),
+            name=self._name_template.render(context),
             line_number=self.line_number,
             steps=scenario_steps,
             tags=self.tags,
@@ -232,7 +516,7 @@ class ScenarioTemplate:
         )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Scenario:
     """Represents a scenario with steps.
 
@@ -256,7 +540,7 @@ class Scenario:
     rule: Rule | None = None
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Step:
     """Represents a step within a scenario or background.
 
@@ -308,6 +592,9 @@ class Step:
         self.keyword = keyword
         self.datatable = datatable
         self.docstring = docstring
+        self.failed = False
+        self.scenario = None
+        self.background = None
 
     def __str__(self) -> str:
         """Return a string representation of the step.
@@ -330,14 +617,113 @@ class Step:
         Returns:
             datatable (DataTable): The rendered datatable with parameters replaced only if they exist in the context.
         """
-        rendered_datatable = copy.deepcopy(datatable)
-        for row in rendered_datatable.rows:
-            for cell in row.cells:
-                cell.value = render_string(cell.value, context)
-        return rendered_datatable
+        return StepTemplate.render_datatable(datatable, StepTemplate.compile_datatable(datatable), context)
+
+
+@dataclass(eq=False, slots=True)
+class StepTemplate:
+    """A step of a scenario template, with its name, docstring and data table cells split for rendering.
+
+    Attributes:
+        step (Step): The step of the scenario template.
+        name (StringTemplate): The template of the step name.
+        docstring (StringTemplate | None): The template of the step docstring, if any.
+        table_rows (list[list[StringTemplate] | None] | None): The templates of the data table cells, if any,
+            by row (None for the rows without placeholders).
+        is_static (bool): Whether the step has no placeholders, and renders to a copy of itself.
+    """
+
+    step: Step
+    name: StringTemplate
+    docstring: StringTemplate | None = None
+    table_rows: list[list[StringTemplate] | None] | None = None
+    is_static: bool = False
+
+    @classmethod
+    def compile(cls, step: Step) -> StepTemplate:
+        """Split the name, docstring and data table cells of a step."""
+        name = StringTemplate(step.name)
+        docstring = StringTemplate(step.docstring) if step.docstring is not None else None
+        table_rows = cls.compile_datatable(step.datatable) if step.datatable else None
+        return cls(
+            step=step,
+            name=name,
+            docstring=docstring,
+            table_rows=table_rows,
+            is_static=(
+                name.is_static
+                and (docstring is None or docstring.is_static)
+                and (table_rows is None or all(row is None for row in table_rows))
+            ),
+        )
+
+    @staticmethod
+    def compile_datatable(datatable: DataTable) -> list[list[StringTemplate] | None]:
+        """Split the cells of a data table, by row (None for the rows without placeholders)."""
+        table_rows: list[list[StringTemplate] | None] = []
+        for row in datatable.rows:
+            row_templates = [StringTemplate(cell.value) for cell in row.cells]
+            table_rows.append(None if all(template.is_static for template in row_templates) else row_templates)
+        return table_rows
+
+    def render(self, context: Mapping[str, object]) -> Step:
+        """Render the step with the given context.
+
+        Args:
+            context (Mapping[str, object]): The context for rendering the step.
+
+        Returns:
+            Step: The rendered step, a new one for each rendering (it holds the outcome of the step).
+                The steps without placeholders share the name, docstring and data table of the template step.
+        """
+        step = self.step
+        if self.is_static:
+            return Step(
+                name=step.name,
+                type=step.type,
+                indent=step.indent,
+                line_number=step.line_number,
+                keyword=step.keyword,
+                datatable=step.datatable,
+                docstring=step.docstring,
+            )
+        return Step(
+            name=self.name.render(context),
+            type=step.type,
+            indent=step.indent,
+            line_number=step.line_number,
+            keyword=step.keyword,
+            datatable=self.render_datatable(step.datatable, self.table_rows, context)
+            if step.datatable and self.table_rows is not None
+            else None,
+            docstring=self.docstring.render(context) if self.docstring is not None else None,
+        )
 
+    @staticmethod
+    def render_datatable(
+        datatable: DataTable, table_rows: list[list[StringTemplate] | None], context: Mapping[str, object]
+    ) -> DataTable:
+        """Render a data table with the templates of its cells and the given context.
 
-@dataclass(eq=False)
+        The rendered table shares the rows and cells without placeholders with the given table (copy-on-write),
+        so it must not be modified. If the table has no placeholders, it is returned as it is.
+        """
+        if all(row_templates is None for row_templates in table_rows):
+            return datatable
+        rows = []
+        for row, row_templates in zip(datatable.rows, table_rows, strict=True):
+            if row_templates is None:
+                rows.append(row)
+                continue
+            cells = [
+                cell if template.is_static else Cell(location=cell.location, value=template.render(context))
+                for cell, template in zip(row.cells, row_templates, strict=True)
+            ]
+            rows.append(Row(id=row.id, location=row.location, cells=cells))
+        return DataTable(location=datatable.location, rows=rows)
+
+
+@dataclass(eq=False, slots=True)
 class Background:
     """Represents the background steps for a feature.
 
@@ -373,18 +759,17 @@ class FeatureParser:
         self.rel_filename = os.path.join(os.path.basename(basedir), filename)
         self.encoding = encoding
 
-    def parse_steps(self, steps_data: list[GherkinStep]) -> list[Step]:
-        """Parse a list of step data into Step objects.
+    def validate_steps(self, steps_data: list[GherkinStep]) -> None:
+        """Check that the first step of a scenario or background has a type.
 
         Args:
-            steps_data (list[dict]): The list of step data.
+            steps_data (list[GherkinStep]): The list of step data.
 
-        Returns:
-            list[Step]: A list of Step objects.
+        Raises:
+            StepError: If the first step is an "And", "But" or "*" step.
         """
-
         if not steps_data:
-            return []
+            return
 
         first_step = steps_data[0]
         if first_step.keyword_type not in STEP_TYPE_BY_PARSER_KEYWORD:
@@ -395,22 +780,17 @@ class FeatureParser:
                 filename=self.abs_filename,
             )
 
-        steps = []
-        current_type = STEP_TYPE_BY_PARSER_KEYWORD[first_step.keyword_type]
-        for step in steps_data:
-            current_type = STEP_TYPE_BY_PARSER_KEYWORD.get(step.keyword_type, current_type)
-            steps.append(
-                Step(
-                    name=step.text,
-                    type=current_type,
-                    indent=step.location.column - 1,
-                    line_number=step.location.line,
-                    keyword=step.keyword.title(),
-                    datatable=step.datatable,
-                    docstring=step.docstring.content if step.docstring else None,
-                )
-            )
-        return steps
+    def parse_steps(self, steps_data: list[GherkinStep]) -> list[Step]:
+        """Parse a list of step data into Step objects.
+
+        Args:
+            steps_data (list[dict]): The list of step data.
+
+        Returns:
+            list[Step]: A list of Step objects.
+        """
+        self.validate_steps(steps_data)
+        return convert_steps(steps_data)
 
     def parse_scenario(
         self, scenario_data: GherkinScenario, feature: Feature, rule: Rule | None = None
@@ -436,8 +816,9 @@ class FeatureParser:
             description=textwrap.dedent(scenario_data.description),
             rule=rule,
         )
-        for step in self.parse_steps(scenario_data.steps):
-            scenario.add_step(step)
+        # The steps are converted when the scenario is rendered, but they are validated now
+        self.validate_steps(scenario_data.steps)
+        scenario.deferred_steps = DeferredSteps(scenario_data.steps)
 
         # Loop over multiple example tables if they exist
         for example_data in scenario_data.examples:
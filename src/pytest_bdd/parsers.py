@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import abc
+import functools
 import re as base_re
 from typing import Any, TypeVar, cast, overload
 
 import parse as base_parse
 from parse_type import cfparse as base_cfparse
 
+# Maximum number of (parser, step name) pairs whose matches are kept by `match_step`.
+STEP_ARGUMENTS_CACHE_SIZE = 4096
+
 
 class StepParser(abc.ABC):
     """Parser of the individual step."""
@@ -29,6 +33,18 @@ class StepParser(abc.ABC):
         """Match given name with the step name."""
         ...
 
+    def match(self, name: str) -> dict[str, Any] | None:
+        """Match given name with the step name, and get the step arguments in the same pass.
+
+        Parsers can override this to parse the name only once. By default, it calls `is_matching`
+        and then `parse_arguments`.
+
+        :return: `dict` of step arguments, or None if the name doesn't match
+        """
+        if not self.is_matching(name):
+            return None
+        return self.parse_arguments(name)
+
 
 class re(StepParser):
     """Regex step parser."""
@@ -52,6 +68,19 @@ class re(StepParser):
         """Match given name with the step name."""
         return bool(self.regex.fullmatch(name))
 
+    def match(self, name: str) -> dict[str, str] | None:
+        """Match given name with the step name, and get the step arguments.
+
+        :return: `dict` of step arguments, or None if the name doesn't match
+        """
+        return self.parse_arguments(name)
+
+    def _match_raw(self, name: str) -> base_re.Match[str] | None:
+        return self.regex.fullmatch(name)
+
+    def _evaluate_match(self, raw_match: base_re.Match[str]) -> dict[str, str] | None:
+        return raw_match.groupdict()
+
 
 class parse(StepParser):
     """parse step parser."""
@@ -75,6 +104,30 @@ class parse(StepParser):
         except ValueError:
             return False
 
+    def match(self, name: str) -> dict[str, Any] | None:
+        """Match given name with the step name, and get the step arguments.
+
+        :return: `dict` of step arguments, or None if the name doesn't match
+        """
+        try:
+            result = self.parser.parse(name)
+        except ValueError:
+            return None
+        if not result:
+            return None
+        return cast(dict[str, Any], result.named)
+
+    def _match_raw(self, name: str) -> base_parse.Match | None:
+        # The fields are not converted yet: the converters may return mutable values
+        return cast("base_parse.Match | None", self.parser.parse(name, evaluate_result=False))
+
+    def _evaluate_match(self, raw_match: base_parse.Match) -> dict[str, Any] | None:
+        try:
+            result = raw_match.evaluate_result()
+        except ValueError:
+            return None
+        return cast(dict[str, Any], result.named)
+
 
 class cfparse(parse):
     """cfparse step parser."""
@@ -99,6 +152,46 @@ class string(StepParser):
         """Match given name with the step name."""
         return self.name == name
 
+    def match(self, name: str) -> dict[str, Any] | None:
+        """Match given name with the step name.
+
+        :return: empty `dict`, or None if the name doesn't match
+        """
+        return {} if self.name == name else None
+
+    def _match_raw(self, name: str) -> bool | None:
+        return True if self.name == name else None
+
+    def _evaluate_match(self, raw_match: bool) -> dict[str, Any] | None:
+        return {}
+
+
+# Parsers whose matches are cached by `match_step`. Subclasses may override `match`, so only exact instances are.
+CACHED_MATCH_PARSER_TYPES: frozenset[type[StepParser]] = frozenset({string, re, parse, cfparse})
+
+
+@functools.lru_cache(maxsize=STEP_ARGUMENTS_CACHE_SIZE)
+def _match_raw_cached(parser: string | re | parse, name: str) -> Any:
+    return parser._match_raw(name)
+
+
+def match_step(parser: StepParser, name: str) -> dict[str, Any] | None:
+    """Match a step name with a parser, and get the step arguments.
+
+    For the built-in parsers, the match is cached per (parser, step name), so a step text is matched once no matter
+    how many steps and scenarios share it. The step arguments are built from the match at each call (the type
+    converters of the parse and cfparse parsers are called again), so each caller gets its own values.
+
+    :return: `dict` of step arguments, or None if the name doesn't match
+    """
+    if type(parser) not in CACHED_MATCH_PARSER_TYPES:
+        return parser.match(name)
+    cached_parser = cast("string | re | parse", parser)
+    raw_match = _match_raw_cached(cached_parser, name)
+    if raw_match is None:
+        return None
+    return cached_parser._evaluate_match(raw_match)
+
 
 TStepParser = TypeVar("TStepParser", bound=StepParser)
 
@@ -7,13 +7,25 @@ from typing import TYPE_CHECKING, ParamSpec, TypeVar, cast
 
 import pytest
 
-from . import cucumber_json, generation, gherkin_terminal_reporter, given, reporting, then, when
+from . import (
+    concurrency,
+    cucumber_json,
+    disk_cache,
+    generation,
+    gherkin_terminal_reporter,
+    given,
+    reporting,
+    then,
+    when,
+)
+from .scenario import bdd_hook_callers_registry, bind_scenario_steps, drop_step_fixturedef_registry
 from .utils import CONFIG_STACK
 
 if TYPE_CHECKING:
     from _pytest.config import Config, PytestPluginManager
     from _pytest.config.argparsing import Parser
     from _pytest.fixtures import FixtureRequest
+    from _pytest.main import Session
     from _pytest.nodes import Item
     from _pytest.runner import CallInfo
     from pluggy._result import _Result
@@ -58,19 +70,60 @@ def pytest_addoption(parser: Parser) -> None:
     """Add pytest-bdd options."""
     add_bdd_ini(parser)
     cucumber_json.add_options(parser)
+    disk_cache.add_options(parser)
     generation.add_options(parser)
     gherkin_terminal_reporter.add_options(parser)
 
 
 def add_bdd_ini(parser: Parser) -> None:
     parser.addini("bdd_features_base_dir", "Base features directory.")
+    parser.addini(
+        "bdd_features_ignore",
+        "Glob patterns of the directories and feature files skipped when looking for feature files.",
+        type="linelist",
+        default=[],
+    )
+    parser.addini(
+        "bdd_feature_cache",
+        "Store the parsed features in the pytest cache directory (only enable it if the cache directory is trusted).",
+        type="bool",
+        default=False,
+    )
+    parser.addini(
+        "bdd_parse_workers",
+        "Number of processes parsing the feature files found by `scenarios` (or 'auto' for one per CPU).",
+        default="1",
+    )
+    parser.addini(
+        "bdd_event_loop_factory",
+        "Function creating the event loop of the scenarios with async steps, "
+        "in the form 'module:function' (default: asyncio.new_event_loop).",
+    )
+    parser.addini(
+        "bdd_concurrent_scenarios",
+        "Maximum number of scenarios tagged @concurrent run concurrently on one event loop (1 to run them one at a time).",
+        default="1",
+    )
+    parser.addini(
+        "bdd_bind_steps_at_collection",
+        "Bind the scenario steps to their step definitions at collection time.",
+        type="bool",
+        default=False,
+    )
+
+
+def pytest_plugin_registered(manager: PytestPluginManager) -> None:
+    # The new plugin may implement the pytest-bdd hooks
+    bdd_hook_callers_registry.pop(manager, None)
 
 
 @pytest.hookimpl(trylast=True)
 def pytest_configure(config: Config) -> None:
     """Configure all subplugins."""
     CONFIG_STACK.append(config)
+    concurrency.configure(config)
     cucumber_json.configure(config)
+    disk_cache.configure(config)
     gherkin_terminal_reporter.configure(config)
 
 
@@ -78,9 +131,22 @@ def pytest_unconfigure(config: Config) -> None:
     """Unconfigure all subplugins."""
     if CONFIG_STACK:
         CONFIG_STACK.pop()
+    fixturemanager = config.pluginmanager.get_plugin("funcmanage")
+    if fixturemanager is not None:
+        drop_step_fixturedef_registry(fixturemanager)
     cucumber_json.unconfigure(config)
 
 
+def pytest_runtestloop(session: Session) -> bool | None:
+    return concurrency.runtestloop(session)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session: Session, config: Config, items: list[Item]) -> None:
+    if config.getini("bdd_bind_steps_at_collection"):
+        bind_scenario_steps(items, session._fixturemanager)
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item: Item, call: CallInfo) -> Generator[None, _Result, None]:
     outcome = yield
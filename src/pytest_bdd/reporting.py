@@ -96,11 +96,23 @@ class StepReport:
     def finalize(self, failed: bool) -> None:
         """Stop collecting information and finalize the report.
 
+        The stop time of a step whose timing was already recorded (see `record_timing`) is kept.
+
         :param bool failed: Whether the step execution is failed.
         """
-        self.stopped = time.perf_counter()
+        if self.stopped is None:
+            self.stopped = time.perf_counter()
         self.failed = failed
 
+    def record_timing(self, started: float, stopped: float) -> None:
+        """Record the time taken by a step function run outside of its hooks (e.g. in a worker thread).
+
+        :param started: Start time of the step function (`time.perf_counter`).
+        :param stopped: Stop time of the step function (`time.perf_counter`).
+        """
+        self.started = started
+        self.stopped = stopped
+
     @property
     def duration(self) -> float:
         """Step execution duration.
@@ -134,6 +146,20 @@ class ScenarioReport:
         """
         return self.step_reports[-1]
 
+    def get_step_report(self, step: Step) -> StepReport:
+        """Get the report of a step.
+
+        The steps are usually reported one after the other, but the independent steps are run together,
+        so the current step report is not always the report of the step.
+
+        :param step: Step.
+        :return: Step report.
+        """
+        for step_report in reversed(self.step_reports):
+            if step_report.step is step:
+                return step_report
+        raise KeyError(step)
+
     def add_step_report(self, step_report: StepReport) -> None:
         """Add new step report.
 
@@ -180,9 +206,13 @@ class ScenarioReport:
 
         return serialized
 
-    def fail(self) -> None:
-        """Stop collecting information and finalize the report as failed."""
-        self.current_step_report.finalize(failed=True)
+    def fail(self, step: Step | None = None) -> None:
+        """Stop collecting information and finalize the report as failed.
+
+        :param step: Failed step, the current step by default.
+        """
+        step_report = self.current_step_report if step is None else self.get_step_report(step)
+        step_report.finalize(failed=True)
         remaining_steps = self.scenario.steps[len(self.step_reports) :]
 
         # Fail the rest of the steps and make reports.
@@ -223,7 +253,7 @@ def step_error(
     exception: Exception,
 ) -> None:
     """Finalize the step report as failed."""
-    scenario_reports_registry[request.node].fail()
+    scenario_reports_registry[request.node].fail(step)
 
 
 def before_step(
@@ -246,4 +276,11 @@ def after_step(
     step_func_args: dict,
 ) -> None:
     """Finalize the step report as successful."""
-    scenario_reports_registry[request.node].current_step_report.finalize(failed=False)
+    scenario_reports_registry[request.node].get_step_report(step).finalize(failed=False)
+
+
+def record_step_timing(request: FixtureRequest, step: Step, started: float, stopped: float) -> None:
+    """Record the time taken by the step function of an independent step, run in a worker thread."""
+    scenario_report = scenario_reports_registry.get(request.node)
+    if scenario_report is not None:
+        scenario_report.get_step_report(step).record_timing(started, stopped)
@@ -14,21 +14,30 @@ test_publish_article = scenario(
 from __future__ import annotations
 
 import contextlib
+import itertools
 import logging
 import os
 import re
-from collections.abc import Callable, Iterable, Iterator
-from inspect import signature
-from typing import TYPE_CHECKING, TypeVar, cast
+import warnings
+from collections.abc import Awaitable, Callable, Collection, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 from weakref import WeakKeyDictionary
 
 import pytest
 from _pytest.fixtures import FixtureDef, FixtureManager, FixtureRequest, call_fixture_func
+from _pytest.mark.structures import ParameterSet
 from _pytest.outcomes import Failed
 
-from . import exceptions
-from .compat import getfixturedefs, inject_fixture
+from . import exceptions, reporting
+from .compat import get_hookexec, getfixturedefs, inject_fixture, is_hookexec_traced, observe_fixture_registrations
+from .event_loop import ScenarioEventLoop, run_sync
 from .feature import get_feature, get_features
+from .independent_steps import IndependentStepCall, is_independent
+from .parser import ExampleRow
+from .parsers import match_step
+from .step_index import step_definition_index
 from .steps import StepFunctionContext, get_step_fixture_name, step_function_context_registry
 from .utils import (
     CONFIG_STACK,
@@ -40,8 +49,8 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
-    from _pytest.mark.structures import ParameterSet
-    from _pytest.nodes import Node
+    from _pytest.config import PytestPluginManager
+    from _pytest.nodes import Item, Node
 
     from .parser import Feature, Scenario, ScenarioTemplate, Step
 
@@ -56,30 +65,119 @@ STEP_ARGUMENT_DATATABLE = "datatable"
 STEP_ARGUMENT_DOCSTRING = "docstring"
 STEP_ARGUMENTS_RESERVED_NAMES = {STEP_ARGUMENT_DATATABLE, STEP_ARGUMENT_DOCSTRING}
 
+BDD_PLUGIN_MODULE = "pytest_bdd.plugin"
+
 scenario_wrapper_template_registry: WeakKeyDictionary[Callable[..., object], ScenarioTemplate] = WeakKeyDictionary()
+# The coroutine functions running the scenarios on a running event loop, by scenario wrapper (see `concurrency`)
+async_scenario_wrapper_registry: WeakKeyDictionary[Callable[..., object], Callable[..., Awaitable[object]]] = (
+    WeakKeyDictionary()
+)
+# Memoized results of `get_fixturedefs_for_step`, by visibility scope and (step type, step name)
+step_fixturedefs_cache_registry: WeakKeyDictionary[
+    Node, dict[tuple[str, str], tuple[tuple[int, int], list[FixtureDef[object]]]]
+] = WeakKeyDictionary()
+step_fixturedef_registry_by_fixturemanager: WeakKeyDictionary[FixtureManager, StepFixtureDefRegistry] = (
+    WeakKeyDictionary()
+)
+scenario_plan_registry: WeakKeyDictionary[Item, ScenarioPlan] = WeakKeyDictionary()
+# Callers of the pytest-bdd hooks, by hook name. Dropped whenever a plugin is registered.
+bdd_hook_callers_registry: WeakKeyDictionary[PytestPluginManager, dict[str, BddHookCaller]] = WeakKeyDictionary()
 
 
-def find_fixturedefs_for_step(step: Step, fixturemanager: FixtureManager, node: Node) -> Iterable[FixtureDef[object]]:
-    """Find the fixture defs that can parse a step."""
-    # happens to be that _arg2fixturedefs is changed during the iteration so we use a copy
-    fixture_def_by_name = list(fixturemanager._arg2fixturedefs.items())
-    for fixturename, fixturedefs in fixture_def_by_name:
-        for _, fixturedef in enumerate(fixturedefs):
-            step_func_context = step_function_context_registry.get(fixturedef.func)
-            if step_func_context is None:
-                continue
+@dataclass
+class BoundStep:
+    """A step bound to its step definition at collection time."""
 
-            if step_func_context.type is not None and step_func_context.type != step.type:
-                continue
+    step: Step
+    context: StepFunctionContext | None
+    parsed_args: dict[str, Any] | None
 
-            match = step_func_context.parser.is_matching(step.name)
-            if not match:
-                continue
 
-            fixturedefs = list(getfixturedefs(fixturemanager, fixturename, node) or [])
-            if fixturedef not in fixturedefs:
-                continue
+@dataclass
+class ScenarioPlan:
+    """The rendered scenario of a test item, with its steps bound to their step definitions."""
+
+    scenario: Scenario
+    steps: list[BoundStep]
+
+
+class StepFixtureDefRegistry:
+    """The fixture definitions of the step definitions registered in a fixture manager.
+
+    It is kept up to date as fixtures are registered, and it only ever looks at the step definition fixtures.
+    Each fixture definition gets a rank, (order of its fixture name in the fixture table, registration order),
+    which is the order in which pytest would consider them.
+    """
+
+    def __init__(self, arg2fixturedefs: Mapping[str, Sequence[FixtureDef[object]]]) -> None:
+        self.version = 0
+        # Stops keeping the registry up to date (see `observe_fixture_registrations`)
+        self.stop_observing: Callable[[], None] | None = None
+        self._arg2fixturedefs = arg2fixturedefs
+        self._sequence = itertools.count()
+        self._rank_by_fixturename: dict[str, int] = {}
+        self._known: set[FixtureDef[object]] = set()
+        self._entries_by_step_func: dict[Callable[..., object], list[tuple[tuple[int, int], FixtureDef[object]]]] = {}
+
+    def sync(self, fixturename: str | None = None) -> None:
+        """Register the new step definition fixtures.
+
+        :param fixturename: Name of the fixture that was registered, or None to check all the fixtures.
+        """
+        fixturenames: Iterable[str] = self._arg2fixturedefs if fixturename is None else (fixturename,)
+        for name in fixturenames:
+            for fixturedef in self._arg2fixturedefs.get(name, ()):
+                if fixturedef in self._known or fixturedef.func not in step_function_context_registry:
+                    continue
+                self._known.add(fixturedef)
+                sequence = next(self._sequence)
+                rank = (self._rank_by_fixturename.setdefault(name, sequence), sequence)
+                self._entries_by_step_func.setdefault(fixturedef.func, []).append((rank, fixturedef))
+                self.version += 1
+
+    def get(self, step_func: Callable[..., object]) -> list[tuple[tuple[int, int], FixtureDef[object]]]:
+        """Get the ranked fixture definitions providing the given step function marker."""
+        return self._entries_by_step_func.get(step_func, [])
+
+
+def get_step_fixturedef_registry(fixturemanager: FixtureManager) -> StepFixtureDefRegistry:
+    """Get the step definition fixture registry of a fixture manager, creating it on first use."""
+    registry = step_fixturedef_registry_by_fixturemanager.get(fixturemanager)
+    if registry is None:
+        registry = StepFixtureDefRegistry(fixturemanager._arg2fixturedefs)
+        registry.sync()
+        registry.stop_observing = observe_fixture_registrations(fixturemanager, registry.sync)
+        step_fixturedef_registry_by_fixturemanager[fixturemanager] = registry
+    return registry
+
+
+def drop_step_fixturedef_registry(fixturemanager: FixtureManager) -> None:
+    """Drop the step definition fixture registry of a fixture manager, and stop keeping it up to date."""
+    registry = step_fixturedef_registry_by_fixturemanager.pop(fixturemanager, None)
+    if registry is not None and registry.stop_observing is not None:
+        registry.stop_observing()
+
+
+def find_fixturedefs_for_step(step: Step, fixturemanager: FixtureManager, node: Node) -> Iterable[FixtureDef[object]]:
+    """Find the fixture defs that can parse a step.
 
+    The candidates are the fixtures of the step definitions that match the step (according to the step definition
+    index). They are yielded in the order of the fixture table, so that the precedence between them is the one
+    pytest would apply.
+    """
+    registry = get_step_fixturedef_registry(fixturemanager)
+    candidates = sorted(
+        (entry for step_func in step_definition_index.find(step) for entry in registry.get(step_func)),
+        key=lambda entry: entry[0],
+    )
+
+    visible_fixturedefs_by_name: dict[str, Sequence[FixtureDef[object]]] = {}
+    for _, fixturedef in candidates:
+        visible_fixturedefs = visible_fixturedefs_by_name.get(fixturedef.argname)
+        if visible_fixturedefs is None:
+            visible_fixturedefs = getfixturedefs(fixturemanager, fixturedef.argname, node) or ()
+            visible_fixturedefs_by_name[fixturedef.argname] = visible_fixturedefs
+        if fixturedef in visible_fixturedefs:
             yield fixturedef
 
 
@@ -130,17 +228,38 @@ def iterparentnodeids(nodeid: str) -> Iterator[str]:
         yield nodeid
 
 
-@contextlib.contextmanager
-def inject_fixturedefs_for_step(step: Step, fixturemanager: FixtureManager, node: Node) -> Iterator[None]:
-    """Inject fixture definitions that can parse a step.
+def get_visibility_scope(node: Node) -> Node:
+    """Get the node that determines which step definitions are visible to the given node.
+
+    Step definitions are never registered on the items themselves, so all the items of a collector
+    (e.g. the scenarios of a module, or the parametrizations of an outline) see the same ones.
+    """
+    if isinstance(node, pytest.Item) and node.parent is not None:
+        return node.parent
+    return node
+
 
-    We fist iterate over all the fixturedefs that can parse the step.
+def get_fixturedefs_for_step(step: Step, fixturemanager: FixtureManager, node: Node) -> list[FixtureDef[object]]:
+    """Get the fixture defs that can parse a step, sorted by precedence (the last one wins).
+
+    We fist find all the fixturedefs that can parse the step.
 
     Then we sort them by their "path" (list of parent IDs) so that we respect the fixture scoping rules.
 
-    Finally, we inject them into the request.
+    The result is memoized per visibility scope, step type and step name, until the visibility scope node is gone.
+    A memoized result is used only while no step definition has been declared and no step definition fixture
+    has been registered since.
     """
-    bdd_name = get_step_fixture_name(step=step)
+    visibility_scope = get_visibility_scope(node)
+    cache = step_fixturedefs_cache_registry.get(visibility_scope)
+    if cache is None:
+        cache = step_fixturedefs_cache_registry[visibility_scope] = {}
+
+    signature = (step_definition_index.version, get_step_fixturedef_registry(fixturemanager).version)
+    key = (step.type, step.name)
+    cached = cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
     fixturedefs = list(find_fixturedefs_for_step(step=step, fixturemanager=fixturemanager, node=node))
 
@@ -152,12 +271,28 @@ def inject_fixturedefs_for_step(step: Step, fixturemanager: FixtureManager, node
 
     fixturedefs.sort(key=lambda x: get_fixture_path(x))
 
+    cache[key] = (signature, fixturedefs)
+    return fixturedefs
+
+
+@contextlib.contextmanager
+def inject_fixturedefs_for_step(step: Step, fixturemanager: FixtureManager, node: Node) -> Iterator[None]:
+    """Inject fixture definitions that can parse a step.
+
+    We get the fixturedefs that can parse the step, sorted by precedence.
+
+    Finally, we inject them into the request.
+    """
+    bdd_name = get_step_fixture_name(step=step)
+
+    fixturedefs = get_fixturedefs_for_step(step=step, fixturemanager=fixturemanager, node=node)
+
     if not fixturedefs:
         yield
         return
 
     logger.debug("Adding providers for fixture %r: %r", bdd_name, fixturedefs)
-    fixturemanager._arg2fixturedefs[bdd_name] = fixturedefs
+    fixturemanager._arg2fixturedefs[bdd_name] = list(fixturedefs)
 
     try:
         yield
@@ -185,13 +320,19 @@ def get_step_function(request: FixtureRequest, step: Step) -> StepFunctionContex
             return None
 
 
-def parse_step_arguments(step: Step, context: StepFunctionContext) -> dict[str, object]:
-    """Parse step arguments."""
-    parsed_args = context.parser.parse_arguments(step.name)
+def parse_step_arguments(
+    step: Step, context: StepFunctionContext, parsed_args: dict[str, Any] | None = None
+) -> dict[str, object]:
+    """Parse step arguments.
 
-    assert parsed_args is not None, (
-        f"Unexpected `NoneType` returned from parse_arguments(...) in parser: {context.parser!r}"
-    )
+    :param step: Step.
+    :param context: Step function context.
+    :param parsed_args: Arguments already parsed by the step parser (before conversion), if any.
+    """
+    if parsed_args is None:
+        parsed_args = match_step(context.parser, step.name)
+
+    assert parsed_args is not None, f"Unexpected `NoneType` returned from match(...) in parser: {context.parser!r}"
 
     reserved_args = set(parsed_args.keys()) & STEP_ARGUMENTS_RESERVED_NAMES
     if reserved_args:
@@ -206,13 +347,86 @@ def parse_step_arguments(step: Step, context: StepFunctionContext) -> dict[str,
     return converted_args
 
 
-def _execute_step_function(
-    request: FixtureRequest, scenario: Scenario, step: Step, context: StepFunctionContext
-) -> None:
-    """Execute step function."""
+class BddHookCaller:
+    """Call a pytest-bdd hook, without going through pluggy when only pytest-bdd implements it.
+
+    The hook implementations of pytest-bdd itself (the reporting) are then called directly,
+    and a hook that no plugin implements is not called at all.
+    """
+
+    def __init__(self, pluginmanager: PytestPluginManager, name: str) -> None:
+        self.hook_caller = getattr(pluginmanager.hook, name)
+        self.hookexec = get_hookexec(pluginmanager)
+        hookimpls = self.hook_caller.get_hookimpls()
+        self.direct_calls: list[tuple[Callable[..., object], tuple[str, ...]]] | None = None
+        # The hook calls must go through pluggy when they are traced (e.g. `--debug` or `pytester.inline_run`)
+        if not is_hookexec_traced(self.hookexec) and all(
+            hookimpl.function.__module__ == BDD_PLUGIN_MODULE
+            and not hookimpl.hookwrapper
+            and not getattr(hookimpl, "wrapper", False)
+            for hookimpl in hookimpls
+        ):
+            # Same order as pluggy: the last registered (and `tryfirst`) implementations first
+            self.direct_calls = [(hookimpl.function, tuple(hookimpl.argnames)) for hookimpl in reversed(hookimpls)]
+
+    def __call__(self, **kwargs: object) -> None:
+        if self.direct_calls is None:
+            self.hook_caller(**kwargs)
+            return
+        for function, argnames in self.direct_calls:
+            function(*[kwargs[argname] for argname in argnames])
+
+
+def get_bdd_hook_caller(request: FixtureRequest, name: str) -> BddHookCaller:
+    """Get the caller of a pytest-bdd hook.
+
+    Which plugins implement the hook is only looked up again after a plugin is registered (e.g. a conftest),
+    or when the hook calls start or stop being traced.
+    """
+    pluginmanager = request.config.pluginmanager
+    hook_callers = bdd_hook_callers_registry.get(pluginmanager)
+    if hook_callers is None:
+        hook_callers = bdd_hook_callers_registry[pluginmanager] = {}
+    hook_caller = hook_callers.get(name)
+    if hook_caller is None or hook_caller.hookexec is not get_hookexec(pluginmanager):
+        hook_caller = hook_callers[name] = BddHookCaller(pluginmanager, name)
+    return hook_caller
+
+
+def _get_step_function_kwargs(
+    request: FixtureRequest, step: Step, context: StepFunctionContext, parsed_args: dict[str, Any] | None
+) -> dict[str, object]:
+    """Get the arguments of a step function: the step arguments it accepts, and the fixtures it requires."""
     __tracebackhide__ = True
+    call_plan = context.call_plan
+    converted_args = parse_step_arguments(step=step, context=context, parsed_args=parsed_args)
+
+    # Filter out the arguments that are not in the function signature
+    kwargs = {k: v for k, v in converted_args.items() if k in call_plan.parameters}
 
-    func_sig = signature(context.step_func)
+    if STEP_ARGUMENT_DATATABLE in call_plan.parameters and step.datatable is not None:
+        kwargs[STEP_ARGUMENT_DATATABLE] = step.datatable.raw()
+    if STEP_ARGUMENT_DOCSTRING in call_plan.parameters and step.docstring is not None:
+        kwargs[STEP_ARGUMENT_DOCSTRING] = step.docstring
+
+    # Fill the missing arguments requesting the fixture values
+    kwargs |= {arg: request.getfixturevalue(arg) for arg in call_plan.required_args if arg not in kwargs}
+    return kwargs
+
+
+async def _execute_step_function(
+    request: FixtureRequest,
+    scenario: Scenario,
+    step: Step,
+    context: StepFunctionContext,
+    parsed_args: dict[str, Any] | None,
+    event_loop: ScenarioEventLoop,
+) -> None:
+    """Execute step function.
+
+    :param event_loop: Event loop of the scenario, running the async step functions.
+    """
+    __tracebackhide__ = True
 
     kw = {
         "request": request,
@@ -222,140 +436,377 @@ def _execute_step_function(
         "step_func": context.step_func,
         "step_func_args": {},
     }
-    request.config.hook.pytest_bdd_before_step(**kw)
+    get_bdd_hook_caller(request, "pytest_bdd_before_step")(**kw)
 
     try:
-        parsed_args = parse_step_arguments(step=step, context=context)
+        kwargs = _get_step_function_kwargs(request, step, context, parsed_args)
+        kw["step_func_args"] = kwargs
 
-        # Filter out the arguments that are not in the function signature
-        kwargs = {k: v for k, v in parsed_args.items() if k in func_sig.parameters}
+        get_bdd_hook_caller(request, "pytest_bdd_before_step_call")(**kw)
 
-        if STEP_ARGUMENT_DATATABLE in func_sig.parameters and step.datatable is not None:
-            kwargs[STEP_ARGUMENT_DATATABLE] = step.datatable.raw()
-        if STEP_ARGUMENT_DOCSTRING in func_sig.parameters and step.docstring is not None:
-            kwargs[STEP_ARGUMENT_DOCSTRING] = step.docstring
+        if context.call_plan.is_async:
+            return_value = await event_loop.wait(event_loop.call_step_func(context.step_func, kwargs))
+        else:
+            # Execute the step as if it was a pytest fixture using `call_fixture_func`,
+            # so that we can allow "yield" statements in it
+            return_value = call_fixture_func(fixturefunc=context.step_func, request=request, kwargs=kwargs)
 
-        # Fill the missing arguments requesting the fixture values
-        kwargs |= {
-            arg: request.getfixturevalue(arg) for arg in get_required_args(context.step_func) if arg not in kwargs
-        }
+    except (Exception, Failed) as exception:
+        get_bdd_hook_caller(request, "pytest_bdd_step_error")(exception=exception, **kw)
+        raise
 
-        kw["step_func_args"] = kwargs
+    if context.target_fixture is not None:
+        inject_fixture(request, context.target_fixture, return_value)
+
+    get_bdd_hook_caller(request, "pytest_bdd_after_step")(**kw)
 
-        request.config.hook.pytest_bdd_before_step_call(**kw)
 
-        # Execute the step as if it was a pytest fixture using `call_fixture_func`,
-        # so that we can allow "yield" statements in it
-        return_value = call_fixture_func(fixturefunc=context.step_func, request=request, kwargs=kwargs)
+class IndependentSteps:
+    """Consecutive independent steps of a scenario, whose step functions run together on a thread pool.
 
+    :param request: Request of the scenario.
+    :param scenario: Scenario.
+    :param steps: Steps with their step definition and parsed arguments.
+    """
+
+    def __init__(
+        self,
+        request: FixtureRequest,
+        scenario: Scenario,
+        steps: list[tuple[Step, StepFunctionContext, dict[str, Any] | None]],
+    ) -> None:
+        self.request = request
+        self.scenario = scenario
+        self.steps = steps
+        self.calls: list[tuple[dict[str, Any], StepFunctionContext, IndependentStepCall, Future[object]]] = []
+        # The hook arguments of the step being started, until its step function is submitted
+        self.starting: dict[str, Any] | None = None
+
+    @property
+    def futures(self) -> list[Future[object]]:
+        return [future for _, _, _, future in self.calls]
+
+    def start(self, executor: ThreadPoolExecutor) -> None:
+        """Call the hooks before the steps, and submit their step functions to the thread pool.
+
+        When a step cannot be started (e.g. one of its fixtures fails), the steps after it are not started.
+        """
+        __tracebackhide__ = True
+        for step, context, parsed_args in self.steps:
+            kw: dict[str, Any] = {
+                "request": self.request,
+                "feature": self.scenario.feature,
+                "scenario": self.scenario,
+                "step": step,
+                "step_func": context.step_func,
+                "step_func_args": {},
+            }
+            get_bdd_hook_caller(self.request, "pytest_bdd_before_step")(**kw)
+            self.starting = kw
+            kwargs = _get_step_function_kwargs(self.request, step, context, parsed_args)
+            kw["step_func_args"] = kwargs
+            get_bdd_hook_caller(self.request, "pytest_bdd_before_step_call")(**kw)
+            call = IndependentStepCall(context.step_func, kwargs)
+            self.calls.append((kw, context, call, executor.submit(call)))
+            self.starting = None
+
+    def finish(self, error: Exception | Failed | None = None) -> None:
+        """Report the steps once their step functions are done, in the order of the steps.
+
+        :param error: Exception raised while starting a step, reported after the steps started before it.
+                      The caller raises it.
+
+        :raises: The exception of the first failed step, if any (and no step failed to start).
+        """
+        __tracebackhide__ = True
+        first_exception: BaseException | None = None
+        for kw, context, call, future in self.calls:
+            # The teardown of the generator step functions, in the order of the steps
+            if call.generator is not None:
+                self.request.addfinalizer(call.teardown)
+            if call.started is not None and call.stopped is not None:
+                reporting.record_step_timing(self.request, kw["step"], call.started, call.stopped)
+
+            exception = future.exception()
+            if exception is None:
+                if context.target_fixture is not None:
+                    inject_fixture(self.request, context.target_fixture, future.result())
+                get_bdd_hook_caller(self.request, "pytest_bdd_after_step")(**kw)
+                continue
+            if isinstance(exception, (Exception, Failed)):
+                get_bdd_hook_caller(self.request, "pytest_bdd_step_error")(exception=exception, **kw)
+            if first_exception is None:
+                first_exception = exception
+
+        if error is not None:
+            if self.starting is not None:
+                get_bdd_hook_caller(self.request, "pytest_bdd_step_error")(exception=error, **self.starting)
+            return
+
+        if first_exception is not None:
+            raise first_exception
+
+
+async def _execute_independent_steps(
+    request: FixtureRequest,
+    scenario: Scenario,
+    steps: list[tuple[Step, StepFunctionContext, dict[str, Any] | None]],
+    event_loop: ScenarioEventLoop,
+) -> None:
+    """Execute consecutive independent steps, running their step functions concurrently on a thread pool.
+
+    :param event_loop: Event loop of the scenario, waiting for the step functions.
+    """
+    __tracebackhide__ = True
+    independent_steps = IndependentSteps(request, scenario, steps)
+    try:
+        with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="pytest-bdd-step") as executor:
+            try:
+                independent_steps.start(executor)
+            finally:
+                # Wait for the step functions started so far
+                await event_loop.wait_futures(independent_steps.futures)
     except (Exception, Failed) as exception:
-        request.config.hook.pytest_bdd_step_error(exception=exception, **kw)
+        independent_steps.finish(error=exception)
         raise
+    independent_steps.finish()
 
-    if context.target_fixture is not None:
-        inject_fixture(request, context.target_fixture, return_value)
 
-    request.config.hook.pytest_bdd_after_step(**kw)
+def _iter_scenario_step_groups(
+    feature: Feature, scenario: Scenario, request: FixtureRequest, plan: ScenarioPlan | None
+) -> Iterator[list[tuple[Step, StepFunctionContext, dict[str, Any] | None]]]:
+    """Iterate the steps of a scenario with their step definition, and their parsed arguments if already known.
 
+    The steps are grouped: a group is either a single step, or consecutive independent steps run together.
 
-def _execute_scenario(feature: Feature, scenario: Scenario, request: FixtureRequest) -> None:
+    :raises StepDefinitionNotFoundError: when a step has no step definition (after the steps before it).
+    """
+    __tracebackhide__ = True
+    bound_steps = plan.steps if plan is not None else (BoundStep(step, None, None) for step in scenario.steps)
+    independent_steps: list[tuple[Step, StepFunctionContext, dict[str, Any] | None]] = []
+    for bound_step in bound_steps:
+        step = bound_step.step
+        if plan is not None:
+            step_func_context = bound_step.context
+        else:
+            step_func_context = get_step_function(request=request, step=step)
+        if step_func_context is not None and is_independent(step_func_context):
+            independent_steps.append((step, step_func_context, bound_step.parsed_args))
+            continue
+
+        if independent_steps:
+            yield independent_steps
+            independent_steps = []
+        if step_func_context is None:
+            exc = exceptions.StepDefinitionNotFoundError(
+                f"Step definition is not found: {step}. "
+                f'Line {step.line_number} in scenario "{scenario.name}" in the feature "{scenario.feature.filename}"'
+            )
+            get_bdd_hook_caller(request, "pytest_bdd_step_func_lookup_error")(
+                request=request, feature=feature, scenario=scenario, step=step, exception=exc
+            )
+            raise exc
+        yield [(step, step_func_context, bound_step.parsed_args)]
+
+    if independent_steps:
+        yield independent_steps
+
+
+async def _execute_scenario(
+    feature: Feature,
+    scenario: Scenario,
+    request: FixtureRequest,
+    event_loop: ScenarioEventLoop,
+    plan: ScenarioPlan | None = None,
+) -> None:
     """Execute the scenario.
 
     :param feature: Feature.
     :param scenario: Scenario.
     :param request: request.
+    :param event_loop: Event loop of the scenario, running all its async steps.
+    :param plan: Steps bound at collection time. When given, the steps are not looked up again.
     """
     __tracebackhide__ = True
-    request.config.hook.pytest_bdd_before_scenario(request=request, feature=feature, scenario=scenario)
+    get_bdd_hook_caller(request, "pytest_bdd_before_scenario")(request=request, feature=feature, scenario=scenario)
 
     try:
-        for step in scenario.steps:
-            step_func_context = get_step_function(request=request, step=step)
-            if step_func_context is None:
-                exc = exceptions.StepDefinitionNotFoundError(
+        for steps in _iter_scenario_step_groups(feature, scenario, request, plan):
+            if len(steps) > 1:
+                await _execute_independent_steps(request, scenario, steps, event_loop)
+                continue
+            step, step_func_context, parsed_args = steps[0]
+            await _execute_step_function(request, scenario, step, step_func_context, parsed_args, event_loop)
+    finally:
+        get_bdd_hook_caller(request, "pytest_bdd_after_scenario")(request=request, feature=feature, scenario=scenario)
+
+
+def bind_step(step: Step, fixturemanager: FixtureManager, node: Node) -> BoundStep:
+    """Bind a step to the step definition that would be used to execute it in the given node."""
+    fixturedefs = get_fixturedefs_for_step(step=step, fixturemanager=fixturemanager, node=node)
+    if not fixturedefs:
+        return BoundStep(step=step, context=None, parsed_args=None)
+
+    context = step_function_context_registry[fixturedefs[-1].func]
+    return BoundStep(step=step, context=context, parsed_args=match_step(context.parser, step.name))
+
+
+def bind_scenario_steps(items: Iterable[Item], fixturemanager: FixtureManager) -> None:
+    """Bind the steps of the scenario items to their step definitions.
+
+    The plan of each item is stored in `scenario_plan_registry`, and the scenario wrapper uses it instead of
+    looking up the step definitions when the test runs.
+    Steps without a step definition are reported with a warning (once per step). The test still fails
+    with `StepDefinitionNotFoundError` when it runs.
+    """
+    reported: set[tuple[str, int, str]] = set()
+    for item in items:
+        templated_scenario = registry_get_safe(scenario_wrapper_template_registry, getattr(item, "obj", None))
+        if templated_scenario is None:
+            continue
+
+        callspec = getattr(item, "callspec", None)
+        example = callspec.params.get("_pytest_bdd_example", {}) if callspec is not None else {}
+        scenario = templated_scenario.render(example)
+
+        bound_steps = [bind_step(step=step, fixturemanager=fixturemanager, node=item) for step in scenario.steps]
+        scenario_plan_registry[item] = ScenarioPlan(scenario=scenario, steps=bound_steps)
+
+        for bound_step in bound_steps:
+            step = bound_step.step
+            key = (scenario.feature.filename, step.line_number, step.name)
+            if bound_step.context is not None or key in reported:
+                continue
+            reported.add(key)
+            warnings.warn_explicit(
+                exceptions.StepDefinitionNotFoundWarning(
                     f"Step definition is not found: {step}. "
                     f'Line {step.line_number} in scenario "{scenario.name}" in the feature "{scenario.feature.filename}"'
-                )
-                request.config.hook.pytest_bdd_step_func_lookup_error(
-                    request=request, feature=feature, scenario=scenario, step=step, exception=exc
-                )
-                raise exc
-            _execute_step_function(request, scenario, step, step_func_context)
-    finally:
-        request.config.hook.pytest_bdd_after_scenario(request=request, feature=feature, scenario=scenario)
+                ),
+                category=exceptions.StepDefinitionNotFoundWarning,
+                filename=scenario.feature.filename,
+                lineno=step.line_number,
+            )
 
 
 def _get_scenario_decorator(
     feature: Feature, feature_name: str, templated_scenario: ScenarioTemplate, scenario_name: str
-) -> Callable[[Callable[..., T]], Callable[[FixtureRequest, dict[str, str]], T]]:
+) -> Callable[[Callable[..., T]], Callable[[FixtureRequest, Mapping[str, str]], T]]:
     # HACK: Ideally we would use `def decorator(fn)`, but we want to return a custom exception
     # when the decorator is misused.
     # Pytest inspect the signature to determine the required fixtures, and in that case it would look
     # for a fixture called "fn" that doesn't exist (if it exists then it's even worse).
     # It will error with a "fixture 'fn' not found" message instead.
     # We can avoid this hack by using a pytest hook and check for misuse instead.
-    def decorator(*args: Callable[..., T]) -> Callable[[FixtureRequest, dict[str, str]], T]:
+    def decorator(*args: Callable[..., T]) -> Callable[[FixtureRequest, Mapping[str, str]], T]:
         if not args:
             raise exceptions.ScenarioIsDecoratorOnly(
                 "scenario function can only be used as a decorator. Refer to the documentation."
             )
         [fn] = args
-        func_args = get_required_args(fn)
+        return _make_scenario_wrapper(
+            fn,
+            get_required_args(fn),
+            feature=feature,
+            feature_name=feature_name,
+            templated_scenario=templated_scenario,
+            scenario_name=scenario_name,
+        )
 
-        def scenario_wrapper(request: FixtureRequest, _pytest_bdd_example: dict[str, str]) -> T:
-            __tracebackhide__ = True
-            scenario = templated_scenario.render(_pytest_bdd_example)
-            _execute_scenario(feature, scenario, request)
-            fixture_values = [request.getfixturevalue(arg) for arg in func_args]
-            return fn(*fixture_values)
+    return decorator
 
-        if func_args:
-            # We need to tell pytest that the original function requires its fixtures,
-            # otherwise indirect fixtures would not work.
-            scenario_wrapper = pytest.mark.usefixtures(*func_args)(scenario_wrapper)
 
-        example_parametrizations = collect_example_parametrizations(templated_scenario)
-        if example_parametrizations is not None:
-            # Parametrize the scenario outlines
-            scenario_wrapper = pytest.mark.parametrize(
-                "_pytest_bdd_example",
-                example_parametrizations,
-            )(scenario_wrapper)
+def _make_scenario_wrapper(
+    fn: Callable[..., T],
+    func_args: list[str],
+    feature: Feature,
+    feature_name: str,
+    templated_scenario: ScenarioTemplate,
+    scenario_name: str,
+) -> Callable[[FixtureRequest, Mapping[str, str]], T]:
+    """Make the test function running a scenario, and then the decorated function.
 
-        rule_tags = set() if templated_scenario.rule is None else templated_scenario.rule.tags
-        for tag in templated_scenario.tags | feature.tags | rule_tags:
-            config = CONFIG_STACK[-1]
-            config.hook.pytest_bdd_apply_tag(tag=tag, function=scenario_wrapper)
+    :param fn: The decorated function.
+    :param func_args: The fixtures required by the decorated function.
+    """
 
-        scenario_wrapper.__doc__ = f"{feature_name}: {scenario_name}"
+    def scenario_wrapper(request: FixtureRequest, _pytest_bdd_example: Mapping[str, str]) -> T:
+        __tracebackhide__ = True
+        # All the async steps of the scenario run on the same event loop
+        return run_sync(async_scenario_wrapper(request, _pytest_bdd_example, ScenarioEventLoop(request)))
+
+    async def async_scenario_wrapper(
+        request: FixtureRequest, _pytest_bdd_example: Mapping[str, str], event_loop: ScenarioEventLoop
+    ) -> T:
+        __tracebackhide__ = True
+        plan = scenario_plan_registry.get(request.node)
+        if plan is not None:
+            await _execute_scenario(feature, plan.scenario, request, event_loop, plan)
+        else:
+            scenario = templated_scenario.render(_pytest_bdd_example)
+            await _execute_scenario(feature, scenario, request, event_loop)
+        fixture_values = [request.getfixturevalue(arg) for arg in func_args]
+        return fn(*fixture_values)
+
+    if func_args:
+        # We need to tell pytest that the original function requires its fixtures,
+        # otherwise indirect fixtures would not work.
+        scenario_wrapper = pytest.mark.usefixtures(*func_args)(scenario_wrapper)
+
+    example_parametrizations = collect_example_parametrizations(templated_scenario)
+    if example_parametrizations is not None:
+        # Parametrize the scenario outlines
+        scenario_wrapper = pytest.mark.parametrize(
+            "_pytest_bdd_example",
+            example_parametrizations,
+        )(scenario_wrapper)
+
+    rule_tags = set() if templated_scenario.rule is None else templated_scenario.rule.tags
+    config = CONFIG_STACK[-1]
+    for tag in templated_scenario.tags | feature.tags | rule_tags:
+        config.hook.pytest_bdd_apply_tag(tag=tag, function=scenario_wrapper)
 
-        scenario_wrapper_template_registry[scenario_wrapper] = templated_scenario
-        return scenario_wrapper
+    scenario_wrapper.__doc__ = f"{feature_name}: {scenario_name}"
 
-    return decorator
+    scenario_wrapper_template_registry[scenario_wrapper] = templated_scenario
+    async_scenario_wrapper_registry[scenario_wrapper] = async_scenario_wrapper
+    return scenario_wrapper
 
 
-def collect_example_parametrizations(
-    templated_scenario: ScenarioTemplate,
-) -> list[ParameterSet] | None:
-    parametrizations = []
+class ExampleParametrizations(Collection[ParameterSet]):
+    """The parametrizations of a scenario outline, one per example row.
 
-    for examples in templated_scenario.examples:
-        tags: set = examples.tags or set()
+    Each one holds a view on its example row instead of a `dict`, so the values of large Examples tables
+    are not copied into the parametrizations.
+    """
 
-        example_marks = [getattr(pytest.mark, tag) for tag in tags]
+    def __init__(self, templated_scenario: ScenarioTemplate) -> None:
+        self.templated_scenario = templated_scenario
+
+    def __iter__(self) -> Iterator[ParameterSet]:
+        for examples in self.templated_scenario.examples:
+            example_marks = [getattr(pytest.mark, tag) for tag in examples.tags]
+            for row, row_id in zip(examples.rows(), examples.iter_row_ids(), strict=True):
+                yield pytest.param(row, id=row_id, marks=example_marks)
+
+    def __len__(self) -> int:
+        return sum(examples.row_count for examples in self.templated_scenario.examples)
+
+    def __contains__(self, item: object) -> bool:
+        # A parametrization is made of a row of one of the Examples tables, found by its index
+        if not isinstance(item, ParameterSet) or len(item.values) != 1 or not isinstance(item.values[0], ExampleRow):
+            return False
+        row = item.values[0]
+        return 0 <= row.index < row.examples.row_count and any(
+            examples is row.examples for examples in self.templated_scenario.examples
+        )
 
-        for context in examples.as_contexts():
-            param_id = "-".join(context.values())
-            parametrizations.append(
-                pytest.param(
-                    context,
-                    id=param_id,
-                    marks=example_marks,
-                ),
-            )
 
-    return parametrizations or None
+def collect_example_parametrizations(
+    templated_scenario: ScenarioTemplate,
+) -> ExampleParametrizations | None:
+    parametrizations = ExampleParametrizations(templated_scenario)
+    return parametrizations if len(parametrizations) else None
 
 
 def scenario(
@@ -402,6 +853,21 @@ def get_features_base_dir(caller_module_path: str) -> str:
     return os.path.join(rootdir, d)
 
 
+def get_parse_workers() -> int:
+    """Get the number of processes parsing the feature files, from the `bdd_parse_workers` ini option."""
+    value = get_from_ini("bdd_parse_workers", "1")
+    assert value is not None
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        workers = int(value)
+    except ValueError:
+        raise pytest.UsageError(f"bdd_parse_workers must be an integer or 'auto', got {value!r}") from None
+    if workers < 1:
+        raise pytest.UsageError(f"bdd_parse_workers must be at least 1, got {workers}")
+    return workers
+
+
 def get_from_ini(key: str, default: str | None = None) -> str | None:
     """Get value from ini config. Return default if value has not been set.
 
@@ -430,11 +896,14 @@ def make_string_literal(string: str) -> str:
     return "'{}'".format(string.replace("'", "\\'"))
 
 
-def get_python_name_generator(name: str) -> Iterable[str]:
-    """Generate a sequence of suitable python names out of given arbitrary string name."""
+def get_python_name_generator(name: str, start: int = 0) -> Iterable[str]:
+    """Generate a sequence of suitable python names out of given arbitrary string name.
+
+    :param start: Index of the first name of the sequence (0 for the name without suffix).
+    """
     python_name = make_python_name(name)
-    suffix = ""
-    index = 0
+    index = start
+    suffix = f"_{index}" if index else ""
 
     def get_name() -> str:
         return f"test_{python_name}{suffix}"
@@ -472,19 +941,31 @@ def scenarios(*feature_paths: str, encoding: str = "utf-8", features_base_dir: s
         if (s := registry_get_safe(scenario_wrapper_template_registry, attr)) is not None
     )
 
-    for feature in get_features(abs_feature_paths):
+    def _scenario() -> None:
+        pass  # pragma: no cover
+
+    # Index of the next test name to try, by scenario name (the previous ones are taken)
+    next_name_indexes: dict[str, int] = {}
+    for feature in get_features(abs_feature_paths, encoding=encoding, workers=get_parse_workers()):
         for scenario_name, scenario_object in feature.scenarios.items():
             # skip already bound scenarios
             if (scenario_object.feature.filename, scenario_name) not in module_scenarios:
-
-                @scenario(feature.filename, scenario_name, encoding=encoding, features_base_dir=features_base_dir)
-                def _scenario() -> None:
-                    pass  # pragma: no cover
-
-                for test_name in get_python_name_generator(scenario_name):
+                # The features are already parsed, so the scenarios are bound directly instead of going
+                # through the `scenario` decorator (which would look up the caller module and the feature again)
+                scenario_wrapper = _make_scenario_wrapper(
+                    _scenario,
+                    [],
+                    feature=feature,
+                    feature_name=feature.filename,
+                    templated_scenario=scenario_object,
+                    scenario_name=scenario_name,
+                )
+                start = next_name_indexes.get(scenario_name, 0)
+                for index, test_name in enumerate(get_python_name_generator(scenario_name, start), start=start):
                     if test_name not in caller_locals:
                         # found a unique test name
-                        caller_locals[test_name] = _scenario
+                        caller_locals[test_name] = scenario_wrapper
+                        next_name_indexes[scenario_name] = index + 1
                         break
             found = True
     if not found:
@@ -0,0 +1,398 @@
+"""Step definition index.
+
+Every step definition is registered here when it is declared, so that the step lookup can
+find the definitions able to parse a step without scanning the whole pytest fixture table.
+"""
+
+from __future__ import annotations
+
+import re
+import warnings
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+from weakref import WeakKeyDictionary, ref
+
+from parse import PARSE_RE
+
+from . import parsers
+
+if TYPE_CHECKING:
+    from .parser import Step
+    from .steps import StepFunctionContext
+
+T = TypeVar("T")
+
+# Maximum number of regex step definitions combined in a single alternation.
+COMBINED_REGEX_CHUNK_SIZE = 100
+
+# Maximum number of (step type, step text) whose matching step definitions are memoized by the index.
+FOUND_STEPS_CACHE_SIZE = 4096
+
+# Group references would not survive the renumbering and renaming of the groups once the pattern is embedded.
+GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?\(|\(\?P=")
+# Start of a named group, not escaped (i.e. preceded by an even number of backslashes).
+NAMED_GROUP_RE = re.compile(r"(?<!\\)((?:\\\\)*)\(\?P<\w+>")
+
+INLINE_FLAG_LETTERS = {re.ASCII: "a", re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+EMBEDDABLE_FLAGS = re.UNICODE | re.ASCII | re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+
+
+def embed_pattern(regex: re.Pattern[str]) -> str | None:
+    """Get the pattern of a compiled regex in a form that can be embedded in a larger alternation.
+
+    Named groups become plain groups, so that names don't clash between alternatives,
+    and the compile flags become scoped inline flags.
+
+    :return: The embeddable pattern, or None if the regex can't be safely embedded.
+    """
+    pattern = regex.pattern
+    if not isinstance(pattern, str) or regex.flags & ~EMBEDDABLE_FLAGS or GROUP_REFERENCE_RE.search(pattern):
+        return None
+
+    pattern, renamed = NAMED_GROUP_RE.subn(r"\1(", pattern)
+    flags = "".join(letter for flag, letter in INLINE_FLAG_LETTERS.items() if regex.flags & flag)
+    # In verbose mode a trailing comment would swallow the closing parenthesis.
+    embedded = f"(?{flags}:{pattern}\n)" if regex.flags & re.VERBOSE else f"(?{flags}:{pattern})"
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            compiled = re.compile(embedded)
+    except (re.error, DeprecationWarning):
+        # E.g. global inline flags, which are only allowed at the start of the whole expression.
+        return None
+    # Make sure that only actual group definitions were touched (e.g. not a literal inside a character class).
+    if compiled.groups != regex.groups or compiled.groupindex or renamed != len(regex.groupindex):
+        return None
+    return embedded
+
+
+class CombinedRegexMatcher:
+    """Match a name against many regexes with as few ``fullmatch`` calls as possible.
+
+    Consecutive regexes are combined into an alternation (one wrapping group per regex, up to ``chunk_size``
+    regexes per alternation). The regex engine tries the alternatives in order, so a match of the alternation
+    tells the first regex of the chunk that matches; the search then resumes right after it.
+    Regexes that can't be embedded are matched on their own.
+    """
+
+    def __init__(self, regexes: Sequence[re.Pattern[str]], chunk_size: int = COMBINED_REGEX_CHUNK_SIZE) -> None:
+        self.regexes = list(regexes)
+        self.chunk_size = chunk_size
+        self._embedded = [embed_pattern(regex) for regex in self.regexes]
+        # Combined regexes by start position: (combined regex, regex position by group index, end position)
+        self._chunks: dict[int, tuple[re.Pattern[str], dict[int, int], int]] = {}
+
+    def _get_chunk(self, start: int) -> tuple[re.Pattern[str], dict[int, int], int]:
+        chunk = self._chunks.get(start)
+        if chunk is not None:
+            return chunk
+
+        alternatives = []
+        end = start
+        while end < len(self.regexes) and end - start < self.chunk_size:
+            embedded = self._embedded[end]
+            if embedded is None:
+                break
+            alternatives.append(f"(?P<_pytest_bdd_{end}>{embedded})")
+            end += 1
+
+        combined = re.compile("|".join(alternatives))
+        positions = {combined.groupindex[f"_pytest_bdd_{position}"]: position for position in range(start, end)}
+        chunk = self._chunks[start] = (combined, positions, end)
+        return chunk
+
+    def iter_matching(self, name: str) -> Iterator[int]:
+        """Yield the positions of the regexes that fully match the given name, in order."""
+        position = 0
+        while position < len(self.regexes):
+            if self._embedded[position] is None:
+                if self.regexes[position].fullmatch(name):
+                    yield position
+                position += 1
+                continue
+
+            combined, positions, end = self._get_chunk(position)
+            match = combined.fullmatch(name)
+            if match is None:
+                position = end
+                continue
+            # The wrapping group closes last, so it is the last matched group.
+            assert match.lastindex is not None
+            position = positions[match.lastindex]
+            yield position
+            position += 1
+
+
+@dataclass(frozen=True)
+class LiteralAnchors:
+    """The literal text of a parse format, lowercased.
+
+    Attributes:
+        prefix (str): The literal text the format starts with (empty if it starts with a field).
+        fragments (tuple[str, ...]): The literal texts between the fields, in order.
+        suffix (str): The literal text the format ends with (empty if it ends with a field).
+    """
+
+    prefix: str
+    fragments: tuple[str, ...]
+    suffix: str
+
+    def match(self, name: str) -> bool:
+        """Check whether a lowercased name contains the literal text where the format requires it.
+
+        This is a necessary condition for the format to match the name, not a sufficient one.
+        """
+        if not name.startswith(self.prefix) or not name.endswith(self.suffix):
+            return False
+        end = len(name) - len(self.suffix)
+        position = len(self.prefix)
+        if end < position:
+            return False
+        for fragment in self.fragments:
+            position = name.find(fragment, position, end)
+            if position == -1:
+                return False
+            position += len(fragment)
+        return True
+
+
+def get_literal_anchors(format_: str) -> LiteralAnchors | None:
+    """Get the literal anchors of a parse (or cfparse) format.
+
+    Parse formats are matched case-insensitively, so the anchors are lowercased. Only ASCII literals are
+    used, since unicode case-insensitive matching doesn't map to a simple `str.lower` comparison.
+
+    :return: The literal anchors, or None if they can't be used to prune the format.
+    """
+    tokens: list[str | None] = []
+    for part in PARSE_RE.split(format_):
+        if not part:
+            continue
+        if part in ("{{", "}}"):
+            part = part[0]
+        elif part[0] == "{" and part[-1] == "}":
+            tokens.append(None)
+            continue
+        if tokens and tokens[-1] is not None:
+            tokens[-1] += part
+        else:
+            tokens.append(part)
+
+    if not all(token is None or token.isascii() for token in tokens):
+        return None
+    lowered = [token.lower() if token is not None else None for token in tokens]
+
+    prefix = suffix = ""
+    if lowered and lowered[0] is not None:
+        prefix = lowered[0]
+        lowered = lowered[1:]
+    if lowered and lowered[-1] is not None:
+        suffix = lowered[-1]
+        lowered = lowered[:-1]
+    return LiteralAnchors(
+        prefix=prefix, fragments=tuple(token for token in lowered if token is not None), suffix=suffix
+    )
+
+
+@dataclass
+class TrieNode(Generic[T]):
+    children: dict[str, TrieNode[T]] = field(default_factory=dict)
+    # Items whose literal prefix ends at this node
+    entries: list[tuple[T, LiteralAnchors]] = field(default_factory=list)
+
+
+class LiteralPrefixTrie(Generic[T]):
+    """Trie of items keyed by the literal anchors of their parse format.
+
+    Walking the trie along a name yields the items whose literal prefix starts the name; their other
+    anchors are then checked. Items without usable anchors are always yielded.
+    """
+
+    def __init__(self) -> None:
+        self._root: TrieNode[T] = TrieNode()
+        self._always: list[T] = []
+
+    def add(self, item: T, anchors: LiteralAnchors | None) -> None:
+        if anchors is None:
+            self._always.append(item)
+            return
+        node = self._root
+        for char in anchors.prefix:
+            node = node.children.setdefault(char, TrieNode())
+        node.entries.append((item, anchors))
+
+    def iter_candidates(self, name: str) -> Iterator[T]:
+        """Yield the items whose format can possibly match the given name."""
+        yield from self._always
+        if not name.isascii():
+            # No pruning is possible, see `get_literal_anchors`.
+            yield from (item for item, _ in self._iter_entries(self._root))
+            return
+
+        lowered = name.lower()
+        node = self._root
+        for char in lowered:
+            yield from (item for item, anchors in node.entries if anchors.match(lowered))
+            child = node.children.get(char)
+            if child is None:
+                return
+            node = child
+        yield from (item for item, anchors in node.entries if anchors.match(lowered))
+
+    def _iter_entries(self, node: TrieNode[T]) -> Iterator[tuple[T, LiteralAnchors]]:
+        yield from node.entries
+        for child in node.children.values():
+            yield from self._iter_entries(child)
+
+
+@dataclass
+class PruningStats:
+    """Statistics of the pruning of the parse and cfparse step definitions.
+
+    Attributes:
+        lookups (int): Number of step names looked up.
+        definitions (int): Number of step definitions of the step type that would have been parsed without pruning.
+        candidates (int): Number of step definitions of the step type that were actually parsed.
+    """
+
+    lookups: int = 0
+    definitions: int = 0
+    candidates: int = 0
+
+    @property
+    def pruning_ratio(self) -> float:
+        """Fraction of the step definitions that didn't need to be parsed."""
+        if not self.definitions:
+            return 0.0
+        return 1 - self.candidates / self.definitions
+
+
+class StepDefinitionIndex:
+    """Index of the step definitions, keyed by their step function marker (the fixture function).
+
+    Definitions using the exact string parser are bucketed by step type and step text, so they are found
+    with a single dictionary lookup. Definitions using the regex parser are matched together by a
+    `CombinedRegexMatcher`. Definitions using the parse or cfparse parser are pruned by their literal
+    anchors with a `LiteralPrefixTrie` (see `parse_stats`) before being parsed. Definitions using any other
+    parser are matched one by one.
+
+    Markers are referenced weakly, so that definitions of modules that are gone do not leak.
+    The results of `find` are memoized until a new step definition is added (which bumps `version`), for the
+    `FOUND_STEPS_CACHE_SIZE` most recently found steps.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._found: OrderedDict[tuple[str, str], dict[Callable[..., object], StepFunctionContext]] = OrderedDict()
+        self._literal: dict[tuple[str | None, str], WeakKeyDictionary[Callable[..., object], StepFunctionContext]] = {}
+        self._regexes: WeakKeyDictionary[Callable[..., object], StepFunctionContext] = WeakKeyDictionary()
+        self._regex_markers: list[ref[Callable[..., object]]] = []
+        self._regex_matcher: CombinedRegexMatcher | None = None
+        self._parse_formats: WeakKeyDictionary[Callable[..., object], StepFunctionContext] = WeakKeyDictionary()
+        self._parse_format_trie: LiteralPrefixTrie[ref[Callable[..., object]]] | None = None
+        # Number of parse and cfparse definitions by step type (None for the definitions of any type)
+        self._parse_format_counts: dict[str | None, int] = {}
+        self.parse_stats = PruningStats()
+        self._patterns: WeakKeyDictionary[Callable[..., object], StepFunctionContext] = WeakKeyDictionary()
+
+    def add(self, step_func_marker: Callable[..., object], context: StepFunctionContext) -> None:
+        """Register a step definition.
+
+        :param step_func_marker: The fixture function providing the step definition.
+        :param context: The step function context of the definition.
+        """
+        self.version += 1
+        self._found.clear()
+        # Subclasses of the string parser may override `is_matching`, so only exact instances are bucketed.
+        if type(context.parser) is parsers.string:
+            key = (context.type, context.parser.name)
+            self._literal.setdefault(key, WeakKeyDictionary())[step_func_marker] = context
+        elif type(context.parser) is parsers.re:
+            self._regexes[step_func_marker] = context
+            self._regex_matcher = None
+        elif type(context.parser) in (parsers.parse, parsers.cfparse):
+            self._parse_formats[step_func_marker] = context
+            self._parse_format_trie = None
+        else:
+            self._patterns[step_func_marker] = context
+
+    def find(self, step: Step) -> dict[Callable[..., object], StepFunctionContext]:
+        """Find the step definitions that can parse the given step.
+
+        :param step: The step to parse.
+
+        :return: The matching step definitions, by step function marker.
+        """
+        key = (step.type, step.name)
+        found = self._found.get(key)
+        if found is not None:
+            self._found.move_to_end(key)
+            return found
+        found = self._found[key] = self._find(step)
+        if len(self._found) > FOUND_STEPS_CACHE_SIZE:
+            self._found.popitem(last=False)
+        return found
+
+    def _find(self, step: Step) -> dict[Callable[..., object], StepFunctionContext]:
+        found: dict[Callable[..., object], StepFunctionContext] = {}
+        for key in ((step.type, step.name), (None, step.name)):
+            bucket = self._literal.get(key)
+            if bucket:
+                found.update(bucket.items())
+
+        regex_matcher = self._get_regex_matcher()
+        for position in regex_matcher.iter_matching(step.name):
+            step_func_marker = self._regex_markers[position]()
+            if step_func_marker is None:
+                continue
+            context = self._regexes.get(step_func_marker)
+            if context is None or (context.type is not None and context.type != step.type):
+                continue
+            found[step_func_marker] = context
+
+        parse_format_trie = self._get_parse_format_trie()
+        self.parse_stats.lookups += 1
+        self.parse_stats.definitions += self._parse_format_counts.get(None, 0) + self._parse_format_counts.get(
+            step.type, 0
+        )
+        for marker_ref in parse_format_trie.iter_candidates(step.name):
+            step_func_marker = marker_ref()
+            if step_func_marker is None:
+                continue
+            context = self._parse_formats.get(step_func_marker)
+            if context is None or (context.type is not None and context.type != step.type):
+                continue
+            self.parse_stats.candidates += 1
+            if parsers.match_step(context.parser, step.name) is not None:
+                found[step_func_marker] = context
+
+        for step_func_marker, context in list(self._patterns.items()):
+            if context.type is not None and context.type != step.type:
+                continue
+            if parsers.match_step(context.parser, step.name) is not None:
+                found[step_func_marker] = context
+        return found
+
+    def _get_regex_matcher(self) -> CombinedRegexMatcher:
+        if self._regex_matcher is None:
+            definitions = list(self._regexes.items())
+            # Only weak references are kept, the contexts are fetched back from `_regexes` on match.
+            self._regex_markers = [ref(step_func_marker) for step_func_marker, _ in definitions]
+            self._regex_matcher = CombinedRegexMatcher(
+                [cast(parsers.re, context.parser).regex for _, context in definitions]
+            )
+        return self._regex_matcher
+
+    def _get_parse_format_trie(self) -> LiteralPrefixTrie[ref[Callable[..., object]]]:
+        if self._parse_format_trie is None:
+            self._parse_format_trie = LiteralPrefixTrie()
+            self._parse_format_counts = {}
+            for step_func_marker, context in self._parse_formats.items():
+                self._parse_format_trie.add(ref(step_func_marker), get_literal_anchors(context.parser.name))
+                self._parse_format_counts[context.type] = self._parse_format_counts.get(context.type, 0) + 1
+        return self._parse_format_trie
+
+
+step_definition_index = StepDefinitionIndex()
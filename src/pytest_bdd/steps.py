@@ -40,15 +40,18 @@ from __future__ import annotations
 import enum
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from inspect import signature
 from itertools import count
 from typing import Literal, ParamSpec, TypeVar
 from weakref import WeakKeyDictionary
 
 import pytest
 
+from .event_loop import is_async_function
 from .parser import Step
 from .parsers import StepParser, get_parser
-from .utils import get_caller_module_locals
+from .step_index import step_definition_index
+from .utils import get_caller_module_locals, get_required_args
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -62,6 +65,32 @@ class StepNamePrefix(enum.Enum):
     step_impl = "pytestbdd_stepimpl"
 
 
+@dataclass(frozen=True)
+class StepCallPlan:
+    """How to call a step function, computed once from its signature.
+
+    Attributes:
+        parameters (frozenset[str]): Names of the parameters of the step function. The step arguments
+            (parsed arguments, datatable and docstring) that are not among them are not passed.
+        required_args (tuple[str, ...]): Names of the required arguments, requested as fixtures
+            when they are not step arguments.
+        is_async (bool): Whether the step function is a coroutine or async generator function,
+            run on the event loop of the scenario.
+    """
+
+    parameters: frozenset[str]
+    required_args: tuple[str, ...]
+    is_async: bool = False
+
+    @classmethod
+    def from_function(cls, func: Callable[..., object]) -> StepCallPlan:
+        return cls(
+            parameters=frozenset(signature(func).parameters),
+            required_args=tuple(get_required_args(func)),
+            is_async=is_async_function(func),
+        )
+
+
 @dataclass
 class StepFunctionContext:
     type: Literal["given", "when", "then"] | None
@@ -69,6 +98,15 @@ class StepFunctionContext:
     parser: StepParser
     converters: dict[str, Callable[[str], object]] = field(default_factory=dict)
     target_fixture: str | None = None
+    independent: bool = False
+    _call_plan: StepCallPlan | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def call_plan(self) -> StepCallPlan:
+        """How to call the step function, computed on the first call."""
+        if self._call_plan is None:
+            self._call_plan = StepCallPlan.from_function(self.step_func)
+        return self._call_plan
 
 
 def get_step_fixture_name(step: Step) -> str:
@@ -81,6 +119,7 @@ def given(
     converters: dict[str, Callable[[str], object]] | None = None,
     target_fixture: str | None = None,
     stacklevel: int = 1,
+    independent: bool = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Given step decorator.
 
@@ -89,10 +128,18 @@ def given(
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function.
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
+    :param independent: Whether the step function can run concurrently with the neighbour independent steps.
 
     :return: Decorator function for the step.
     """
-    return step(name, "given", converters=converters, target_fixture=target_fixture, stacklevel=stacklevel)
+    return step(
+        name,
+        "given",
+        converters=converters,
+        target_fixture=target_fixture,
+        stacklevel=stacklevel,
+        independent=independent,
+    )
 
 
 def when(
@@ -100,6 +147,7 @@ def when(
     converters: dict[str, Callable[[str], object]] | None = None,
     target_fixture: str | None = None,
     stacklevel: int = 1,
+    independent: bool = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """When step decorator.
 
@@ -108,10 +156,18 @@ def when(
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function.
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
+    :param independent: Whether the step function can run concurrently with the neighbour independent steps.
 
     :return: Decorator function for the step.
     """
-    return step(name, "when", converters=converters, target_fixture=target_fixture, stacklevel=stacklevel)
+    return step(
+        name,
+        "when",
+        converters=converters,
+        target_fixture=target_fixture,
+        stacklevel=stacklevel,
+        independent=independent,
+    )
 
 
 def then(
@@ -119,6 +175,7 @@ def then(
     converters: dict[str, Callable[[str], object]] | None = None,
     target_fixture: str | None = None,
     stacklevel: int = 1,
+    independent: bool = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Then step decorator.
 
@@ -127,10 +184,18 @@ def then(
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function.
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
+    :param independent: Whether the step function can run concurrently with the neighbour independent steps.
 
     :return: Decorator function for the step.
     """
-    return step(name, "then", converters=converters, target_fixture=target_fixture, stacklevel=stacklevel)
+    return step(
+        name,
+        "then",
+        converters=converters,
+        target_fixture=target_fixture,
+        stacklevel=stacklevel,
+        independent=independent,
+    )
 
 
 def step(
@@ -139,6 +204,7 @@ def step(
     converters: dict[str, Callable[[str], object]] | None = None,
     target_fixture: str | None = None,
     stacklevel: int = 1,
+    independent: bool = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Generic step decorator.
 
@@ -147,6 +213,9 @@ def step(
     :param converters: Optional step arguments converters mapping.
     :param target_fixture: Optional fixture name to replace by step definition.
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
+    :param independent: Whether the step function can run concurrently with the neighbour independent steps:
+                        the consecutive independent steps of a scenario run together on a thread pool.
+                        Their step functions must not depend on each other.
 
     :return: Decorator function for the step.
 
@@ -168,12 +237,14 @@ def step(
             parser=parser,
             converters=converters,
             target_fixture=target_fixture,
+            independent=independent,
         )
 
         def step_function_marker() -> StepFunctionContext:
             return context
 
         step_function_context_registry[step_function_marker] = context
+        step_definition_index.add(step_function_marker, context)
 
         caller_locals = get_caller_module_locals(stacklevel=stacklevel)
         fixture_step_name = find_unique_name(
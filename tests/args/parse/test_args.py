@@ -107,3 +107,45 @@ def test_argument_in_when_step_1(pytester):
     )
     result = pytester.runpytest()
     result.assert_outcomes(passed=1)
+
+
+def test_converted_arguments_are_not_shared(pytester):
+    """Test that the steps sharing a step text get their own converted values."""
+    pytester.makefile(
+        ".feature",
+        arguments=textwrap.dedent(
+            """\
+            Feature: Step arguments
+                Scenario: First
+                    Given I have the letters a,b
+
+                Scenario: Second
+                    Given I have the letters a,b
+            """
+        ),
+    )
+
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import parsers, given, scenarios
+
+        scenarios("arguments.feature")
+
+
+        def parse_letters(text):
+            return text.split(",")
+
+
+        parse_letters.pattern = r"[a-z](?:,[a-z])*"
+
+
+        @given(parsers.parse("I have the letters {letters:Letters}", extra_types={"Letters": parse_letters}))
+        def _(letters):
+            assert letters == ["a", "b"]
+            letters.append("x")
+        """
+        )
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=2)
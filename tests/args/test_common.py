@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import textwrap
 
+from pytest_bdd import parsers
 from pytest_bdd.utils import collect_dumped_objects
 
 
@@ -116,3 +117,51 @@ def test_string_steps_dont_take_precedence(pytester):
 
     [which] = collect_dumped_objects(result)
     assert which == "re"
+
+
+def test_step_arguments_are_parsed_once(pytester):
+    """Test that a step text is matched only once, no matter how many steps and scenarios use it.
+
+    The values are converted again for each step, so the steps don't share them.
+    """
+    pytester.makefile(
+        ".feature",
+        arguments=textwrap.dedent(
+            """\
+            Feature: Step arguments are parsed once
+                Scenario: First
+                    Given I have 42 cucumbers
+                    And I have 42 cucumbers
+
+                Scenario: Second
+                    Given I have 42 cucumbers
+                    And I have 7 cucumbers
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import given, parsers, scenarios
+        from pytest_bdd.utils import dump_obj
+
+        scenarios("arguments.feature")
+
+
+        def parse_number(text):
+            dump_obj(text)
+            return int(text)
+
+
+        @given(parsers.parse("I have {count:Number} cucumbers", extra_types={"Number": parse_number}))
+        def _(count):
+            assert isinstance(count, int)
+        """
+        )
+    )
+    parsers._match_raw_cached.cache_clear()
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=2)
+
+    assert parsers._match_raw_cached.cache_info().misses == 2
+    assert set(collect_dumped_objects(result)) == {"42", "7"}
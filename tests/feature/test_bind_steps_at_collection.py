@@ -0,0 +1,128 @@
+"""Test binding the steps to their step definitions at collection time."""
+
+from __future__ import annotations
+
+import textwrap
+
+
+def test_bind_steps_at_collection(pytester):
+    """Test that the scenarios are executed with the steps bound at collection time."""
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_bind_steps_at_collection = true
+        """
+    )
+    pytester.makefile(
+        ".feature",
+        outline=textwrap.dedent(
+            """\
+            Feature: Outline
+                Scenario Outline: Eating cucumbers
+                    Given there are <start> cucumbers
+                    When I eat <eat> cucumbers
+                    Then I should have <left> cucumbers
+
+                    Examples:
+                    | start | eat | left |
+                    |  12   |  5  |  7   |
+                    |  5    |  4  |  1   |
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            import importlib
+
+            import pytest
+
+
+            @pytest.fixture(autouse=True)
+            def no_runtime_lookup(monkeypatch):
+                def get_step_function(request, step):
+                    raise AssertionError(f"Step {step} was looked up at runtime")
+
+                scenario_module = importlib.import_module("pytest_bdd.scenario")
+                monkeypatch.setattr(scenario_module, "get_step_function", get_step_function)
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers, scenarios, then, when
+
+            scenarios("outline.feature")
+
+
+            @given(parsers.parse("there are {start:d} cucumbers"), target_fixture="cucumbers")
+            def _(start):
+                assert isinstance(start, int)
+                return {"start": start}
+
+
+            @when(parsers.re(r"I eat (?P<eat>\\d+) cucumbers"), converters={"eat": int})
+            def _(cucumbers, eat):
+                cucumbers["eat"] = eat
+
+
+            @then(parsers.parse("I should have {left:d} cucumbers"))
+            def _(cucumbers, left):
+                assert cucumbers["start"] - cucumbers["eat"] == left
+            """
+        )
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=2)
+
+
+def test_bind_steps_at_collection_missing_steps(pytester):
+    """Test that the missing steps are reported at collection time, once per step."""
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_bind_steps_at_collection = true
+        """
+    )
+    pytester.makefile(
+        ".feature",
+        missing=textwrap.dedent(
+            """\
+            Feature: Missing steps
+                Scenario: First
+                    Given I have a bar
+                    When I do something undefined
+
+                Scenario: Second
+                    Given I have a bar
+                    Then nothing is defined either
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("missing.feature")
+
+
+            @given("I have a bar")
+            def _():
+                pass
+            """
+        )
+    )
+    result = pytester.runpytest("--collect-only")
+    result.stdout.fnmatch_lines(
+        [
+            '*missing.feature:4: StepDefinitionNotFoundWarning: Step definition is not found: When "I do something*',
+            '*missing.feature:8: StepDefinitionNotFoundWarning: Step definition is not found: Then "nothing is*',
+        ]
+    )
+    result.stdout.no_fnmatch_line('*Given "I have a bar"*')
+
+    result = pytester.runpytest()
+    result.assert_outcomes(failed=2)
+    result.stdout.fnmatch_lines(["*StepDefinitionNotFoundError*"])
@@ -0,0 +1,300 @@
+"""Test the concurrent execution of the scenarios."""
+
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+
+from pytest_bdd.compat import supports_detached_items
+
+pytestmark = pytest.mark.skipif(
+    not supports_detached_items, reason="The scenarios are run one at a time with this pytest version"
+)
+
+FEATURE = """\
+Feature: Concurrent scenarios
+    @concurrent
+    Scenario Outline: Waiting
+        Given I have <count> cucumbers
+        When I wait
+        Then I should still have <count> cucumbers
+
+        Examples:
+        | count |
+        | 1     |
+        | 2     |
+        | 3     |
+        | 4     |
+        | 5     |
+"""
+
+STEPS = """\
+import asyncio
+
+import pytest
+
+from pytest_bdd import given, parsers, scenarios, then, when
+
+running = []
+max_running = []
+
+scenarios("concurrent.feature")
+
+
+@pytest.fixture
+def resource(request):
+    yield request.node.name
+    running.remove(request.node.name)
+
+
+@given(parsers.parse("I have {count:d} cucumbers"), target_fixture="cucumbers")
+async def _(count, resource):
+    running.append(resource)
+    max_running.append(len(running))
+    await asyncio.sleep(0)
+    return count
+
+
+@when("I wait")
+async def _():
+    await asyncio.sleep(0.01)
+
+
+@then(parsers.parse("I should still have {count:d} cucumbers"))
+def _(cucumbers, count):
+    assert cucumbers == count
+
+
+def test_max_running():
+    assert running == []
+    assert max(max_running) == {max_running}
+"""
+
+
+def test_concurrent_scenarios(pytester):
+    """Test that the concurrent scenarios run in waves, each with its own fixtures."""
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_concurrent_scenarios = 2
+        """
+    )
+    pytester.makefile(".feature", concurrent=FEATURE)
+    pytester.makepyfile(STEPS.replace("{max_running}", "2"))
+
+    result = pytester.runpytest("-v")
+    result.assert_outcomes(passed=6)
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_waiting?1? PASSED*",
+            "*::test_waiting?2? PASSED*",
+            "*::test_waiting?3? PASSED*",
+            "*::test_waiting?4? PASSED*",
+            "*::test_waiting?5? PASSED*",
+            "*::test_max_running PASSED*",
+        ]
+    )
+
+
+def test_concurrent_scenarios_disabled(pytester):
+    """Test that the scenarios are run one at a time by default."""
+    pytester.makefile(".feature", concurrent=FEATURE)
+    pytester.makepyfile(STEPS.replace("{max_running}", "1"))
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=6)
+
+
+def test_concurrent_scenarios_other_runtest_protocol(pytester):
+    """Test that the scenarios are run one at a time when another plugin implements the test protocol."""
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_concurrent_scenarios = 2
+        """
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            import pytest
+
+
+            @pytest.hookimpl(hookwrapper=True)
+            def pytest_runtest_protocol(item, nextitem):
+                yield
+            """
+        )
+    )
+    pytester.makefile(".feature", concurrent=FEATURE)
+    pytester.makepyfile(STEPS.replace("{max_running}", "1"))
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=6)
+
+
+def test_concurrent_scenarios_failures(pytester):
+    """Test that the failures of the concurrent scenarios are reported on their own test."""
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_concurrent_scenarios = 5
+        """
+    )
+    pytester.makefile(".feature", concurrent=FEATURE)
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import asyncio
+
+            import pytest
+
+            from pytest_bdd import given, parsers, scenarios, then, when
+
+            scenarios("concurrent.feature")
+
+
+            @pytest.fixture
+            def resource(cucumbers):
+                if cucumbers == 4:
+                    raise RuntimeError("no resource")
+
+
+            @given(parsers.parse("I have {count:d} cucumbers"), target_fixture="cucumbers")
+            async def _(count):
+                await asyncio.sleep(0)
+                return count
+
+
+            @when("I wait")
+            async def _(cucumbers, resource):
+                await asyncio.sleep(0)
+                if cucumbers == 2:
+                    raise ValueError("cannot wait")
+
+
+            @then(parsers.parse("I should still have {count:d} cucumbers"))
+            def _(cucumbers, count):
+                assert cucumbers == count
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=3, failed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "FAILED *::test_waiting?2? - ValueError*",
+            "FAILED *::test_waiting?4? - RuntimeError*",
+        ]
+    )
+
+
+def test_concurrent_scenarios_assertion_explanations(pytester):
+    """Test that the failed assertions of the concurrent scenarios are explained like in the other tests."""
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_concurrent_scenarios = 3
+        """
+    )
+    pytester.makefile(".feature", concurrent=FEATURE)
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import asyncio
+
+            from pytest_bdd import given, parsers, scenarios, then, when
+
+            scenarios("concurrent.feature")
+
+
+            @given(parsers.parse("I have {count:d} cucumbers"), target_fixture="cucumbers")
+            async def _(count):
+                await asyncio.sleep(0)
+                return [1, 1, count]
+
+
+            @when("I wait")
+            async def _():
+                await asyncio.sleep(0)
+
+
+            @then(parsers.parse("I should still have {count:d} cucumbers"))
+            def _(cucumbers, count):
+                assert cucumbers == [1, 1, 3]
+            """
+        )
+    )
+
+    # In a subprocess: the assertion explanations of this test would be used in process
+    result = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=1, failed=4)
+    result.stdout.fnmatch_lines(["*At index 2 diff: 2 != 3*"])
+
+
+def test_concurrent_scenarios_independent_steps(pytester):
+    """Test that the independent steps of the concurrent scenarios run together, each scenario with its fixtures."""
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_concurrent_scenarios = 5
+        """
+    )
+    pytester.makefile(
+        ".feature",
+        concurrent=textwrap.dedent(
+            """\
+            Feature: Concurrent scenarios
+                @concurrent
+                Scenario Outline: Provisioning
+                    Given I have <count> users
+                    And I have <count> buckets
+                    Then I should have <count> users and buckets
+
+                    Examples:
+                    | count |
+                    | 1     |
+                    | 2     |
+                    | 3     |
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import threading
+
+            import pytest
+
+            from pytest_bdd import given, parsers, scenarios, then
+
+            scenarios("concurrent.feature")
+
+
+            @pytest.fixture
+            def barrier():
+                return threading.Barrier(2, timeout=10)
+
+
+            @given(parsers.parse("I have {count:d} users"), target_fixture="users", independent=True)
+            def _(count, barrier):
+                barrier.wait()
+                return count
+
+
+            @given(parsers.parse("I have {count:d} buckets"), target_fixture="buckets", independent=True)
+            def _(count, barrier):
+                barrier.wait()
+                return count
+
+
+            @then(parsers.parse("I should have {count:d} users and buckets"))
+            def _(users, buckets, count):
+                assert users == buckets == count
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=3)
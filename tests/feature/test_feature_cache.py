@@ -0,0 +1,170 @@
+"""Test the caches of the parsed features."""
+
+from __future__ import annotations
+
+import os
+import pickle
+
+from pytest_bdd import feature
+from pytest_bdd.disk_cache import FeatureDiskCache
+from pytest_bdd.parser import FeatureParser
+
+FEATURE = """\
+Feature: Cached feature
+    Scenario: First
+        Given I have a bar
+"""
+
+TEST_MODULE = """\
+from pytest_bdd import given, scenarios
+
+scenarios("cached.feature")
+
+
+@given("I have a bar")
+def _():
+    pass
+"""
+
+
+def record_parsed_files(monkeypatch):
+    """Record the names of the feature files parsed, in a list."""
+    parsed_files = []
+    original_parse = FeatureParser.parse
+
+    def parse(self):
+        parsed_files.append(os.path.basename(self.abs_filename))
+        return original_parse(self)
+
+    monkeypatch.setattr(FeatureParser, "parse", parse)
+    return parsed_files
+
+
+def test_feature_cache(pytester, monkeypatch):
+    """Test that the parsed features are reused across runs until the feature file changes."""
+    parsed_files = record_parsed_files(monkeypatch)
+
+    def run(*args):
+        # Forget the features parsed by the previous runs in this process
+        monkeypatch.setattr(feature, "features", feature.FeatureCache())
+        parsed_files.clear()
+        return pytester.runpytest(*args)
+
+    pytester.makeini(
+        """
+            [pytest]
+            bdd_feature_cache = true
+        """
+    )
+    feature_file = pytester.makefile(".feature", cached=FEATURE)
+    pytester.makepyfile(TEST_MODULE)
+
+    run().assert_outcomes(passed=1)
+    assert parsed_files == ["cached.feature"]
+
+    run().assert_outcomes(passed=1)
+    assert parsed_files == []
+
+    # Same content, the hash matches
+    os.utime(feature_file, ns=(0, 0))
+    run().assert_outcomes(passed=1)
+    assert parsed_files == []
+
+    feature_file.write_text(FEATURE + "\n    Scenario: Second\n        Given I have a bar\n")
+    run().assert_outcomes(passed=2)
+    assert parsed_files == ["cached.feature"]
+
+    run().assert_outcomes(passed=2)
+    assert parsed_files == []
+
+    run("--bdd-cache-clear").assert_outcomes(passed=2)
+    assert parsed_files == ["cached.feature"]
+
+    run("-p", "no:cacheprovider").assert_outcomes(passed=2)
+    assert parsed_files == ["cached.feature"]
+
+
+def test_feature_cache_disabled(pytester, monkeypatch):
+    """Test that the parsed features are not stored on disk unless the feature cache is enabled."""
+    parsed_files = record_parsed_files(monkeypatch)
+    pytester.makefile(".feature", cached=FEATURE)
+    pytester.makepyfile(TEST_MODULE)
+
+    for _ in range(2):
+        monkeypatch.setattr(feature, "features", feature.FeatureCache())
+        parsed_files.clear()
+        pytester.runpytest().assert_outcomes(passed=1)
+        assert parsed_files == ["cached.feature"]
+
+    assert not pytester.path.joinpath(".pytest_cache", "d", "pytest-bdd-features").exists()
+
+
+class Exploit:
+    """Runs code when it is unpickled."""
+
+    def __reduce__(self):
+        return exec, ("raise SystemExit('unpickled')",)
+
+
+def test_feature_cache_refuses_foreign_classes(tmp_path):
+    """Test that a cache entry referencing anything but the features model is discarded, and not run."""
+    feature_file = tmp_path / "cached.feature"
+    feature_file.write_text(FEATURE, encoding="utf-8")
+    disk_cache = FeatureDiskCache(tmp_path / "cache")
+    disk_cache.clear()
+
+    feature_cached, state = disk_cache.lookup(str(feature_file), "utf-8")
+    assert feature_cached is None
+    disk_cache.store(str(feature_file), "utf-8", state, FeatureParser(str(tmp_path), "cached.feature").parse())
+    feature_cached, _ = disk_cache.lookup(str(feature_file), "utf-8")
+    assert feature_cached is not None
+    assert list(feature_cached.scenarios) == ["First"]
+
+    (entry_path,) = disk_cache.directory.iterdir()
+    entry_path.write_bytes(pickle.dumps(Exploit()))
+    feature_cached, _ = disk_cache.lookup(str(feature_file), "utf-8")
+    assert feature_cached is None
+
+
+def test_feature_cache_in_memory(tmp_path):
+    """Test that the features cache drops the changed, invalidated and least recently used features."""
+    cache = feature.FeatureCache(maxsize=2)
+    paths = []
+    for name in ("first", "second", "third"):
+        path = tmp_path / f"{name}.feature"
+        path.write_text(FEATURE, encoding="utf-8")
+        paths.append(str(path))
+    first, second, third = paths
+
+    def add(path):
+        parsed = FeatureParser(str(tmp_path), path, "utf-8").parse()
+        stat = os.stat(path)
+        cache.add(path, parsed, stat.st_size, stat.st_mtime_ns)
+        return parsed
+
+    first_feature = add(first)
+    assert cache.get(first) is first_feature
+    assert cache.get(second) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # The file changed since it was parsed
+    with open(first, "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert cache.get(first) is None
+    assert first not in cache
+
+    first_feature = add(first)
+    add(second)
+    assert cache.get(first) is first_feature
+    # The second feature is the least recently used one
+    add(third)
+    assert second not in cache
+    assert len(cache) == 2
+
+    cache.invalidate(first)
+    assert cache.get(first) is None
+    assert third in cache
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
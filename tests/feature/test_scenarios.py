@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import textwrap
 
+import pytest
+
+from pytest_bdd import feature
+
 
 def test_scenarios(pytester, pytest_params):
     """Test scenarios shortcut (used together with @scenario for individual test override)."""
@@ -91,3 +95,219 @@ def test_scenarios_none_found(pytester, pytest_params):
     result = pytester.runpytest_subprocess(testpath, *pytest_params)
     result.assert_outcomes(errors=1)
     result.stdout.fnmatch_lines(["*NoScenariosFound*"])
+
+
+def test_scenarios_parse_workers(pytester, monkeypatch):
+    """Test that the feature files can be parsed by several processes."""
+    monkeypatch.setattr(feature, "PARSE_POOL_MIN_FILES", 2)
+    parse_pools = []
+
+    class ProcessPoolExecutor(feature.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            parse_pools.append(self)
+
+    monkeypatch.setattr(feature, "ProcessPoolExecutor", ProcessPoolExecutor)
+    pytester.makeini(
+        """
+            [pytest]
+            bdd_parse_workers = 2
+        """
+    )
+    for directory, names in [("features", ["b", "a", "c"]), ("other_features", ["e", "d"])]:
+        features = pytester.mkdir(directory)
+        for name in names:
+            features.joinpath(f"{name}.feature").write_text(
+                textwrap.dedent(
+                    f"""\
+                    Feature: Feature {name}
+                        Scenario Outline: Scenario {name}
+                            Given I have <count> {name}
+
+                            Examples:
+                            | count |
+                            | 1     |
+                            | 2     |
+                    """
+                ),
+                "utf-8",
+            )
+    pytester.makeconftest(
+        """
+        from pytest_bdd import given, parsers
+
+        @given(parsers.parse('I have {count:d} {name}'))
+        def _(count, name):
+            pass
+    """
+    )
+    pytester.makepyfile(
+        test_features="""
+        from pytest_bdd import scenarios
+
+        scenarios('features')
+    """,
+        test_other_features="""
+        from pytest_bdd import scenarios
+
+        scenarios('other_features')
+    """,
+    )
+    result = pytester.runpytest("-v")
+    result.assert_outcomes(passed=10)
+    result.stdout.fnmatch_lines(
+        [
+            "*test_scenario_a[[]1[]] PASSED*",
+            "*test_scenario_a[[]2[]] PASSED*",
+            "*test_scenario_b[[]1[]] PASSED*",
+            "*test_scenario_b[[]2[]] PASSED*",
+            "*test_scenario_c[[]1[]] PASSED*",
+            "*test_scenario_c[[]2[]] PASSED*",
+            "*test_scenario_d[[]1[]] PASSED*",
+            "*test_scenario_d[[]2[]] PASSED*",
+            "*test_scenario_e[[]1[]] PASSED*",
+            "*test_scenario_e[[]2[]] PASSED*",
+        ]
+    )
+    # One pool parsed the feature files of both modules, and it was shut down with the pytest run
+    [parse_pool] = parse_pools
+    with pytest.raises(RuntimeError):
+        parse_pool.submit(int)
+
+    # Fewer feature files than PARSE_POOL_MIN_FILES are parsed in the pytest process
+    monkeypatch.setattr(feature, "features", feature.FeatureCache())
+    monkeypatch.setattr(feature, "PARSE_POOL_MIN_FILES", 3)
+    result = pytester.runpytest("--bdd-cache-clear")
+    result.assert_outcomes(passed=10)
+    assert len(parse_pools) == 2
+
+    # Parse all the feature files again, the error of a feature file is raised in the test module
+    monkeypatch.setattr(feature, "features", feature.FeatureCache())
+    pytester.path.joinpath("features", "d.feature").write_text("Given a step outside of a feature\n", "utf-8")
+    result = pytester.runpytest("--bdd-cache-clear")
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*FeatureError: Step definition outside of a Scenario or a Background.*"])
+
+
+@pytest.mark.parametrize(
+    ["value", "error"],
+    [
+        ("many", "bdd_parse_workers must be an integer or 'auto', got 'many'"),
+        ("0", "bdd_parse_workers must be at least 1, got 0"),
+    ],
+)
+def test_scenarios_parse_workers_invalid(pytester, value, error):
+    """Test that an invalid number of parsing processes is a usage error."""
+    pytester.makeini(
+        f"""
+            [pytest]
+            bdd_parse_workers = {value}
+        """
+    )
+    features = pytester.mkdir("features")
+    features.joinpath("a.feature").write_text("Feature: A\n    Scenario: A\n        Given I have a\n", "utf-8")
+    pytester.makepyfile(
+        """
+        from pytest_bdd import scenarios
+
+        scenarios('features')
+    """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines([f"*UsageError: {error}"])
+
+
+def test_scenarios_ignored_paths(pytester):
+    """Test that the directories and feature files matching the ignore patterns are skipped."""
+    pytester.makeini(
+        """
+            [pytest]
+            bdd_features_ignore =
+                drafts
+                *_wip.feature
+        """
+    )
+    features = pytester.mkdir("features")
+    for path in [
+        "a.feature",
+        "b_wip.feature",
+        "drafts/c.feature",
+        "node_modules/d.feature",
+        "sub/e.feature",
+        "sub/drafts/f.feature",
+    ]:
+        feature_file = features.joinpath(path)
+        feature_file.parent.mkdir(exist_ok=True)
+        name = feature_file.stem
+        feature_file.write_text(
+            textwrap.dedent(
+                f"""\
+                Feature: Feature {name}
+                    Scenario: Scenario {name}
+                        Given I have a bar
+                """
+            ),
+            "utf-8",
+        )
+    pytester.makepyfile(
+        """
+        from pytest_bdd import given, scenarios
+
+        scenarios('features')
+
+        @given('I have a bar')
+        def _():
+            pass
+    """
+    )
+    result = pytester.runpytest("-v")
+    # "node_modules" is in the default `norecursedirs`
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*test_scenario_a PASSED*", "*test_scenario_e PASSED*"])
+
+
+def test_scenarios_unique_test_names(pytester):
+    """Test that the scenarios sharing a name are bound to unique test names."""
+    features = pytester.mkdir("features")
+    for name in ["a", "b", "c"]:
+        features.joinpath(f"{name}.feature").write_text(
+            textwrap.dedent(
+                f"""\
+                Feature: Feature {name}
+                    Scenario: Test scenario
+                        Given I have a bar
+
+                    Scenario: Test scenario {name}
+                        Given I have a bar
+                """
+            ),
+            "utf-8",
+        )
+    pytester.makepyfile(
+        """
+        from pytest_bdd import given, scenarios
+
+        def test_test_scenario():
+            pass
+
+        scenarios('features/a.feature', 'features/b.feature')
+        scenarios('features/c.feature')
+
+        @given('I have a bar')
+        def _():
+            pass
+    """
+    )
+    result = pytester.runpytest("--collect-only", "-q")
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_test_scenario",
+            "*::test_test_scenario_1",
+            "*::test_test_scenario_a",
+            "*::test_test_scenario_2",
+            "*::test_test_scenario_b",
+            "*::test_test_scenario_3",
+            "*::test_test_scenario_c",
+        ]
+    )
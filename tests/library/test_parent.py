@@ -407,3 +407,68 @@ def test_uses_correct_step_in_the_hierarchy(pytester):
 
     [thing1, thing2] = collect_dumped_objects(result)
     assert thing1 == thing2 == "specific test_b_test_b"
+
+
+def test_step_resolution_is_scoped_per_module(pytester):
+    """Test that a step resolved for the scenarios of a module is not reused for the scenarios of another module."""
+    pytester.makefile(
+        ".feature",
+        shared=textwrap.dedent(
+            """\
+            Feature: Shared
+                Scenario Outline: Shared scenario
+                    Given I have a <kind> fixture
+
+                    Examples:
+                    | kind        |
+                    | overridable |
+                    | overridable |
+            """
+        ),
+    )
+
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import given, parsers
+        from pytest_bdd.utils import dump_obj
+
+
+        @given(parsers.parse("I have a {kind} fixture"))
+        def _(kind):
+            dump_obj(("conftest", kind))
+        """
+        )
+    )
+
+    pytester.makepyfile(
+        test_a=textwrap.dedent(
+            """\
+        from pytest_bdd import given, scenarios
+        from pytest_bdd.utils import dump_obj
+
+        scenarios("shared.feature")
+
+
+        @given("I have a overridable fixture")
+        def _():
+            dump_obj(("test_a", "overridable"))
+        """
+        ),
+        test_b=textwrap.dedent(
+            """\
+        from pytest_bdd import scenarios
+
+        scenarios("shared.feature")
+        """
+        ),
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=4)
+
+    assert collect_dumped_objects(result) == [
+        ("test_a", "overridable"),
+        ("test_a", "overridable"),
+        ("conftest", "overridable"),
+        ("conftest", "overridable"),
+    ]
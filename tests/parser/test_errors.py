@@ -253,3 +253,55 @@ def test_improper_initial_keyword(pytester):
     result.stdout.fnmatch_lines(
         ["*StepError: First step in a scenario or background must start with 'Given', 'When' or 'Then', but got And.*"]
     )
+
+
+def test_inconsistent_cell_count_error(pytester):
+    """Test a table whose rows don't have the same number of cells."""
+    features = pytester.mkdir("features")
+    features.joinpath("test.feature").write_text(
+        textwrap.dedent(
+            """
+            Feature: Tables
+                Scenario: Inconsistent table
+                    Given a table
+                        | a | b |
+                        | 1 |
+            """
+        ),
+        encoding="utf-8",
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """
+            from pytest_bdd import scenarios
+
+            scenarios('features')
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.stdout.fnmatch_lines(
+        [
+            "*GherkinParseError: Unknown parsing error: Parser errors:",
+            "*(6:13): inconsistent cell count within the table",
+        ]
+    )
+
+
+def test_empty_feature_file_error(pytester):
+    """Test a feature file without a feature."""
+    features = pytester.mkdir("features")
+    features.joinpath("test.feature").write_text("# Nothing here yet\n", encoding="utf-8")
+    pytester.makepyfile(
+        textwrap.dedent(
+            """
+            from pytest_bdd import scenarios
+
+            scenarios('features')
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.stdout.fnmatch_lines(["*FeatureError: No feature found in the feature file.*"])
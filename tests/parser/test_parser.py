@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
+from gherkin.parser import Parser
+
+from src.pytest_bdd import parser
 from src.pytest_bdd.gherkin_parser import (
     Background,
     Cell,
@@ -20,6 +24,9 @@ from src.pytest_bdd.gherkin_parser import (
     Tag,
     get_gherkin_document,
 )
+from src.pytest_bdd.parser import Examples, FeatureParser, StringTemplate
+from src.pytest_bdd.parser import Step as ScenarioStep
+from src.pytest_bdd.types import WHEN
 
 
 def test_parser():
@@ -851,3 +858,244 @@ def test_parser():
     )
 
     assert gherkin_doc == expected_document
+
+
+def test_parser_builds_the_same_document_as_from_dict():
+    """Test that the document built by the parser is the one converted from the gherkin parser's dicts."""
+    feature_file = Path(__file__).parent / "test.feature"
+
+    expected_document = GherkinDocument.from_dict(Parser().parse(feature_file.read_text(encoding="utf-8")))
+
+    assert get_gherkin_document(str(feature_file.resolve())) == expected_document
+
+
+def test_parser_interns_the_repeated_strings(tmp_path):
+    """Test that the strings repeated across the feature files are shared."""
+    documents = []
+    for name in ("first", "second"):
+        feature_file = tmp_path / f"{name}.feature"
+        feature_file.write_text(
+            f"@shared\nFeature: {name}\n    Scenario: {name}\n        Given I have a bar\n",
+            encoding="utf-8",
+        )
+        documents.append(get_gherkin_document(str(feature_file)))
+
+    first, second = (document.feature for document in documents)
+    assert first.tags[0].name is second.tags[0].name
+    first_step, second_step = (feature.children[0].scenario.steps[0] for feature in (first, second))
+    assert first_step.text is second_step.text
+    assert first_step.keyword is second_step.keyword
+
+
+def test_scenario_steps_are_loaded_when_needed():
+    """Test that the steps of an unpickled feature are only loaded for the scenarios that use them."""
+    test_dir = Path(__file__).parent
+    feature_parser = FeatureParser(str(test_dir), "test.feature")
+    expected_steps = {
+        name: [(step.type, step.keyword, step.name, step.line_number) for step in scenario.steps]
+        for name, scenario in feature_parser.parse().scenarios.items()
+    }
+
+    restored = pickle.loads(pickle.dumps(feature_parser.parse()))
+    first, *others = restored.scenarios.values()
+    assert all(not scenario.deferred_steps.loaded for scenario in restored.scenarios.values())
+
+    rendered = first.render({})
+    assert [(step.type, step.keyword, step.name, step.line_number) for step in rendered.steps] == expected_steps[
+        first.name
+    ]
+    assert all(not scenario.deferred_steps.loaded for scenario in others)
+
+    for name, scenario in restored.scenarios.items():
+        assert [(step.type, step.keyword, step.name, step.line_number) for step in scenario.steps] == expected_steps[
+            name
+        ]
+        assert all(step.scenario is scenario for step in scenario.own_steps)
+
+
+def test_examples_columns():
+    """Test that the example rows are stored by column, and viewed as mappings."""
+    examples = Examples()
+    examples.set_param_names(["start", "eat", "left"])
+    examples.add_example(["12", "5", "7"])
+    examples.add_example(["5", "4", None])
+
+    assert examples.columns == [["12", "5"], ["5", "4"], ["7", ""]]
+    assert examples.examples == [("12", "5", "7"), ("5", "4", "")]
+
+    first, second = examples.rows()
+    assert first == {"start": "12", "eat": "5", "left": "7"}
+    assert second["eat"] == "4"
+    assert second.get("unknown", "<unknown>") == "<unknown>"
+    assert list(examples.as_contexts()) == [dict(first), dict(second)]
+    assert list(examples.iter_row_ids()) == ["12-5-7", "5-4-"]
+
+
+def test_examples_rows_argument():
+    """Test that the example rows can still be given to the constructor, and assigned."""
+    examples = Examples(line_number=3, example_params=["start", "left"], examples=[["12", "7"], ["5", "1"]])
+    assert examples.columns == [["12", "5"], ["7", "1"]]
+    assert examples.row_count == 2
+
+    examples.examples = [["3", "0"]]
+    assert examples.examples == [("3", "0")]
+    assert [dict(row) for row in examples.rows()] == [{"start": "3", "left": "0"}]
+
+
+def test_string_template():
+    """Test that the string templates render like `render_string`."""
+    template = StringTemplate("I have <count> <fruit>s and <count> <unknown>")
+    assert not template.is_static
+    assert template.render({"count": 2, "fruit": "apple"}) == "I have 2 apples and 2 <unknown>"
+    assert template.render({"count": None}) == "I have None <fruit>s and None <unknown>"
+
+    static_template = StringTemplate("I have no fruit")
+    assert static_template.is_static
+    assert static_template.render({"count": 2}) == "I have no fruit"
+
+
+def test_render_copies_static_steps(tmp_path):
+    """Test that the steps without placeholders are copied by each rendering, sharing their strings."""
+    (tmp_path / "outline.feature").write_text(
+        """\
+Feature: Outline
+    Scenario Outline: Outlined
+        Given there are <start> cucumbers
+        And the basket is empty
+        Then the report is:
+            | eaten | left   |
+            | 0     | <left> |
+
+        Examples:
+        | start | left |
+        |  12   |  7   |
+        |  5    |  1   |
+""",
+        encoding="utf-8",
+    )
+    template = FeatureParser(str(tmp_path), "outline.feature").parse().scenarios["Outlined"]
+    first, second = (template.render(context) for context in template.examples[0].as_contexts())
+
+    assert [step.name for step in first.steps] == ["there are 12 cucumbers", "the basket is empty", "the report is:"]
+    # The static steps are new steps, sharing the strings of the template step
+    assert first.steps[1] is not second.steps[1]
+    assert first.steps[1].name is second.steps[1].name is template.steps[1].name
+    first.steps[1].failed = True
+    assert not second.steps[1].failed
+    assert not template.steps[1].failed
+    assert first.steps[2].datatable.raw() == [["eaten", "left"], ["0", "7"]]
+    assert second.steps[2].datatable.raw() == [["eaten", "left"], ["0", "1"]]
+    assert template.steps[2].datatable.raw() == [["eaten", "left"], ["0", "<left>"]]
+
+
+def test_render_shares_static_datatable_rows(tmp_path):
+    """Test that the rendered data tables share the rows without placeholders, and return new raw lists."""
+    (tmp_path / "outline.feature").write_text(
+        """\
+Feature: Outline
+    Scenario Outline: Outlined
+        Given the report is:
+            | eaten | left   |
+            | 0     | <left> |
+
+        Examples:
+        | left |
+        |  7   |
+""",
+        encoding="utf-8",
+    )
+    template = FeatureParser(str(tmp_path), "outline.feature").parse().scenarios["Outlined"]
+    [scenario] = (template.render(context) for context in template.examples[0].as_contexts())
+    template_table = template.steps[0].datatable
+    rendered_table = scenario.steps[0].datatable
+
+    assert rendered_table.rows[0] is template_table.rows[0]
+    assert rendered_table.rows[1] is not template_table.rows[1]
+    assert rendered_table.rows[1].cells[0] is template_table.rows[1].cells[0]
+
+    raw = rendered_table.raw()
+    raw.pop(0)
+    raw[0][1] = "8"
+    assert rendered_table.raw() == [["eaten", "left"], ["0", "7"]]
+
+
+def test_render_is_cached_per_example_row(tmp_path):
+    """Test that rendering the same example row again returns the same scenario."""
+    (tmp_path / "outline.feature").write_text(
+        """\
+Feature: Outline
+    Background:
+        Given a background step
+
+    Scenario Outline: Outlined
+        Given there are <start> cucumbers
+
+        Examples:
+        | start |
+        |  12   |
+        |  5    |
+""",
+        encoding="utf-8",
+    )
+    template = FeatureParser(str(tmp_path), "outline.feature").parse().scenarios["Outlined"]
+    first_row, second_row = template.examples[0].rows()
+
+    first = template.render(first_row)
+    assert template.render(first_row) is first
+    assert template.render(second_row) is not first
+    assert template.render(dict(first_row)) is not first
+    assert [step.name for step in first.steps] == ["a background step", "there are 12 cucumbers"]
+    assert template.steps is template.steps
+
+
+def test_render_cache_is_bounded(tmp_path, monkeypatch):
+    """Test that a scenario template only keeps the scenarios most recently rendered from its example rows."""
+    monkeypatch.setattr(parser, "RENDERED_SCENARIOS_PER_TEMPLATE", 2)
+    (tmp_path / "outline.feature").write_text(
+        """\
+Feature: Outline
+    Scenario Outline: Outlined
+        Given there are <start> cucumbers
+
+        Examples:
+        | start |
+        |  12   |
+        |  5    |
+        |  3    |
+""",
+        encoding="utf-8",
+    )
+    template = FeatureParser(str(tmp_path), "outline.feature").parse().scenarios["Outlined"]
+    first_row, second_row, third_row = template.examples[0].rows()
+
+    first, second = template.render(first_row), template.render(second_row)
+    # The first row is now the most recently used one
+    assert template.render(first_row) is first
+    template.render(third_row)
+    assert len(template._rendered) == 2
+    assert template.render(first_row) is first
+    assert template.render(second_row) is not second
+
+
+def test_render_cache_is_cleared_per_template(tmp_path):
+    """Test that adding a step to a scenario template only drops the scenarios rendered from this template."""
+    (tmp_path / "outline.feature").write_text(
+        """\
+Feature: Outline
+    Scenario: First
+        Given there are 12 cucumbers
+
+    Scenario: Second
+        Given there are 5 cucumbers
+""",
+        encoding="utf-8",
+    )
+    first_template, second_template = FeatureParser(str(tmp_path), "outline.feature").parse().scenarios.values()
+    first, second = first_template.render({}), second_template.render({})
+
+    first_template.add_step(ScenarioStep(name="I eat 2 cucumbers", type=WHEN, indent=8, line_number=3, keyword="When"))
+
+    assert second_template.render({}) is second
+    rendered = first_template.render({})
+    assert rendered is not first
+    assert [step.name for step in rendered.steps] == ["there are 12 cucumbers", "I eat 2 cucumbers"]
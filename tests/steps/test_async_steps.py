@@ -0,0 +1,212 @@
+"""Async step definitions tests."""
+
+from __future__ import annotations
+
+import textwrap
+
+from pytest_bdd.utils import collect_dumped_objects
+
+
+def test_async_steps(pytester):
+    """Test that the async steps of a scenario run on the same event loop."""
+    pytester.makefile(
+        ".feature",
+        async_steps=textwrap.dedent(
+            """\
+            Feature: Async steps
+                Scenario: Eating cucumbers
+                    Given there are 12 cucumbers
+                    When I eat 5 cucumbers
+                    Then I should have 7 cucumbers
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import asyncio
+
+            from pytest_bdd import given, parsers, scenarios, then, when
+
+            scenarios("async_steps.feature")
+
+
+            @given(parsers.parse("there are {start:d} cucumbers"), target_fixture="cucumbers")
+            async def _(start):
+                await asyncio.sleep(0)
+                return {"start": start, "loop": asyncio.get_running_loop()}
+
+
+            @when(parsers.parse("I eat {eat:d} cucumbers"))
+            async def _(cucumbers, eat):
+                await asyncio.sleep(0)
+                assert asyncio.get_running_loop() is cucumbers["loop"]
+                cucumbers["eat"] = eat
+
+
+            @then(parsers.parse("I should have {left:d} cucumbers"))
+            def _(cucumbers, left):
+                assert cucumbers["start"] - cucumbers["eat"] == left
+                assert cucumbers["loop"].is_closed() is False
+            """
+        )
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_async_generator_steps(pytester):
+    """Test that the async generator steps are torn down on the event loop of the scenario."""
+    pytester.makefile(
+        ".feature",
+        async_steps=textwrap.dedent(
+            """\
+            Feature: Async steps
+                Scenario: Connection
+                    Given I have a connection
+                    Then the connection is open
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import asyncio
+
+            from pytest_bdd import given, scenarios, then
+            from pytest_bdd.utils import dump_obj
+
+            scenarios("async_steps.feature")
+
+
+            @given("I have a connection", target_fixture="connection")
+            async def _():
+                connection = {"open": True, "loop": asyncio.get_running_loop()}
+                yield connection
+                assert asyncio.get_running_loop() is connection["loop"]
+                connection["open"] = False
+                dump_obj("closed")
+
+
+            @then("the connection is open")
+            def _(connection):
+                assert connection["open"]
+                dump_obj("checked")
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=1)
+    assert collect_dumped_objects(result) == ["checked", "closed"]
+
+
+def test_async_step_failure(pytester):
+    """Test that an async step failure is reported like any step failure."""
+    pytester.makefile(
+        ".feature",
+        async_steps=textwrap.dedent(
+            """\
+            Feature: Async steps
+                Scenario: Failing
+                    Given I fail
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_bdd_step_error(step, exception):
+                dump_obj((step.name, str(exception)))
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("async_steps.feature")
+
+
+            @given("I fail")
+            async def _():
+                raise ValueError("async failure")
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(failed=1)
+    assert collect_dumped_objects(result) == [("I fail", "async failure")]
+
+
+def test_event_loop_factory(pytester):
+    """Test that the event loop is created by the configured factory, once per scenario with async steps."""
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_event_loop_factory = loop_factory:new_event_loop
+        """
+    )
+    pytester.makepyfile(
+        loop_factory=textwrap.dedent(
+            """\
+            import asyncio
+
+            from pytest_bdd.utils import dump_obj
+
+
+            def new_event_loop():
+                dump_obj("new loop")
+                return asyncio.new_event_loop()
+            """
+        )
+    )
+    pytester.makefile(
+        ".feature",
+        async_steps=textwrap.dedent(
+            """\
+            Feature: Async steps
+                Scenario: Async
+                    Given an async step
+                    And an async step
+
+                Scenario: Sync
+                    Given a sync step
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("async_steps.feature")
+
+
+            @given("an async step")
+            async def _():
+                pass
+
+
+            @given("a sync step")
+            def _():
+                pass
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=2)
+    assert collect_dumped_objects(result) == ["new loop"]
+
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_event_loop_factory = loop_factory:missing
+        """
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*bdd_event_loop_factory: cannot import 'loop_factory:missing'*"])
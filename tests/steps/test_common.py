@@ -8,6 +8,7 @@ from unittest import mock
 import pytest
 
 from pytest_bdd import given, parsers, then, when
+from pytest_bdd.steps import StepFunctionContext
 from pytest_bdd.utils import collect_dumped_objects
 
 
@@ -21,15 +22,17 @@ def test_given_when_then_delegate_to_step(step_fn: Callable[..., Any], step_type
     with mock.patch("pytest_bdd.steps.step", autospec=True) as step_mock:
         step_fn("foo")
 
-    step_mock.assert_called_once_with("foo", type_=step_type, converters=None, target_fixture=None, stacklevel=1)
+    step_mock.assert_called_once_with(
+        "foo", type_=step_type, converters=None, target_fixture=None, stacklevel=1, independent=False
+    )
 
     # Advanced usage: step parser, converters, target_fixture, ...
     with mock.patch("pytest_bdd.steps.step", autospec=True) as step_mock:
         parser = parsers.re(r"foo (?P<n>\d+)")
-        step_fn(parser, converters={"n": int}, target_fixture="foo_n", stacklevel=3)
+        step_fn(parser, converters={"n": int}, target_fixture="foo_n", stacklevel=3, independent=True)
 
     step_mock.assert_called_once_with(
-        name=parser, type_=step_type, converters={"n": int}, target_fixture="foo_n", stacklevel=3
+        name=parser, type_=step_type, converters={"n": int}, target_fixture="foo_n", stacklevel=3, independent=True
     )
 
 
@@ -361,3 +364,71 @@ def test_step_catches_all(pytester):
 
     objects = collect_dumped_objects(result)
     assert objects == ["foo", ("foo parametrized", 1), "foo", ("foo parametrized", 2), "foo", ("foo parametrized", 3)]
+
+
+def test_exact_and_pattern_step_definitions_respect_scoping(pytester):
+    """Test that exact string and pattern step definitions follow the same scoping rules."""
+    pytester.makefile(
+        ".feature",
+        scoping=textwrap.dedent(
+            """\
+            Feature: A feature
+                Scenario: A scenario
+                    Given there is a foo
+                    And there is a bar
+                    And there is a baz
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import given, parsers
+        from pytest_bdd.utils import dump_obj
+
+        @given("there is a foo")
+        def _():
+            dump_obj(("conftest", "foo"))
+
+        @given(parsers.parse("there is a {name}"))
+        def _(name):
+            dump_obj(("conftest", name))
+        """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import given, scenarios, parsers
+        from pytest_bdd.utils import dump_obj
+
+        scenarios("scoping.feature")
+
+        @given(parsers.re("there is a (?P<name>foo)"))
+        def _(name):
+            dump_obj(("module", name))
+
+        @given("there is a bar")
+        def _():
+            dump_obj(("module", "bar"))
+        """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=1)
+
+    assert collect_dumped_objects(result) == [("module", "foo"), ("module", "bar"), ("conftest", "baz")]
+
+
+def test_step_call_plan() -> None:
+    """Test that the call plan of a step function is computed once from its signature."""
+
+    def step_func(request: Any, count: int, datatable: list[list[str]], extra: str = "") -> None:
+        pass
+
+    context = StepFunctionContext(type="given", step_func=step_func, parser=parsers.string("I have a bar"))
+    call_plan = context.call_plan
+
+    assert call_plan.parameters == {"request", "count", "datatable", "extra"}
+    assert call_plan.required_args == ("request", "count", "datatable")
+    assert context.call_plan is call_plan
@@ -0,0 +1,251 @@
+"""Independent step definitions tests."""
+
+from __future__ import annotations
+
+import textwrap
+
+from pytest_bdd.reporting import test_report_context_registry
+from pytest_bdd.utils import collect_dumped_objects
+
+FEATURE = """\
+Feature: Independent steps
+    Scenario: Provisioning
+        Given I have a user
+        And I have a bucket
+        And I have a cache
+        Then everything is provisioned
+"""
+
+
+def test_independent_steps(pytester):
+    """Test that the consecutive independent steps run concurrently, and their target fixtures are all injected."""
+    pytester.makefile(".feature", independent=FEATURE)
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import threading
+            import time
+
+            from pytest_bdd import given, scenarios, then
+            from pytest_bdd.utils import dump_obj
+
+            scenarios("independent.feature")
+
+            # Each step waits for the others: the steps would time out if they were run one after the other
+            barrier = threading.Barrier(3, timeout=10)
+
+
+            @given("I have a user", target_fixture="user", independent=True)
+            def _():
+                barrier.wait()
+                time.sleep(0.1)
+                return "user"
+
+
+            @given("I have a bucket", target_fixture="bucket", independent=True)
+            def _():
+                barrier.wait()
+                time.sleep(0.1)
+                yield "bucket"
+                dump_obj("bucket deleted")
+
+
+            @given("I have a cache", target_fixture="cache", independent=True)
+            def _():
+                barrier.wait()
+                time.sleep(0.1)
+                yield "cache"
+                dump_obj("cache cleared")
+
+
+            @then("everything is provisioned")
+            def _(user, bucket, cache):
+                assert (user, bucket, cache) == ("user", "bucket", "cache")
+            """
+        )
+    )
+    result = pytester.inline_run("-s")
+    result.assertoutcome(passed=1)
+
+    report = result.matchreport("test_provisioning", when="call")
+    steps = test_report_context_registry[report].scenario["steps"]
+    assert [step["failed"] for step in steps] == [False, False, False, False]
+    # Each independent step is reported with the time taken by its own step function
+    assert all(step["duration"] >= 0.1 for step in steps[:3])
+
+    # The generator steps are torn down in the reverse order of the steps
+    result = pytester.runpytest("-s")
+    assert collect_dumped_objects(result) == ["cache cleared", "bucket deleted"]
+
+
+def test_independent_steps_failure(pytester):
+    """Test that each independent step is reported as passed or failed, in the order of the steps."""
+    pytester.makefile(".feature", independent=FEATURE)
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_bdd_after_step(step):
+                dump_obj(("passed", step.name))
+
+
+            def pytest_bdd_step_error(step, exception):
+                dump_obj(("failed", step.name, str(exception)))
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import time
+
+            from pytest_bdd import given, scenarios, then
+
+            scenarios("independent.feature")
+
+
+            @given("I have a user", independent=True)
+            def _():
+                time.sleep(0.05)
+
+
+            @given("I have a bucket", independent=True)
+            def _():
+                raise ValueError("no bucket")
+
+
+            @given("I have a cache", independent=True)
+            def _():
+                pass
+
+
+            @then("everything is provisioned")
+            def _():
+                raise AssertionError("not run")
+            """
+        )
+    )
+    result = pytester.inline_run("-s")
+    result.assertoutcome(failed=1)
+
+    report = result.matchreport("test_provisioning", when="call")
+    assert report.longrepr.reprcrash.message == "ValueError: no bucket"
+    steps = test_report_context_registry[report].scenario["steps"]
+    assert [step["failed"] for step in steps] == [False, True, False, True]
+
+    result = pytester.runpytest("-s")
+    assert collect_dumped_objects(result) == [
+        ("passed", "I have a user"),
+        ("failed", "I have a bucket", "no bucket"),
+        ("passed", "I have a cache"),
+    ]
+
+
+def test_independent_steps_fixture_error(pytester):
+    """Test that the steps started before a step whose fixtures fail are reported, and the others are not run."""
+    pytester.makefile(".feature", independent=FEATURE)
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_bdd_after_step(step):
+                dump_obj(("passed", step.name))
+
+
+            def pytest_bdd_step_error(step, exception):
+                dump_obj(("failed", step.name, str(exception)))
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import pytest
+
+            from pytest_bdd import given, scenarios, then
+            from pytest_bdd.utils import dump_obj
+
+            scenarios("independent.feature")
+
+
+            @pytest.fixture
+            def credentials():
+                raise RuntimeError("no credentials")
+
+
+            @given("I have a user", independent=True)
+            def _():
+                pass
+
+
+            @given("I have a bucket", independent=True)
+            def _(credentials):
+                pass
+
+
+            @given("I have a cache", independent=True)
+            def _():
+                dump_obj("not run")
+
+
+            @then("everything is provisioned")
+            def _():
+                pass
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*RuntimeError: no credentials*"])
+    assert collect_dumped_objects(result) == [
+        ("passed", "I have a user"),
+        ("failed", "I have a bucket", "no credentials"),
+    ]
+
+
+def test_independent_steps_generator_errors(pytester):
+    """Test that the independent generator steps must yield exactly once, like the other generator steps."""
+    pytester.makefile(".feature", independent=FEATURE)
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios, then
+
+            scenarios("independent.feature")
+
+
+            @given("I have a user", independent=True)
+            def _():
+                yield
+                yield
+
+
+            @given("I have a bucket", independent=True)
+            def provide_bucket():
+                return
+                yield
+
+
+            @given("I have a cache", independent=True)
+            def _():
+                pass
+
+
+            @then("everything is provisioned")
+            def _():
+                pass
+            """
+        )
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(failed=1, errors=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*step function has more than one 'yield':*",
+            "*ValueError: provide_bucket did not yield a value*",
+        ]
+    )
@@ -0,0 +1,267 @@
+"""Tests for the step definition index."""
+
+from __future__ import annotations
+
+import gc
+import re
+import textwrap
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+import parse
+import pytest
+
+from pytest_bdd import parsers, step_index
+from pytest_bdd.parser import Step
+from pytest_bdd.scenario import StepFixtureDefRegistry, get_fixturedefs_for_step, step_fixturedefs_cache_registry
+from pytest_bdd.step_index import (
+    CombinedRegexMatcher,
+    LiteralAnchors,
+    LiteralPrefixTrie,
+    StepDefinitionIndex,
+    embed_pattern,
+    get_literal_anchors,
+)
+from pytest_bdd.steps import StepFunctionContext, step_function_context_registry
+
+REGEXES = [
+    re.compile(r"foo (?P<n>\d+)"),
+    re.compile(r"foo (?P<n>\w+)"),
+    re.compile(r"(?i)FOO 1"),
+    re.compile(r"FOO 1", re.IGNORECASE),
+    re.compile(r"(foo) \1"),
+    re.compile(r"foo .*  # comment", re.VERBOSE),
+    re.compile(r"bar"),
+    re.compile(r"(?P<n>foo) (?P=n)"),
+]
+
+
+@pytest.mark.parametrize(
+    ["regex", "embeddable"],
+    [
+        (re.compile(r"foo (?P<n>\d+)"), True),
+        (re.compile(r"foo", re.IGNORECASE | re.DOTALL), True),
+        (re.compile(r"foo  # comment", re.VERBOSE), True),
+        (re.compile(r"(?P<n>foo) (?P=n)"), False),
+        (re.compile(r"[(?P<n>]foo"), False),
+        (re.compile(r"(?i)foo"), False),
+        (re.compile(r"(foo) \1"), False),
+        (re.compile(r"(foo)?(?(1)bar|baz)"), False),
+    ],
+)
+def test_embed_pattern(regex: re.Pattern[str], embeddable: bool) -> None:
+    """Test that only the patterns keeping their meaning inside an alternation are embedded."""
+    embedded = embed_pattern(regex)
+    assert (embedded is not None) is embeddable
+    if embedded is not None:
+        assert re.compile(embedded).groups == regex.groups
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+@pytest.mark.parametrize("name", ["foo 1", "foo bar", "FOO 1", "foo foo", "bar", "baz", ""])
+def test_combined_regex_matcher(chunk_size: int, name: str) -> None:
+    """Test that the combined matcher finds the same regexes as matching them one by one, in the same order."""
+    matcher = CombinedRegexMatcher(REGEXES, chunk_size=chunk_size)
+
+    expected = [position for position, regex in enumerate(REGEXES) if regex.fullmatch(name)]
+    assert list(matcher.iter_matching(name)) == expected
+
+
+FORMATS = [
+    "there is a {name} with {n:d} items",
+    "There is a {name}",
+    "{name} is there",
+    "{name}",
+    "I have {{literal}} braces",
+    "the café is {state}",
+    "there is nothing",
+]
+
+
+@pytest.mark.parametrize(
+    ["format_", "anchors"],
+    [
+        ("there is a {name} with {n:d} items", LiteralAnchors("there is a ", (" with ",), " items")),
+        ("{name} Is There", LiteralAnchors("", (), " is there")),
+        ("I have {{literal}} {n} braces", LiteralAnchors("i have {literal} ", (), " braces")),
+        ("{a}-{b}", LiteralAnchors("", ("-",), "")),
+        ("the café is {state}", None),
+    ],
+)
+def test_get_literal_anchors(format_: str, anchors: LiteralAnchors | None) -> None:
+    """Test the extraction of the literal anchors of a parse format."""
+    assert get_literal_anchors(format_) == anchors
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "there is a foo with 3 items",
+        "THERE IS A foo",
+        "foo is there",
+        "I have {literal} braces",
+        "the café is open",
+        "there is nothing",
+        "there is a",
+        "",
+    ],
+)
+def test_literal_prefix_trie(name: str) -> None:
+    """Test that the trie never prunes a format that matches."""
+    trie: LiteralPrefixTrie[str] = LiteralPrefixTrie()
+    for format_ in FORMATS:
+        trie.add(format_, get_literal_anchors(format_))
+
+    candidates = list(trie.iter_candidates(name))
+    assert len(candidates) == len(set(candidates))
+    assert {format_ for format_ in FORMATS if parse.parse(format_, name)} <= set(candidates)
+
+
+def test_literal_prefix_trie_prunes() -> None:
+    """Test that the formats whose literal text doesn't appear in the name are pruned."""
+    trie: LiteralPrefixTrie[str] = LiteralPrefixTrie()
+    for format_ in FORMATS:
+        trie.add(format_, get_literal_anchors(format_))
+
+    assert set(trie.iter_candidates("foo is there")) == {"{name} is there", "{name}", "the café is {state}"}
+
+
+def test_parse_stats() -> None:
+    """Test that the pruning statistics only count the step definitions of the step type."""
+
+    def given_user() -> None: ...
+
+    def given_items() -> None: ...
+
+    def then_items() -> None: ...
+
+    def any_items() -> None: ...
+
+    index = StepDefinitionIndex()
+    for type_, format_, func in [
+        ("given", "user {name}", given_user),
+        ("given", "{n:d} items", given_items),
+        ("then", "{n:d} items", then_items),
+        (None, "{n:d} items left", any_items),
+    ]:
+        index.add(func, StepFunctionContext(type=type_, step_func=func, parser=parsers.parse(format_)))
+
+    found = index.find(Step(name="3 items", type="given", indent=0, line_number=1, keyword="Given"))
+    assert list(found) == [given_items]
+    # The "then" definition is not a definition of a "given" step
+    assert (index.parse_stats.lookups, index.parse_stats.definitions, index.parse_stats.candidates) == (1, 3, 1)
+    assert index.parse_stats.pruning_ratio == pytest.approx(2 / 3)
+
+
+def test_found_steps_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the index only memoizes the matching step definitions of the most recently found steps."""
+    monkeypatch.setattr(step_index, "FOUND_STEPS_CACHE_SIZE", 2)
+
+    def given_items() -> None: ...
+
+    index = StepDefinitionIndex()
+    index.add(
+        given_items, StepFunctionContext(type="given", step_func=given_items, parser=parsers.parse("{n:d} items"))
+    )
+    steps = [Step(name=f"{n} items", type="given", indent=0, line_number=1, keyword="Given") for n in range(3)]
+
+    found = index.find(steps[0])
+    index.find(steps[1])
+    assert index.find(steps[0]) is found
+    # The least recently found step is dropped
+    index.find(steps[2])
+    assert index.find(steps[0]) is found
+    assert index.parse_stats.lookups == 3
+    assert list(index.find(steps[1])) == [given_items]
+    assert index.parse_stats.lookups == 4
+
+
+def test_step_fixturedef_registry() -> None:
+    """Test that the registry only tracks step definition fixtures, ranked like the fixture table."""
+
+    def step_a() -> None: ...
+
+    def step_b() -> None: ...
+
+    def other() -> None: ...
+
+    def not_a_step() -> None: ...
+
+    for step_func in (step_a, step_b):
+        step_function_context_registry[step_func] = StepFunctionContext(
+            type="given", step_func=step_func, parser=parsers.string(step_func.__name__)
+        )
+
+    class FixtureDef:
+        def __init__(self, argname: str, func: Callable[[], None]) -> None:
+            self.argname = argname
+            self.func = func
+
+    fixturedef: Any = FixtureDef
+
+    a_in_conftest = fixturedef("pytestbdd_stepdef_given_a", step_a)
+    b_in_conftest = fixturedef("pytestbdd_stepdef_given_b", step_b)
+    arg2fixturedefs: dict[str, list[Any]] = {
+        "pytestbdd_stepdef_given_b": [b_in_conftest],
+        "some_fixture": [fixturedef("some_fixture", other)],
+        "pytestbdd_stepdef_given_a": [a_in_conftest],
+        # A fixture named like a step definition fixture is not a step definition
+        "pytestbdd_stepdef_given_fixture": [fixturedef("pytestbdd_stepdef_given_fixture", not_a_step)],
+    }
+    registry = StepFixtureDefRegistry(arg2fixturedefs)
+    registry.sync()
+    assert registry.version == 2
+    assert registry.get(other) == []
+    assert registry.get(not_a_step) == []
+
+    # A new definition for an existing fixture name keeps the rank of the name
+    a_in_module = fixturedef("pytestbdd_stepdef_given_a", step_a)
+    arg2fixturedefs["pytestbdd_stepdef_given_a"].append(a_in_module)
+    registry.sync("pytestbdd_stepdef_given_a")
+    registry.sync("some_fixture")
+    assert registry.version == 3
+
+    entries = sorted(registry.get(step_a) + registry.get(step_b), key=lambda entry: entry[0])
+    assert [fixturedef for _, fixturedef in entries] == [b_in_conftest, a_in_conftest, a_in_module]
+
+
+def test_step_fixturedef_registry_unconfigure(pytester) -> None:
+    """Test that the fixture manager is restored at the end of the run."""
+    pytester.makefile(".feature", steps="Feature: Steps\n    Scenario: Step\n        Given I have a bar\n")
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("steps.feature")
+
+
+            @given("I have a bar")
+            def _():
+                pass
+            """
+        )
+    )
+    result = pytester.inline_run()
+    result.assertoutcome(passed=1)
+
+    [call] = result.getcalls("pytest_unconfigure")
+    fixturemanager = call.config.pluginmanager.get_plugin("funcmanage")
+    assert "_register_fixture" not in vars(fixturemanager)
+    assert "parsefactories" not in vars(fixturemanager)
+
+
+def test_step_fixturedefs_cache_is_dropped_with_node(pytester) -> None:
+    """Test that the memoized fixture definitions of a step don't keep their collector alive."""
+    module = pytester.getmodulecol("def test_nothing():\n    pass\n")
+    fixturemanager = module.session._fixturemanager
+    step = Step(name="I have a bar", type="given", indent=0, line_number=1, keyword="Given")
+
+    assert get_fixturedefs_for_step(step, fixturemanager, module) == []
+    assert list(step_fixturedefs_cache_registry[module]) == [("given", "I have a bar")]
+
+    module_ref = weakref.ref(module)
+    del module
+    gc.collect()
+    assert module_ref() is None
@@ -155,3 +155,90 @@ def test_pytest_unconfigure_without_configure(pytester):
 
     result = pytester.runpytest()
     assert result.ret == 0
+
+
+def test_bdd_hooks_implemented_by_plugins_registered_later(pytester):
+    """Test that the pytest-bdd hooks are called once a plugin implementing them is registered."""
+    pytester.makefile(
+        ".feature",
+        foo=textwrap.dedent(
+            """\
+            Feature: A feature
+                Scenario: A scenario
+                    Given foo
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given
+
+
+            @given("foo")
+            def _():
+                pass
+            """
+        )
+    )
+    pytester.makepyfile(
+        test_a="""
+        from pytest_bdd import scenarios
+
+        scenarios("foo.feature")
+        """,
+        test_b="""
+        from pytest_bdd.utils import dump_obj
+
+
+        class Plugin:
+            def pytest_bdd_before_step_call(self, step, step_func_args):
+                dump_obj(("before_step_call", step.name))
+
+
+        def test_register_plugin(request):
+            request.config.pluginmanager.register(Plugin())
+        """,
+        test_c="""
+        from pytest_bdd import scenarios
+
+        scenarios("foo.feature")
+        """,
+    )
+
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=3)
+    assert collect_dumped_objects(result) == [("before_step_call", "foo")]
+
+
+def test_bdd_hooks_are_monitored(pytester):
+    """Test that the pytest-bdd hook calls go through pluggy when the hook calls are monitored."""
+    pytester.makefile(
+        ".feature",
+        foo=textwrap.dedent(
+            """\
+            Feature: A feature
+                Scenario: A scenario
+                    Given foo
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("foo.feature")
+
+
+            @given("foo")
+            def _():
+                pass
+            """
+        )
+    )
+
+    # `inline_run` records the hook calls with a hook call monitoring
+    result = pytester.inline_run()
+    result.assertoutcome(passed=1)
+    assert [call.step.name for call in result.getcalls("pytest_bdd_after_step")] == ["foo"]